@@ -1,816 +1,1083 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { supabase } from '@/lib/supabase'
-import { hashPassword, verifyPassword, generateToken, requireAuth } from '@/lib/auth'
+import { hashPassword, verifyPassword, needsRehash, generateToken, requireAuth } from '@/lib/auth'
+import { PasswordPoolBusyError } from '@/lib/password-pool'
+import { getBoundary, parseMultipart, MultipartError } from '@/lib/multipart'
+import { isResizableImage, derivativesEnabled, createDerivatives } from '@/lib/images'
+import {
+  RESUMABLE_CHUNK_BYTES,
+  RESUMABLE_MAX_BYTES,
+  ResumableUploadError,
+  createResumableUpload,
+  getResumableUpload,
+  appendResumableChunk
+} from '@/lib/resumable-upload'
+import { parsePageParams, applyKeyset, toPage } from '@/lib/pagination'
+import { TtlCache } from '@/lib/cache'
+import { railwayCache, railwayQuery, railwayLogStream } from '@/lib/railway'
+import { BULK_TABLES, parseBulkItems, bulkCreate, bulkUpdate, bulkDelete } from '@/lib/bulk'
+import { EXPORTS, EXPORT_FORMATS, parseExportColumns, createExportStream } from '@/lib/export'
+import { collectionVersion, isNotModified, notModified, compressedJson } from '@/lib/conditional'
+import { LIST_QUERIES, parseListQuery, applyListQuery, listClockColumns } from '@/lib/search'
+import { route, createRouter } from '@/lib/router'
+import { LiveCounts, liveCountsStream } from '@/lib/live-counts'
+import { ROLLUPS_MISSING_CODES, ROLLUPS_MISSING_MESSAGE, parseSeriesRange, fetchSeries } from '@/lib/rollups'
+import { parseBootstrapQuery, pickFields } from '@/lib/bootstrap'
 import { v4 as uuidv4 } from 'uuid'
 
-// Initialize superadmin table and default admin user
-async function initializeSupabase() {
-  try {
-    // Check if default admin exists
-    const { data: admins, error } = await supabase.from('superadmin').select('*').limit(1)
-    
+// Maximum seller IDs per `in` filter, keeps the PostgREST query string well under URL limits
+const SELLER_LOOKUP_BATCH_SIZE = 200
+
+// Seller details by id in bulk lookups instead of one query per id. Sellers that could not be
+// loaded are left out, as missing sellers are.
+async function fetchSellersById(sellerIds, columns) {
+  const sellersById = new Map()
+
+  const batches = []
+  for (let i = 0; i < sellerIds.length; i += SELLER_LOOKUP_BATCH_SIZE) {
+    batches.push(sellerIds.slice(i, i + SELLER_LOOKUP_BATCH_SIZE))
+  }
+
+  const results = await Promise.all(
+    batches.map(ids => supabase.from('sellers').select(`id, ${columns}`).in('id', ids))
+  )
+
+  for (const { data: sellers, error } of results) {
     if (error) {
-      console.log('Superadmin table might not exist:', error.message)
-      console.log('Please create the superadmin table in Supabase with the following schema:')
-      console.log(`
-        CREATE TABLE superadmin (
-          id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-          username VARCHAR(255) UNIQUE NOT NULL,
-          email VARCHAR(255) UNIQUE NOT NULL,
-          password VARCHAR(255) NOT NULL,
-          role VARCHAR(50) DEFAULT 'admin',
-          created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-          updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-        );
-      `)
-      return
+      console.error('Seller lookup error:', error)
+      continue
     }
-    
-    if (!admins || admins.length === 0) {
-      // Create default admin
-      const hashedPass = await hashPassword('admin123')
-      const { error: insertError } = await supabase.from('superadmin').insert({
-        id: uuidv4(),
-        username: 'admin',
-        email: 'admin@example.com',
-        password: hashedPass,
-        role: 'superadmin'
-      })
-      
-      if (insertError) {
-        console.log('Error creating default admin:', insertError)
-      } else {
-        console.log('Default admin created successfully')
-      }
+    for (const { id, ...seller } of sellers || []) {
+      sellersById.set(id, seller)
     }
-  } catch (error) {
-    console.log('Initialization error:', error)
   }
+
+  return sellersById
 }
 
-// Initialize on first load
-initializeSupabase()
+const sellerIdsOf = (rows) => [...new Set(rows.map(row => row.seller_id).filter(Boolean))]
 
-export async function GET(request, { params }) {
-  const url = new URL(request.url)
-  const path = params?.path || []
-  const pathname = path.join('/')
+// Attach seller details to each row; rows whose seller could not be loaded get `sellers: null`
+async function attachSellers(rows, columns) {
+  const sellersById = await fetchSellersById(sellerIdsOf(rows), columns)
 
-  try {
-    // Auth routes
-    if (pathname === 'auth/me') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-      }
-      return NextResponse.json({ user: authResult.user })
-    }
+  return rows.map(row => ({
+    ...row,
+    sellers: sellersById.get(row.seller_id) || null
+  }))
+}
 
-    // Sellers routes
-    if (pathname === 'sellers') {
-      const { data, error } = await supabase.from('sellers').select('*').order('created_at', { ascending: false })
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
-    }
+// Dashboard counts for /api/stats and /api/analytics. Cleared by every seller, category
+// and event write so counts are never stale on this instance.
+const countsCache = new TtlCache({
+  ttlMs: Number(process.env.DASHBOARD_CACHE_TTL_MS) || 30000,
+  maxEntries: Number(process.env.DASHBOARD_CACHE_MAX_ENTRIES) || 100
+})
 
-    if (pathname.startsWith('sellers/') && path.length === 2) {
-      const sellerId = path[1]
-      const { data, error } = await supabase.from('sellers').select('*').eq('id', sellerId).single()
-      if (error) return NextResponse.json({ error: error.message }, { status: 404 })
-      return NextResponse.json(data)
-    }
+// Largest file accepted by the multipart upload; bigger media goes through upload/resumable
+const UPLOAD_MAX_BYTES = Number(process.env.UPLOAD_MAX_BYTES) || 20 * 1024 * 1024
+// Allowance for boundaries, part headers and form fields on top of the file itself
+const MULTIPART_OVERHEAD_BYTES = 64 * 1024
 
-    // Categories routes
-    if (pathname === 'categories') {
-      const { data, error } = await supabase.from('categories').select('*').order('created_at', { ascending: false })
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
-    }
+const storageObjectPath = (folder, name) => {
+  return `${folder}/${Date.now()}-${name.replace(/[^a-zA-Z0-9.-]/g, '_')}`
+}
 
-    if (pathname.startsWith('categories/') && path.length === 2) {
-      const categoryId = path[1]
-      const { data, error } = await supabase.from('categories').select('*').eq('id', categoryId).single()
-      if (error) return NextResponse.json({ error: error.message }, { status: 404 })
-      return NextResponse.json(data)
-    }
+// Upload a multipart file part to Supabase Storage. `body` is the part's stream or, when it
+// arrived before the form fields, its buffered bytes.
+async function uploadToStorage(fields, file, body) {
+  const bucket = fields.bucket || 'uploads'
+  const filePath = storageObjectPath(fields.folder || 'files', file.filename)
+
+  const { error } = await supabase.storage
+    .from(bucket)
+    .upload(filePath, body, {
+      contentType: file.contentType,
+      upsert: false,
+      duplex: 'half'
+    })
+  if (error) return { error }
+
+  const { data: publicData } = supabase.storage.from(bucket).getPublicUrl(filePath)
+  return { bucket, url: publicData.publicUrl, path: filePath }
+}
 
-    // Events routes
-    if (pathname === 'events') {
-      const { data, error } = await supabase.from('events').select('*').order('created_at', { ascending: false })
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
-    }
+const cachedJson = ({ value, hit, stale }) => {
+  const cacheStatus = stale ? 'STALE' : hit ? 'HIT' : 'MISS'
+  return NextResponse.json(value, { headers: { 'X-Cache': cacheStatus } })
+}
 
-    if (pathname.startsWith('events/') && path.length === 2) {
-      const eventId = path[1]
-      const { data, error } = await supabase.from('events').select('*').eq('id', eventId).single()
-      if (error) return NextResponse.json({ error: error.message }, { status: 404 })
-      return NextResponse.json(data)
-    }
+async function fetchStats() {
+  const [sellersCount, categoriesCount, eventsCount] = await Promise.all([
+    supabase.from('sellers').select('*', { count: 'exact', head: true }),
+    supabase.from('categories').select('*', { count: 'exact', head: true }),
+    supabase.from('events').select('*', { count: 'exact', head: true })
+  ])
+
+  return {
+    sellers: sellersCount.count || 0,
+    categories: categoriesCount.count || 0,
+    events: eventsCount.count || 0
+  }
+}
 
-    // Admin users routes
-    if (pathname === 'admins') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
+// Total of completed orders for the fallback below. Supabase returns at most max_rows rows per
+// request, so the orders are read a page at a time until a page comes back empty.
+async function sumCompletedRevenue() {
+  let revenue = 0
+  let offset = 0
+  while (true) {
+    const { data, error } = await supabase
+      .from('orders')
+      .select('total_price')
+      .eq('status', 'diterima')
+      .order('id')
+      .range(offset, offset + 999)
+    if (error) throw error
+    if (!data.length) return revenue
+    revenue += data.reduce((sum, order) => sum + parseFloat(order.total_price || 0), 0)
+    offset += data.length
+  }
+}
+
+// Set once the admin_analytics_summary() function turns out to be missing
+let analyticsRpcMissing = false
+
+// Lifetime dashboard totals. Uses the admin_analytics_summary() aggregate from
+// setup-analytics.sql when it is installed, otherwise individual count queries.
+async function fetchAnalytics() {
+  if (!analyticsRpcMissing) {
+    const { data, error } = await supabase.rpc('admin_analytics_summary')
+    if (!error) {
+      return {
+        sellers: Number(data.sellers) || 0,
+        categories: Number(data.categories) || 0,
+        events: Number(data.events) || 0,
+        users: Number(data.users) || 0,
+        products: Number(data.products) || 0,
+        variants: Number(data.variants) || 0,
+        orders: Number(data.orders) || 0,
+        revenue: Number(data.revenue) || 0
       }
-      
-      const { data, error } = await supabase
-        .from('superadmin')
-        .select('id, username, email, role, created_at, updated_at')
-        .order('created_at', { ascending: false })
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
     }
 
-    // Setup endpoint - provides instructions for manual setup
-    if (pathname === 'setup') {
-      return NextResponse.json({ 
-        message: 'Manual setup required',
-        instructions: [
-          '1. Go to your Supabase dashboard',
-          '2. Navigate to SQL Editor',
-          '3. Run the following SQL commands:',
-          '',
-          'CREATE TABLE IF NOT EXISTS superadmin (',
-          '  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),',
-          '  username VARCHAR(255) UNIQUE NOT NULL,',
-          '  email VARCHAR(255) UNIQUE NOT NULL,',
-          '  password VARCHAR(255) NOT NULL,',
-          '  role VARCHAR(50) DEFAULT \'admin\',',
-          '  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),',
-          '  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()',
-          ');',
-          '',
-          '-- Insert default admin (password: admin123)',
-          'INSERT INTO superadmin (username, email, password, role) VALUES (',
-          '  \'admin\',',
-          '  \'admin@example.com\',',
-          '  \'$2a$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj3bp.Gm.F5W\',',
-          '  \'superadmin\'',
-          ') ON CONFLICT (username) DO NOTHING;',
-          '',
-          '4. After running the SQL, you can login with:',
-          '   Username: admin',
-          '   Password: admin123'
-        ],
-        sqlFile: 'A complete SQL file is available at /app/setup-superadmin.sql'
-      })
-    }
+    // PGRST202 / 42883: function not found - run setup-analytics.sql to enable it
+    if (error.code !== 'PGRST202' && error.code !== '42883') throw error
+    console.log('admin_analytics_summary() not installed, falling back to count queries')
+    analyticsRpcMissing = true
+  }
 
-    // Stats/Analytics
-    if (pathname === 'stats') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-      }
+  const [
+    sellersCount, categoriesCount, eventsCount, usersCount,
+    productsCount, variantsCount, ordersCount, totalRevenue
+  ] = await Promise.all([
+    supabase.from('sellers').select('*', { count: 'exact', head: true }),
+    supabase.from('categories').select('*', { count: 'exact', head: true }),
+    supabase.from('events').select('*', { count: 'exact', head: true }),
+    supabase.from('users').select('*', { count: 'exact', head: true }),
+    supabase.from('products').select('*', { count: 'exact', head: true }),
+    supabase.from('product_variants').select('*', { count: 'exact', head: true }),
+    supabase.from('orders').select('*', { count: 'exact', head: true }),
+    sumCompletedRevenue()
+  ])
+
+  return {
+    sellers: sellersCount.count || 0,
+    categories: categoriesCount.count || 0,
+    events: eventsCount.count || 0,
+    users: usersCount.count || 0,
+    products: productsCount.count || 0,
+    variants: variantsCount.count || 0,
+    orders: ordersCount.count || 0,
+    revenue: totalRevenue
+  }
+}
 
-      const [sellersCount, categoriesCount, eventsCount] = await Promise.all([
-        supabase.from('sellers').select('*', { count: 'exact', head: true }),
-        supabase.from('categories').select('*', { count: 'exact', head: true }),
-        supabase.from('events').select('*', { count: 'exact', head: true })
-      ])
+// Running totals for the dashboards' live counters, loaded like /api/analytics
+const liveCounts = new LiveCounts({ load: fetchAnalytics })
 
-      return NextResponse.json({
-        sellers: sellersCount.count || 0,
-        categories: categoriesCount.count || 0,
-        events: eventsCount.count || 0
-      })
-    }
+// Every write that changes how many rows a table has: cached counts are dropped and live
+// subscribers get the new totals
+const countsChanged = (deltas) => {
+  countsCache.clear()
+  liveCounts.adjust(deltas)
+}
 
-    // Analytics data 
-    if (pathname === 'analytics') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-      }
+// Handlers take { request, url, path, params, body, user }: `params` holds the route's
+// `:name` segments, `body` is set for routes with the json body policy and `user` for
+// authenticated routes.
 
-      try {
-        const [
-          sellersCount, categoriesCount, eventsCount, usersCount,
-          productsCount, variantsCount, ordersCount, totalRevenue
-        ] = await Promise.all([
-          supabase.from('sellers').select('*', { count: 'exact', head: true }),
-          supabase.from('categories').select('*', { count: 'exact', head: true }),
-          supabase.from('events').select('*', { count: 'exact', head: true }),
-          supabase.from('users').select('*', { count: 'exact', head: true }),
-          supabase.from('products').select('*', { count: 'exact', head: true }),
-          supabase.from('product_variants').select('*', { count: 'exact', head: true }),
-          supabase.from('orders').select('*', { count: 'exact', head: true }),
-          supabase.from('orders').select('total_price').eq('status', 'diterima')
-        ])
-
-        // Calculate total revenue
-        const revenue = totalRevenue.data?.reduce((sum, order) => {
-          return sum + parseFloat(order.total_price || 0)
-        }, 0) || 0
-
-        return NextResponse.json({
-          sellers: sellersCount.count || 0,
-          categories: categoriesCount.count || 0,
-          events: eventsCount.count || 0,
-          users: usersCount.count || 0,
-          products: productsCount.count || 0,
-          variants: variantsCount.count || 0,
-          orders: ordersCount.count || 0,
-          revenue: revenue
-        })
-      } catch (error) {
-        console.error('Analytics error:', error)
-        return NextResponse.json({ error: 'Failed to fetch analytics' }, { status: 500 })
-      }
-    }
+async function getCurrentUser({ user }) {
+  return NextResponse.json({ user })
+}
 
-    // Seller deletion requests
-    if (pathname === 'seller-deletion-requests') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-      }
-      
-      // Simple query first, will enhance with relationships later
-      const { data, error } = await supabase
-        .from('seller_deletion_requests')
-        .select('*')
-        .order('created_at', { ascending: false })
-        
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      
-      // Get seller info for each request
-      const enrichedData = await Promise.all(
-        data.map(async (request) => {
-          const { data: sellerData } = await supabase
-            .from('sellers')
-            .select('name, email, store_name, business_name')
-            .eq('id', request.seller_id)
-            .single()
-          
-          return {
-            ...request,
-            sellers: sellerData
-          }
-        })
-      )
-      
-      return NextResponse.json(enrichedData)
-    }
+// The list endpoints answer If-None-Match with 304; their version is read before the rows, so
+// a write in between can only leave the ETag older than the body. Sellers and events also
+// take search, filter and sort params (lib/search.js).
+const listSearchable = (table) => async ({ request, url }) => {
+  const spec = LIST_QUERIES[table]
+  const page = parsePageParams(url.searchParams)
+  if (page.error) return NextResponse.json({ error: page.error }, { status: 400 })
+  const listQuery = parseListQuery(url.searchParams, spec)
+  if (listQuery.error) return NextResponse.json({ error: listQuery.error }, { status: 400 })
+  const filtered = applyListQuery(supabase.from(table).select('*'), listQuery, spec)
+  if (filtered.error) return NextResponse.json({ error: filtered.error }, { status: 400 })
+
+  // Time-relative filters (events by status) change rows without any write, so their tag also
+  // covers the next time the clock moves a row in or out
+  const clock = { columns: listClockColumns(listQuery, spec), now: listQuery.now }
+  const version = await collectionVersion(table, url.search, { clock })
+  if (isNotModified(request, version)) return notModified(version)
+
+  const { column, ascending, nullable } = listQuery.sort
+  const { data, error } = await applyKeyset(filtered.query, column, page, { ascending, nullable })
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  return compressedJson(request, page.paginated ? toPage(data, page, column) : data, { version })
+}
 
-    // Seller balance transactions
-    if (pathname === 'seller-balance-transactions') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-      }
-      
-      // Simple query first
-      const { data, error } = await supabase
-        .from('seller_balance_transactions')
-        .select('*')
-        .order('created_at', { ascending: false })
-        .limit(100)
-        
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      
-      // Get seller info for each transaction
-      const enrichedData = await Promise.all(
-        data.map(async (transaction) => {
-          const { data: sellerData } = await supabase
-            .from('sellers')
-            .select('name, store_name')
-            .eq('id', transaction.seller_id)
-            .single()
-          
-          return {
-            ...transaction,
-            sellers: sellerData
-          }
-        })
-      )
-      
-      return NextResponse.json(enrichedData)
-    }
+async function listCategories({ request, url }) {
+  const page = parsePageParams(url.searchParams)
+  if (page.error) return NextResponse.json({ error: page.error }, { status: 400 })
 
-    // Seller balances
-    if (pathname === 'seller-balances') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-      }
-      
-      // Simple query first
-      const { data, error } = await supabase
-        .from('seller_balances')
-        .select('*')
-        .order('updated_at', { ascending: false })
-        
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      
-      // Get seller info for each balance record
-      const enrichedData = await Promise.all(
-        data.map(async (balance) => {
-          const { data: sellerData } = await supabase
-            .from('sellers')
-            .select('name, store_name, email')
-            .eq('id', balance.seller_id)
-            .single()
-          
-          return {
-            ...balance,
-            sellers: sellerData
-          }
-        })
-      )
-      
-      return NextResponse.json(enrichedData)
-    }
+  const version = await collectionVersion('categories', url.search)
+  if (isNotModified(request, version)) return notModified(version)
 
-    // Debug Railway path
-    if (pathname.startsWith('railway/')) {
-      console.log('Railway path detected:', pathname)
-    }
+  const { data, error } = await applyKeyset(supabase.from('categories').select('*'), 'created_at', page)
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  return compressedJson(request, page.paginated ? toPage(data, page, 'created_at') : data, { version })
+}
 
-    // Railway API endpoints
-    if (pathname === 'railway/status') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-      }
+// Single-row reads and writes of sellers, categories and events. Writes clear the dashboard
+// counts.
+const getRow = (table) => async ({ params }) => {
+  const { data, error } = await supabase.from(table).select('*').eq('id', params.id).single()
+  if (error) return NextResponse.json({ error: error.message }, { status: 404 })
+  return NextResponse.json(data)
+}
 
-      try {
-        const response = await fetch(`https://backboard.railway.com/graphql/v2`, {
-          method: 'POST',
-          headers: {
-            'Authorization': `Bearer ${process.env.RAILWAY_API_TOKEN}`,
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({
-            query: `
-              query GetProject($projectId: String!) {
-                project(id: $projectId) {
-                  id
-                  name
-                  environments {
-                    nodes {
-                      id
-                      name
-                      deployments {
-                        edges {
-                          node {
-                            id
-                            status
-                            createdAt
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            `,
-            variables: { projectId: process.env.RAILWAY_PROJECT_ID }
-          })
-        })
-        const data = await response.json()
-        return NextResponse.json(data)
-      } catch (error) {
-        console.error('Railway status error:', error)
-        return NextResponse.json({ error: 'Failed to fetch Railway status' }, { status: 500 })
-      }
-    }
+const createRow = (table) => async ({ body }) => {
+  const newRow = {
+    id: uuidv4(),
+    ...body,
+    created_at: new Date().toISOString(),
+    updated_at: new Date().toISOString()
+  }
 
-    if (pathname === 'railway/metrics') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-      }
+  const { data, error } = await supabase.from(table).insert(newRow).select().single()
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  countsChanged({ [table]: 1 })
+  return NextResponse.json(data)
+}
 
-      try {
-        const response = await fetch(`https://backboard.railway.com/graphql/v2`, {
-          method: 'POST',
-          headers: {
-            'Authorization': `Bearer ${process.env.RAILWAY_API_TOKEN}`,
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({
-            query: `
-              query GetServiceMetrics($serviceId: String!) {
-                serviceInstance(serviceId: $serviceId) {
-                  id
-                  serviceName
-                  latestDeployment {
-                    id
-                    status
-                    createdAt
-                  }
-                }
-              }
-            `,
-            variables: { serviceId: process.env.RAILWAY_SERVICE_ID }
-          })
-        })
-        const data = await response.json()
-        return NextResponse.json(data)
-      } catch (error) {
-        console.error('Railway metrics error:', error)
-        return NextResponse.json({ error: 'Failed to fetch Railway metrics' }, { status: 500 })
-      }
-    }
+const updateRow = (table) => async ({ params, body }) => {
+  const updateData = {
+    ...body,
+    updated_at: new Date().toISOString()
+  }
 
-    if (pathname === 'railway/logs') {
-      const authResult = await requireAuth(request)
-      if (authResult.error) {
-        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-      }
+  const { data, error } = await supabase
+    .from(table)
+    .update(updateData)
+    .eq('id', params.id)
+    .select()
+    .single()
 
-      try {
-        const response = await fetch(`https://backboard.railway.com/graphql/v2`, {
-          method: 'POST',
-          headers: {
-            'Authorization': `Bearer ${process.env.RAILWAY_API_TOKEN}`,
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({
-            query: `
-              query GetLogs($projectId: String!, $environmentId: String!, $serviceId: String!) {
-                logs(projectId: $projectId, environmentId: $environmentId, serviceId: $serviceId, filter: {}, limit: 100) {
-                  edges {
-                    node {
-                      timestamp
-                      message
-                      severity
-                    }
-                  }
-                }
-              }
-            `,
-            variables: {
-              projectId: process.env.RAILWAY_PROJECT_ID,
-              environmentId: process.env.RAILWAY_ENVIRONMENT_ID,
-              serviceId: process.env.RAILWAY_SERVICE_ID
-            }
-          })
-        })
-        const data = await response.json()
-        return NextResponse.json(data)
-      } catch (error) {
-        console.error('Railway logs error:', error)
-        return NextResponse.json({ error: 'Failed to fetch Railway logs' }, { status: 500 })
-      }
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  countsCache.clear()
+  return NextResponse.json(data)
+}
+
+const deleteRow = (table) => async ({ params }) => {
+  const { data, error } = await supabase.from(table).delete().eq('id', params.id).select('id')
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  countsChanged({ [table]: -data.length })
+  return NextResponse.json({ success: true })
+}
+
+// Create many sellers, categories or events in one statement; ?atomic=false keeps the valid
+// items when others fail
+const bulkCreateRows = (table) => async ({ url, body }) => {
+  const { items, error } = parseBulkItems(body)
+  if (error) return NextResponse.json({ error }, { status: 400 })
+  const atomic = url.searchParams.get('atomic') !== 'false'
+  const result = await bulkCreate(table, items, { atomic })
+  if (result.body.created) countsChanged({ [table]: result.body.created })
+  return NextResponse.json(result.body, { status: result.status })
+}
+
+// Update many rows: [{ id, ...fields }]
+const bulkUpdateRows = (table) => async ({ body }) => {
+  const { items, error } = parseBulkItems(body)
+  if (error) return NextResponse.json({ error }, { status: 400 })
+  const result = await bulkUpdate(table, items)
+  if (result.body.updated) countsCache.clear()
+  return NextResponse.json(result.body, { status: result.status })
+}
+
+// Delete many rows: { ids: [...] }
+const bulkDeleteRows = (table) => async ({ body }) => {
+  const { items: ids, error } = parseBulkItems(body, 'ids')
+  if (error) return NextResponse.json({ error }, { status: 400 })
+  const result = await bulkDelete(table, ids)
+  if (result.body.deleted) countsChanged({ [table]: -result.body.deleted })
+  return NextResponse.json(result.body, { status: result.status })
+}
+
+// Admin users
+const ADMIN_COLUMNS = 'id, username, email, role, created_at, updated_at'
+
+async function listAdmins({ request }) {
+  const version = await collectionVersion('superadmin')
+  if (isNotModified(request, version)) return notModified(version)
+
+  const { data, error } = await supabase
+    .from('superadmin')
+    .select(ADMIN_COLUMNS)
+    .order('created_at', { ascending: false })
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  return compressedJson(request, data, { version })
+}
+
+async function createAdmin({ body }) {
+  const hashedPass = await hashPassword(body.password)
+  const newAdmin = {
+    id: uuidv4(),
+    username: body.username,
+    email: body.email,
+    password: hashedPass,
+    role: body.role || 'admin',
+    created_at: new Date().toISOString(),
+    updated_at: new Date().toISOString()
+  }
+
+  const { data, error } = await supabase.from('superadmin').insert(newAdmin).select(ADMIN_COLUMNS).single()
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  return NextResponse.json(data)
+}
+
+async function updateAdmin({ params, body }) {
+  const updateData = {
+    username: body.username,
+    email: body.email,
+    role: body.role,
+    updated_at: new Date().toISOString()
+  }
+
+  // Only update password if provided
+  if (body.password) {
+    updateData.password = await hashPassword(body.password)
+  }
+
+  const { data, error } = await supabase
+    .from('superadmin')
+    .update(updateData)
+    .eq('id', params.id)
+    .select(ADMIN_COLUMNS)
+    .single()
+
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  return NextResponse.json(data)
+}
+
+async function deleteAdmin({ params }) {
+  const { error } = await supabase.from('superadmin').delete().eq('id', params.id)
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  return NextResponse.json({ success: true })
+}
+
+// Setup endpoint - provides instructions for manual setup
+async function getSetup() {
+  return NextResponse.json({ 
+    message: 'Manual setup required',
+    instructions: [
+      '1. Go to your Supabase dashboard',
+      '2. Navigate to SQL Editor',
+      '3. Run the following SQL commands:',
+      '',
+      'CREATE TABLE IF NOT EXISTS superadmin (',
+      '  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),',
+      '  username VARCHAR(255) UNIQUE NOT NULL,',
+      '  email VARCHAR(255) UNIQUE NOT NULL,',
+      '  password VARCHAR(255) NOT NULL,',
+      '  role VARCHAR(50) DEFAULT \'admin\',',
+      '  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),',
+      '  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()',
+      ');',
+      '',
+      '-- Insert default admin (password: admin123)',
+      'INSERT INTO superadmin (username, email, password, role) VALUES (',
+      '  \'admin\',',
+      '  \'admin@example.com\',',
+      '  \'$2a$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj3bp.Gm.F5W\',',
+      '  \'superadmin\'',
+      ') ON CONFLICT (username) DO NOTHING;',
+      '',
+      '4. After running the SQL, you can login with:',
+      '   Username: admin',
+      '   Password: admin123'
+    ],
+    sqlFile: 'A complete SQL file is available at /app/setup-superadmin.sql'
+  })
+}
+
+// Stats/Analytics
+async function getStats() {
+  return cachedJson(await countsCache.getOrLoad('stats', fetchStats))
+}
+
+// Live dashboard counters as server-sent events; see lib/live-counts.js
+async function streamStats({ request }) {
+  return new Response(liveCountsStream(liveCounts, { signal: request.signal }), {
+    headers: {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache, no-transform',
+      'Connection': 'keep-alive',
+      'X-Accel-Buffering': 'no'
     }
+  })
+}
+
+// Counts and Railway cache hit/miss counters
+async function getCacheStats() {
+  return NextResponse.json({ ...countsCache.stats(), railway: railwayCache.stats() })
+}
 
-    return NextResponse.json({ error: 'Not found' }, { status: 404 })
+async function getAnalytics() {
+  try {
+    return cachedJson(await countsCache.getOrLoad('analytics', fetchAnalytics))
   } catch (error) {
-    console.error('API Error:', error)
-    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+    console.error('Analytics error:', error)
+    return NextResponse.json({ error: 'Failed to fetch analytics' }, { status: 500 })
   }
 }
 
-export async function POST(request, { params }) {
-  const path = params?.path || []
-  const pathname = path.join('/')
+// Completed orders and revenue per hour or day, from the rollups of setup-analytics-rollups.sql
+async function getAnalyticsSeries({ url }) {
+  const range = parseSeriesRange(url.searchParams)
+  if (range.error) return NextResponse.json({ error: range.error }, { status: 400 })
 
-  try {
-    // Handle file upload
-    if (pathname === 'upload') {
-      try {
-        const formData = await request.formData()
-        const file = formData.get('file')
-        const bucket = formData.get('bucket') || 'uploads'
-        const folder = formData.get('folder') || 'files'
-        
-        if (!file) {
-          return NextResponse.json({ error: 'No file provided' }, { status: 400 })
-        }
+  const { data, error } = await fetchSeries(range)
+  if (error) {
+    if (ROLLUPS_MISSING_CODES.includes(error.code)) {
+      return NextResponse.json({ error: ROLLUPS_MISSING_MESSAGE }, { status: 501 })
+    }
+    console.error('Analytics series error:', error)
+    return NextResponse.json({ error: 'Failed to fetch analytics series' }, { status: 500 })
+  }
 
-        const fileName = `${Date.now()}-${file.name.replace(/[^a-zA-Z0-9.-]/g, '_')}`
-        const filePath = `${folder}/${fileName}`
+  return NextResponse.json(data)
+}
 
-        // Convert file to buffer
-        const bytes = await file.arrayBuffer()
-        const buffer = Buffer.from(bytes)
+// Seller deletion requests
+async function listDeletionRequests({ request, url }) {
+  const page = parsePageParams(url.searchParams)
+  if (page.error) return NextResponse.json({ error: page.error }, { status: 400 })
+  
+  // Simple query first, will enhance with relationships later
+  const { data, error } = await applyKeyset(
+    supabase.from('seller_deletion_requests').select('*'),
+    'created_at',
+    page
+  )
+    
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  
+  const { data: rows, next_cursor } = page.paginated ? toPage(data, page, 'created_at') : { data }
+  
+  // Get seller info for all requests in one lookup
+  const enrichedData = await attachSellers(rows, 'name, email, store_name, business_name')
+  
+  return compressedJson(request, page.paginated ? { data: enrichedData, next_cursor } : enrichedData)
+}
 
-        // Upload to Supabase Storage
-        const { data, error } = await supabase.storage
-          .from(bucket)
-          .upload(filePath, buffer, {
-            contentType: file.type,
-            upsert: false
-          })
+async function createDeletionRequest({ body }) {
+  const newRequest = {
+    id: uuidv4(),
+    seller_id: body.seller_id,
+    reason: body.reason,
+    status: 'pending',
+    created_at: new Date().toISOString(),
+    updated_at: new Date().toISOString()
+  }
+  
+  const { data, error } = await supabase.from('seller_deletion_requests').insert(newRequest).select().single()
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  return NextResponse.json(data)
+}
 
-        if (error) {
-          console.error('Supabase upload error:', error)
-          return NextResponse.json({ error: error.message }, { status: 500 })
-        }
+async function updateDeletionRequest({ params, body }) {
+  const updateData = {
+    status: body.status,
+    admin_notes: body.admin_notes || null,
+    updated_at: new Date().toISOString()
+  }
+  
+  const { data, error } = await supabase
+    .from('seller_deletion_requests')
+    .update(updateData)
+    .eq('id', params.id)
+    .select()
+    .single()
+    
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  return NextResponse.json(data)
+}
 
-        // Get public URL
-        const { data: publicData } = supabase.storage.from(bucket).getPublicUrl(filePath)
+// Seller balance transactions
+async function listBalanceTransactions({ request, url }) {
+  const page = parsePageParams(url.searchParams)
+  if (page.error) return NextResponse.json({ error: page.error }, { status: 400 })
+  
+  // Simple query first; without pagination params only the latest 100 are returned
+  let query = applyKeyset(supabase.from('seller_balance_transactions').select('*'), 'created_at', page)
+  if (!page.paginated) query = query.limit(100)
+  const { data, error } = await query
+    
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  
+  const { data: rows, next_cursor } = page.paginated ? toPage(data, page, 'created_at') : { data }
+  
+  // Get seller info for all transactions in one lookup
+  const enrichedData = await attachSellers(rows, 'name, store_name')
+  
+  return compressedJson(request, page.paginated ? { data: enrichedData, next_cursor } : enrichedData)
+}
 
-        return NextResponse.json({ 
-          success: true, 
-          url: publicData.publicUrl,
-          path: filePath
-        })
-      } catch (error) {
-        console.error('Upload error:', error)
-        return NextResponse.json({ error: 'Upload failed' }, { status: 500 })
-      }
-    }
+// Seller balances
+async function listBalances({ request, url }) {
+  const page = parsePageParams(url.searchParams)
+  if (page.error) return NextResponse.json({ error: page.error }, { status: 400 })
+  
+  // Simple query first; balances keep their most-recently-updated-first order
+  const { data, error } = await applyKeyset(supabase.from('seller_balances').select('*'), 'updated_at', page)
     
-    const body = await request.json()
+  if (error) return NextResponse.json({ error: error.message }, { status: 500 })
+  
+  const { data: rows, next_cursor } = page.paginated ? toPage(data, page, 'updated_at') : { data }
+  
+  // Get seller info for all balance records in one lookup
+  const enrichedData = await attachSellers(rows, 'name, store_name, email')
+  
+  return compressedJson(request, page.paginated ? { data: enrichedData, next_cursor } : enrichedData)
+}
 
-    // Auth login
-    if (pathname === 'auth/login') {
-      const { username, password } = body
+// Load one panel of /api/bootstrap; resolves to { data } or { error }
+async function loadBootstrapPanel({ spec, columns, sellerColumns }, seriesRange) {
+  if (spec.kind === 'totals') {
+    try {
+      const { value } = await countsCache.getOrLoad('analytics', fetchAnalytics)
+      return { data: pickFields(value, columns) }
+    } catch (error) {
+      return { error }
+    }
+  }
 
-      const { data: admin, error } = await supabase
-        .from('superadmin')
-        .select('*')
-        .eq('username', username)
-        .single()
+  if (spec.kind === 'series') {
+    const { data, error } = await fetchSeries(seriesRange)
+    // The other panels are still worth showing without the rollups
+    if (error && ROLLUPS_MISSING_CODES.includes(error.code)) return { data: { error: ROLLUPS_MISSING_MESSAGE } }
+    return { data, error }
+  }
 
-      if (error || !admin) {
-        return NextResponse.json({ error: 'Invalid credentials' }, { status: 401 })
-      }
+  // seller_id is needed to attach sellers even when it was not asked for
+  const select = columns
+    ? [...new Set([...columns, ...(sellerColumns.length ? ['seller_id'] : [])])].join(', ')
+    : '*'
+  const query = applyKeyset(supabase.from(spec.table).select(select), spec.sortColumn, { paginated: false })
+  return spec.limit ? query.limit(spec.limit) : query
+}
 
-      const isValidPassword = await verifyPassword(password, admin.password)
-      if (!isValidPassword) {
-        return NextResponse.json({ error: 'Invalid credentials' }, { status: 401 })
-      }
+// Every panel a dashboard page shows in one request; see lib/bootstrap.js. The sellers of all
+// row panels are looked up together, each seller once, with the columns any panel asked for.
+async function getBootstrap({ request, url }) {
+  const query = parseBootstrapQuery(url.searchParams)
+  if (query.error) return NextResponse.json({ error: query.error }, { status: 400 })
 
-      const token = generateToken({
-        id: admin.id,
-        username: admin.username,
-        email: admin.email,
-        role: admin.role
-      })
+  let seriesRange = null
+  if (query.panels.some(panel => panel.spec.kind === 'series')) {
+    seriesRange = parseSeriesRange(url.searchParams)
+    if (seriesRange.error) return NextResponse.json({ error: seriesRange.error }, { status: 400 })
+  }
 
-      return NextResponse.json({
-        token,
-        user: {
-          id: admin.id,
-          username: admin.username,
-          email: admin.email,
-          role: admin.role
-        }
-      })
+  const results = await Promise.all(query.panels.map(panel => loadBootstrapPanel(panel, seriesRange)))
+  const failed = results.find(result => result.error)
+  if (failed) {
+    // 42703: a requested field is not a column
+    if (failed.error.code === '42703') {
+      return NextResponse.json({ error: failed.error.message }, { status: 400 })
     }
+    console.error('Bootstrap error:', failed.error)
+    return NextResponse.json({ error: 'Failed to load dashboard' }, { status: 500 })
+  }
 
-    // Protected routes - require authentication
-    const authResult = await requireAuth(request)
-    if (authResult.error) {
-      return NextResponse.json({ error: authResult.error }, { status: authResult.status })
-    }
+  const enriched = query.panels.filter(panel => panel.spec.kind === 'rows' && panel.sellerColumns.length)
+  const rows = enriched.flatMap(panel => results[query.panels.indexOf(panel)].data)
+  const sellersById = enriched.length
+    ? await fetchSellersById(sellerIdsOf(rows), [...new Set(enriched.flatMap(panel => panel.sellerColumns))].join(', '))
+    : new Map()
+
+  const body = {}
+  query.panels.forEach((panel, i) => {
+    const { data } = results[i]
+    body[panel.name] = enriched.includes(panel)
+      ? data.map(row => {
+        const seller = sellersById.get(row.seller_id)
+        return { ...pickFields(row, panel.columns), sellers: seller ? pickFields(seller, panel.sellerColumns) : null }
+      })
+      : data
+  })
 
-    // Create new seller
-    if (pathname === 'sellers') {
-      const newSeller = {
-        id: uuidv4(),
-        ...body,
-        created_at: new Date().toISOString(),
-        updated_at: new Date().toISOString()
-      }
-      
-      const { data, error } = await supabase.from('sellers').insert(newSeller).select().single()
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
-    }
+  return compressedJson(request, body)
+}
 
-    // Create new category
-    if (pathname === 'categories') {
-      const newCategory = {
-        id: uuidv4(),
-        ...body,
-        created_at: new Date().toISOString(),
-        updated_at: new Date().toISOString()
-      }
-      
-      const { data, error } = await supabase.from('categories').insert(newCategory).select().single()
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
-    }
+// Streaming export of a whole table: export/<resource>?format=csv|ndjson&columns=a,b
+async function exportResource({ url, params }) {
+  const { resource } = params
+  if (!EXPORTS[resource]) {
+    return NextResponse.json({ error: `Unknown export ${resource}` }, { status: 404 })
+  }
+  const format = url.searchParams.get('format') || 'csv'
+  if (!EXPORT_FORMATS[format]) {
+    return NextResponse.json({ error: 'format must be csv or ndjson' }, { status: 400 })
+  }
+  const { columns, error } = parseExportColumns(url.searchParams)
+  if (error) return NextResponse.json({ error }, { status: 400 })
 
-    // Create new event
-    if (pathname === 'events') {
-      const newEvent = {
-        id: uuidv4(),
-        ...body,
-        created_at: new Date().toISOString(),
-        updated_at: new Date().toISOString()
-      }
-      
-      const { data, error } = await supabase.from('events').insert(newEvent).select().single()
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
+  let stream
+  try {
+    stream = await createExportStream(resource, format, columns)
+  } catch (error) {
+    return NextResponse.json({ error: error.message }, { status: 500 })
+  }
+
+  const { contentType, extension } = EXPORT_FORMATS[format]
+  const filename = `${resource}-${new Date().toISOString().slice(0, 10)}.${extension}`
+  return new Response(stream, {
+    headers: {
+      'Content-Type': contentType,
+      'Content-Disposition': `attachment; filename="${filename}"`,
+      'Cache-Control': 'no-store',
+      'X-Accel-Buffering': 'no'
     }
+  })
+}
 
-    // Create new admin
-    if (pathname === 'admins') {
-      const hashedPass = await hashPassword(body.password)
-      const newAdmin = {
-        id: uuidv4(),
-        username: body.username,
-        email: body.email,
-        password: hashedPass,
-        role: body.role || 'admin',
-        created_at: new Date().toISOString(),
-        updated_at: new Date().toISOString()
+// Railway API endpoints
+async function getRailwayStatus() {
+  try {
+    const result = await railwayQuery(`
+      query GetProject($projectId: String!) {
+        project(id: $projectId) {
+          id
+          name
+          environments {
+            nodes {
+              id
+              name
+              deployments {
+                edges {
+                  node {
+                    id
+                    status
+                    createdAt
+                  }
+                }
+              }
+            }
+          }
+        }
       }
-      
-      const { data, error } = await supabase.from('superadmin').insert(newAdmin).select('id, username, email, role, created_at, updated_at').single()
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
-    }
+    `, { projectId: process.env.RAILWAY_PROJECT_ID })
+    return cachedJson(result)
+  } catch (error) {
+    console.error('Railway status error:', error)
+    return NextResponse.json({ error: 'Failed to fetch Railway status' }, { status: 500 })
+  }
+}
 
-    // Create seller deletion request  
-    if (pathname === 'seller-deletion-requests') {
-      const newRequest = {
-        id: uuidv4(),
-        seller_id: body.seller_id,
-        reason: body.reason,
-        status: 'pending',
-        created_at: new Date().toISOString(),
-        updated_at: new Date().toISOString()
+async function getRailwayMetrics() {
+  try {
+    const result = await railwayQuery(`
+      query GetServiceMetrics($serviceId: String!) {
+        serviceInstance(serviceId: $serviceId) {
+          id
+          serviceName
+          latestDeployment {
+            id
+            status
+            createdAt
+          }
+        }
       }
-      
-      const { data, error } = await supabase.from('seller_deletion_requests').insert(newRequest).select().single()
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
-    }
+    `, { serviceId: process.env.RAILWAY_SERVICE_ID })
+    return cachedJson(result)
+  } catch (error) {
+    console.error('Railway metrics error:', error)
+    return NextResponse.json({ error: 'Failed to fetch Railway metrics' }, { status: 500 })
+  }
+}
 
-    return NextResponse.json({ error: 'Not found' }, { status: 404 })
+async function getRailwayLogs() {
+  try {
+    const result = await railwayQuery(`
+      query GetLogs($projectId: String!, $environmentId: String!, $serviceId: String!) {
+        logs(projectId: $projectId, environmentId: $environmentId, serviceId: $serviceId, filter: {}, limit: 100) {
+          edges {
+            node {
+              timestamp
+              message
+              severity
+            }
+          }
+        }
+      }
+    `, {
+      projectId: process.env.RAILWAY_PROJECT_ID,
+      environmentId: process.env.RAILWAY_ENVIRONMENT_ID,
+      serviceId: process.env.RAILWAY_SERVICE_ID
+    })
+    return cachedJson(result)
   } catch (error) {
-    console.error('API Error:', error)
-    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+    console.error('Railway logs error:', error)
+    return NextResponse.json({ error: 'Failed to fetch Railway logs' }, { status: 500 })
   }
 }
 
-export async function PUT(request, { params }) {
-  const path = params?.path || []
-  const pathname = path.join('/')
+// Live Railway log tail as server-sent events: ?since=<ISO timestamp>&severity=error,warn
+async function streamRailwayLogs({ request, url }) {
+  const since = url.searchParams.get('since') || request.headers.get('last-event-id')
+  if (since && Number.isNaN(Date.parse(since))) {
+    return NextResponse.json({ error: 'since must be an ISO timestamp' }, { status: 400 })
+  }
+  const severityParam = url.searchParams.get('severity')
+  const severities = severityParam
+    ? new Set(severityParam.split(',').map(level => level.trim().toLowerCase()).filter(Boolean))
+    : null
+
+  return new Response(railwayLogStream({ since, severities, signal: request.signal }), {
+    headers: {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache, no-transform',
+      'Connection': 'keep-alive',
+      'X-Accel-Buffering': 'no'
+    }
+  })
+}
 
+// Auth login
+async function login({ body }) {
+  const { username, password } = body
+
+  const { data: admin, error } = await supabase
+    .from('superadmin')
+    .select('*')
+    .eq('username', username)
+    .single()
+
+  if (error || !admin) {
+    return NextResponse.json({ error: 'Invalid credentials' }, { status: 401 })
+  }
+
+  let isValidPassword
   try {
-    const authResult = await requireAuth(request)
-    if (authResult.error) {
-      return NextResponse.json({ error: authResult.error }, { status: authResult.status })
+    isValidPassword = await verifyPassword(password, admin.password)
+  } catch (error) {
+    if (error instanceof PasswordPoolBusyError) {
+      return NextResponse.json({ error: 'Too many logins in progress, retry shortly' },
+                               { status: 503, headers: { 'Retry-After': '1' } })
     }
+    throw error
+  }
+  if (!isValidPassword) {
+    return NextResponse.json({ error: 'Invalid credentials' }, { status: 401 })
+  }
 
-    const body = await request.json()
+  // Upgrade hashes made with another cost factor; the login does not wait for it
+  if (needsRehash(admin.password)) {
+    hashPassword(password)
+      .then(hashedPassword => supabase.from('superadmin')
+        .update({ password: hashedPassword, updated_at: new Date().toISOString() })
+        .eq('id', admin.id)
+        .eq('password', admin.password))
+      .then(({ error }) => {
+        if (error) console.error('Password rehash error:', error)
+      })
+      .catch(error => console.error('Password rehash error:', error))
+  }
 
-    // Update seller
-    if (pathname.startsWith('sellers/') && path.length === 2) {
-      const sellerId = path[1]
-      const updateData = {
-        ...body,
-        updated_at: new Date().toISOString()
-      }
-      
-      const { data, error } = await supabase
-        .from('sellers')
-        .update(updateData)
-        .eq('id', sellerId)
-        .select()
-        .single()
-        
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
+  const token = generateToken({
+    id: admin.id,
+    username: admin.username,
+    email: admin.email,
+    role: admin.role
+  })
+
+  return NextResponse.json({
+    token,
+    user: {
+      id: admin.id,
+      username: admin.username,
+      email: admin.email,
+      role: admin.role
     }
+  })
+}
 
-    // Update category
-    if (pathname.startsWith('categories/') && path.length === 2) {
-      const categoryId = path[1]
-      const updateData = {
-        ...body,
-        updated_at: new Date().toISOString()
-      }
-      
-      const { data, error } = await supabase
-        .from('categories')
-        .update(updateData)
-        .eq('id', categoryId)
-        .select()
-        .single()
-        
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
+// Handle file upload. The file is streamed to storage when `bucket` and `folder` come before
+// it in the form; a file sent ahead of them is buffered, up to the size limit.
+async function upload({ request }) {
+  try {
+    const declaredLength = Number(request.headers.get('content-length'))
+    if (declaredLength > UPLOAD_MAX_BYTES + MULTIPART_OVERHEAD_BYTES) {
+      return NextResponse.json({ error: `File exceeds the ${UPLOAD_MAX_BYTES} byte limit` }, { status: 413 })
     }
-
-    // Update event
-    if (pathname.startsWith('events/') && path.length === 2) {
-      const eventId = path[1]
-      const updateData = {
-        ...body,
-        updated_at: new Date().toISOString()
-      }
-      
-      const { data, error } = await supabase
-        .from('events')
-        .update(updateData)
-        .eq('id', eventId)
-        .select()
-        .single()
-        
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
+    const boundary = getBoundary(request.headers.get('content-type'))
+    if (!boundary || !request.body) {
+      return NextResponse.json({ error: 'Expected multipart/form-data' }, { status: 400 })
     }
 
-    // Update admin user
-    if (pathname.startsWith('admins/') && path.length === 2) {
-      const adminId = path[1]
-      const updateData = {
-        username: body.username,
-        email: body.email,
-        role: body.role,
-        updated_at: new Date().toISOString()
+    const fields = {}
+    let file = null
+    let stored = null
+    for await (const part of parseMultipart(request.body, boundary, { maxFileBytes: UPLOAD_MAX_BYTES })) {
+      if (!part.stream) {
+        fields[part.name] = part.value
+        continue
       }
-      
-      // Only update password if provided
-      if (body.password) {
-        updateData.password = await hashPassword(body.password)
+      // Only the first `file` part is stored; anything else is skipped
+      if (part.name !== 'file' || file) continue
+
+      file = part
+      if ('bucket' in fields && 'folder' in fields) {
+        if (isResizableImage(file.contentType) && await derivativesEnabled()) {
+          // Images are also kept in memory for resizing while the original streams out
+          const [toStorage, toResize] = file.stream.tee()
+          const [result, image] = await Promise.all([
+            uploadToStorage(fields, file, toStorage),
+            new Response(toResize).arrayBuffer()
+          ])
+          stored = result
+          file.buffer = Buffer.from(image)
+        } else {
+          stored = await uploadToStorage(fields, file, file.stream)
+        }
+        if (file.error) throw file.error
+      } else {
+        file.buffer = Buffer.from(await new Response(file.stream).arrayBuffer())
       }
-      
-      const { data, error } = await supabase
-        .from('superadmin')
-        .update(updateData)
-        .eq('id', adminId)
-        .select('id, username, email, role, created_at, updated_at')
-        .single()
-        
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
     }
 
-    // Update seller deletion request
-    if (pathname.startsWith('seller-deletion-requests/') && path.length === 2) {
-      const requestId = path[1]
-      const updateData = {
-        status: body.status,
-        admin_notes: body.admin_notes || null,
-        updated_at: new Date().toISOString()
+    if (!file) {
+      return NextResponse.json({ error: 'No file provided' }, { status: 400 })
+    }
+    if (!stored) {
+      stored = await uploadToStorage(fields, file, file.buffer)
+    }
+    if (stored.error) {
+      console.error('Supabase upload error:', stored.error)
+      return NextResponse.json({ error: stored.error.message }, { status: 500 })
+    }
+
+    // Derivatives are best effort; the original upload has already succeeded
+    let derivatives = null
+    if (isResizableImage(file.contentType)) {
+      try {
+        derivatives = await createDerivatives(stored.bucket, stored.path, file.buffer)
+      } catch (error) {
+        console.error('Image derivative error:', error)
       }
-      
-      const { data, error } = await supabase
-        .from('seller_deletion_requests')
-        .update(updateData)
-        .eq('id', requestId)
-        .select()
-        .single()
-        
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json(data)
     }
 
-    return NextResponse.json({ error: 'Not found' }, { status: 404 })
+    return NextResponse.json({ 
+      success: true, 
+      url: stored.url,
+      path: stored.path,
+      derivatives
+    })
   } catch (error) {
-    console.error('API Error:', error)
-    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+    if (error instanceof MultipartError) {
+      return NextResponse.json({ error: error.message }, { status: error.status })
+    }
+    console.error('Upload error:', error)
+    return NextResponse.json({ error: 'Upload failed' }, { status: 500 })
   }
 }
 
-export async function DELETE(request, { params }) {
-  const path = params?.path || []
-  const pathname = path.join('/')
+// Start a resumable upload; chunks then go to PATCH upload/resumable/:id
+async function startResumableUpload({ body }) {
+  const { filename, size, contentType } = body
+  if (!filename || !Number.isInteger(size) || size < 1) {
+    return NextResponse.json({ error: 'filename and a positive integer size are required' }, { status: 400 })
+  }
+  if (size > RESUMABLE_MAX_BYTES) {
+    return NextResponse.json({ error: `File exceeds the ${RESUMABLE_MAX_BYTES} byte limit` }, { status: 413 })
+  }
 
+  const bucket = body.bucket || 'uploads'
+  const filePath = storageObjectPath(body.folder || 'files', filename)
   try {
-    const authResult = await requireAuth(request)
-    if (authResult.error) {
-      return NextResponse.json({ error: authResult.error }, { status: authResult.status })
+    const id = await createResumableUpload({
+      bucket,
+      objectPath: filePath,
+      contentType: contentType || 'application/octet-stream',
+      size
+    })
+    const { data: publicData } = supabase.storage.from(bucket).getPublicUrl(filePath)
+    return NextResponse.json({
+      id,
+      path: filePath,
+      url: publicData.publicUrl,
+      chunkSize: RESUMABLE_CHUNK_BYTES,
+      offset: 0
+    })
+  } catch (error) {
+    if (error instanceof ResumableUploadError) {
+      return NextResponse.json({ error: error.message }, { status: error.status })
     }
+    throw error
+  }
+}
 
-    // Delete seller
-    if (pathname.startsWith('sellers/') && path.length === 2) {
-      const sellerId = path[1]
-      const { error } = await supabase.from('sellers').delete().eq('id', sellerId)
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json({ success: true })
+// Resumable upload progress, so an interrupted client knows where to continue
+async function getResumableUploadStatus({ params }) {
+  try {
+    return NextResponse.json(await getResumableUpload(params.id))
+  } catch (error) {
+    if (error instanceof ResumableUploadError) {
+      return NextResponse.json({ error: error.message }, { status: error.status })
     }
+    throw error
+  }
+}
+
+// Append one chunk to a resumable upload. Upload-Offset says where the chunk starts; the body
+// is streamed to storage as it arrives.
+async function appendResumableUpload({ request, params }) {
+  const offset = Number(request.headers.get('upload-offset'))
+  const length = Number(request.headers.get('content-length'))
+  if (!Number.isInteger(offset) || offset < 0) {
+    return NextResponse.json({ error: 'Upload-Offset header is required' }, { status: 400 })
+  }
+  if (!Number.isInteger(length) || length < 1 || !request.body) {
+    return NextResponse.json({ error: 'Content-Length header is required' }, { status: 411 })
+  }
+  if (length > RESUMABLE_CHUNK_BYTES) {
+    return NextResponse.json({ error: `Chunks are at most ${RESUMABLE_CHUNK_BYTES} bytes` }, { status: 413 })
+  }
 
-    // Delete category
-    if (pathname.startsWith('categories/') && path.length === 2) {
-      const categoryId = path[1]
-      const { error } = await supabase.from('categories').delete().eq('id', categoryId)
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json({ success: true })
+  try {
+    const newOffset = await appendResumableChunk(params.id, offset, request.body, length)
+    return NextResponse.json({ offset: newOffset })
+  } catch (error) {
+    if (error instanceof ResumableUploadError) {
+      return NextResponse.json({ error: error.message }, { status: error.status })
     }
+    throw error
+  }
+}
+
+const PUBLIC = { auth: false }
+const JSON_BODY = { body: 'json' }
+
+// Every API route. Public reads and login skip auth; everything else requires a token.
+const router = createRouter([
+  route('GET', 'auth/me', getCurrentUser),
+  route('POST', 'auth/login', login, { auth: false, body: 'json' }),
+
+  ...BULK_TABLES.flatMap(table => [
+    route('GET', table, table === 'categories' ? listCategories : listSearchable(table), PUBLIC),
+    route('GET', `${table}/:id`, getRow(table), PUBLIC),
+    route('POST', table, createRow(table), JSON_BODY),
+    route('PUT', `${table}/:id`, updateRow(table), JSON_BODY),
+    route('DELETE', `${table}/:id`, deleteRow(table)),
+    route('POST', `${table}/bulk`, bulkCreateRows(table), JSON_BODY),
+    route('PUT', `${table}/bulk`, bulkUpdateRows(table), JSON_BODY),
+    route('DELETE', `${table}/bulk`, bulkDeleteRows(table), JSON_BODY)
+  ]),
+
+  route('GET', 'admins', listAdmins),
+  route('POST', 'admins', createAdmin, JSON_BODY),
+  route('PUT', 'admins/:id', updateAdmin, JSON_BODY),
+  route('DELETE', 'admins/:id', deleteAdmin),
+
+  route('GET', 'setup', getSetup, PUBLIC),
+  route('GET', 'stats', getStats),
+  route('GET', 'stats/stream', streamStats),
+  route('GET', 'cache/stats', getCacheStats),
+  route('GET', 'analytics', getAnalytics),
+  route('GET', 'analytics/series', getAnalyticsSeries),
+
+  route('GET', 'seller-deletion-requests', listDeletionRequests),
+  route('POST', 'seller-deletion-requests', createDeletionRequest, JSON_BODY),
+  route('PUT', 'seller-deletion-requests/:id', updateDeletionRequest, JSON_BODY),
+  route('GET', 'seller-balance-transactions', listBalanceTransactions),
+  route('GET', 'seller-balances', listBalances),
+  route('GET', 'bootstrap', getBootstrap),
+  route('GET', 'export/:resource', exportResource),
+
+  route('GET', 'railway/status', getRailwayStatus),
+  route('GET', 'railway/metrics', getRailwayMetrics),
+  route('GET', 'railway/logs', getRailwayLogs),
+  route('GET', 'railway/logs/stream', streamRailwayLogs),
+
+  route('POST', 'upload', upload, PUBLIC),
+  route('POST', 'upload/resumable', startResumableUpload, JSON_BODY),
+  route('GET', 'upload/resumable/:id', getResumableUploadStatus),
+  route('PATCH', 'upload/resumable/:id', appendResumableUpload)
+])
+
+// Match the route, then apply its auth and body policies before calling the handler
+async function dispatch(method, request, params) {
+  const path = params?.path || []
 
-    // Delete event
-    if (pathname.startsWith('events/') && path.length === 2) {
-      const eventId = path[1]
-      const { error } = await supabase.from('events').delete().eq('id', eventId)
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json({ success: true })
+  try {
+    const matched = router.match(method, path)
+    if (!matched) {
+      return NextResponse.json({ error: 'Not found' }, { status: 404 })
+    }
+
+    const { handler, auth, body } = matched.route
+    const context = { request, url: new URL(request.url), path, params: matched.params }
+
+    if (auth) {
+      const authResult = await requireAuth(request)
+      if (authResult.error) {
+        return NextResponse.json({ error: authResult.error }, { status: authResult.status })
+      }
+      context.user = authResult.user
     }
 
-    // Delete admin
-    if (pathname.startsWith('admins/') && path.length === 2) {
-      const adminId = path[1]
-      const { error } = await supabase.from('superadmin').delete().eq('id', adminId)
-      if (error) return NextResponse.json({ error: error.message }, { status: 500 })
-      return NextResponse.json({ success: true })
+    if (body === 'json') {
+      try {
+        context.body = await request.json()
+      } catch {
+        return NextResponse.json({ error: 'Request body must be JSON' }, { status: 400 })
+      }
     }
 
-    return NextResponse.json({ error: 'Not found' }, { status: 404 })
+    return await handler(context)
   } catch (error) {
     console.error('API Error:', error)
     return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
   }
-}
\ No newline at end of file
+}
+
+export async function GET(request, { params }) {
+  return dispatch('GET', request, params)
+}
+
+export async function POST(request, { params }) {
+  return dispatch('POST', request, params)
+}
+
+export async function PUT(request, { params }) {
+  return dispatch('PUT', request, params)
+}
+
+export async function DELETE(request, { params }) {
+  return dispatch('DELETE', request, params)
+}
+
+export async function PATCH(request, { params }) {
+  return dispatch('PATCH', request, params)
+}
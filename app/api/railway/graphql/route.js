@@ -1,22 +1,16 @@
 
 
 import { NextResponse } from "next/server";
+import { railwayQuery } from "@/lib/railway";
 
 export async function POST(request) {
   try {
     const { query, variables } = await request.json();
 
-    const response = await fetch("https://backboard.railway.app/graphql/v2", {
-      method: "POST",
-      headers: {
-        "Content-Type": "application/json",
-        "Authorization": `Bearer ${process.env.RAILWAY_API_TOKEN}`, // 🔒 simpan di .env.local
-      },
-      body: JSON.stringify({ query, variables }),
+    const { value, hit, stale } = await railwayQuery(query, variables);
+    return NextResponse.json(value, {
+      headers: { "X-Cache": stale ? "STALE" : hit ? "HIT" : "MISS" },
     });
-
-    const data = await response.json();
-    return NextResponse.json(data);
   } catch (err) {
     return NextResponse.json(
       { error: "Failed to fetch Railway API", details: err.message },
@@ -29,38 +29,103 @@ import {
   RefreshCw,
   CreditCard,
   ArrowUpDown,
-  Activity
+  Activity,
+  BarChart3
 } from 'lucide-react'
+import { Bar, BarChart, CartesianGrid, XAxis } from 'recharts'
+import { ChartContainer, ChartTooltip, ChartTooltipContent } from '@/components/ui/chart'
 import { toast } from 'sonner'
+import { useLiveCounts } from '@/hooks/use-live-counts'
+
+// Only the columns the tables below show are loaded
+const TRANSACTION_FIELDS = 'id,type,amount,created_at,metadata,sellers.name,sellers.store_name'
+const BALANCE_FIELDS = 'seller_id,balance,withdrawable_balance,bank_code,account_holder_name,updated_at,' +
+  'sellers.name,sellers.store_name,sellers.email'
 
 export default function AnalyticsPage() {
   const [analytics, setAnalytics] = useState({})
   const [transactions, setTransactions] = useState([])
   const [balances, setBalances] = useState([])
   const [loading, setLoading] = useState(true)
+  const [granularity, setGranularity] = useState('day')
+  const [series, setSeries] = useState(null)
+  const [seriesError, setSeriesError] = useState(null)
+  // Totals come from the live counts stream; they are only loaded with the other panels on
+  // Refresh, or from /api/analytics when the stream is down
+  const { counts, error: liveError } = useLiveCounts()
 
   useEffect(() => {
-    fetchAnalytics()
+    fetchAnalytics({ includeTotals: false })
   }, [])
 
-  const fetchAnalytics = async () => {
+  useEffect(() => {
+    if (counts) setAnalytics(counts)
+  }, [counts])
+
+  useEffect(() => {
+    if (liveError && !counts) fetchTotals()
+  }, [liveError])
+
+  const showSeries = (data) => {
+    if (data.error) {
+      setSeriesError(data.error)
+    } else {
+      setSeries(data)
+      setSeriesError(null)
+    }
+  }
+
+  // Revenue per day over the last 30 days or per hour over the last 48, from the rollup tables
+  const fetchSeries = async (value = granularity) => {
     try {
       const token = localStorage.getItem('admin_token')
+      const response = await fetch(`/api/analytics/series?granularity=${value}`, {
+        headers: { Authorization: `Bearer ${token}` }
+      })
+      const data = await response.json()
+      showSeries(response.ok ? data : { error: data.error || 'Failed to fetch revenue series' })
+    } catch (error) {
+      console.error('Error fetching revenue series:', error)
+      setSeriesError('Failed to fetch revenue series')
+    }
+  }
+
+  const changeGranularity = (value) => {
+    setGranularity(value)
+    setSeries(null)
+    fetchSeries(value)
+  }
+
+  const fetchTotals = async () => {
+    try {
+      const token = localStorage.getItem('admin_token')
+      const response = await fetch('/api/analytics', { headers: { Authorization: `Bearer ${token}` } })
+      if (response.ok) setAnalytics(await response.json())
+    } catch (error) {
+      console.error('Error fetching analytics totals:', error)
+    }
+  }
+
+  // Every panel of the page in one request to /api/bootstrap
+  const fetchAnalytics = async ({ includeTotals = true } = {}) => {
+    try {
+      const token = localStorage.getItem('admin_token')
+      const params = new URLSearchParams({
+        panels: ['transactions', 'balances', 'series', ...(includeTotals ? ['analytics'] : [])].join(','),
+        granularity,
+        'fields[transactions]': TRANSACTION_FIELDS,
+        'fields[balances]': BALANCE_FIELDS
+      })
       
-      const [analyticsRes, transactionsRes, balancesRes] = await Promise.all([
-        fetch('/api/analytics', { headers: { Authorization: `Bearer ${token}` } }),
-        fetch('/api/seller-balance-transactions', { headers: { Authorization: `Bearer ${token}` } }),
-        fetch('/api/seller-balances', { headers: { Authorization: `Bearer ${token}` } })
-      ])
+      const response = await fetch(`/api/bootstrap?${params}`, { headers: { Authorization: `Bearer ${token}` } })
 
-      if (analyticsRes.ok && transactionsRes.ok && balancesRes.ok) {
-        const analyticsData = await analyticsRes.json()
-        const transactionsData = await transactionsRes.json()
-        const balancesData = await balancesRes.json()
+      if (response.ok) {
+        const data = await response.json()
         
-        setAnalytics(analyticsData)
-        setTransactions(transactionsData)
-        setBalances(balancesData)
+        setTransactions(data.transactions)
+        setBalances(data.balances)
+        showSeries(data.series)
+        if (data.analytics) setAnalytics(data.analytics)
       } else {
         toast.error('Failed to fetch analytics data')
       }
@@ -80,6 +145,14 @@ export default function AnalyticsPage() {
     }).format(amount)
   }
 
+  // Bucket labels in the time zone the daily buckets are cut in
+  const formatBucket = (bucket) => {
+    const options = granularity === 'day'
+      ? { day: 'numeric', month: 'short' }
+      : { hour: '2-digit', minute: '2-digit' }
+    return new Date(bucket).toLocaleString('id-ID', { ...options, timeZone: 'Asia/Jakarta' })
+  }
+
   const formatTransactionType = (type) => {
     switch (type) {
       case 'credit':
@@ -113,7 +186,7 @@ export default function AnalyticsPage() {
           <div>
             <p className="text-sm font-medium text-muted-foreground">{title}</p>
             <p className="text-2xl font-bold">
-              {loading ? '...' : format === 'currency' ? formatCurrency(value) : value?.toLocaleString()}
+              {value === undefined ? '...' : format === 'currency' ? formatCurrency(value) : value.toLocaleString()}
             </p>
             {trend && (
               <div className="flex items-center mt-1 text-sm">
@@ -140,7 +213,7 @@ export default function AnalyticsPage() {
             Platform statistics and financial overview
           </p>
         </div>
-        <Button onClick={fetchAnalytics} variant="outline" size="sm">
+        <Button onClick={() => fetchAnalytics()} variant="outline" size="sm">
           <RefreshCw className="h-4 w-4 mr-2" />
           Refresh
         </Button>
@@ -207,6 +280,70 @@ export default function AnalyticsPage() {
         />
       </div>
 
+      {/* Revenue Series */}
+      <Card>
+        <CardHeader className="flex flex-row items-center justify-between space-y-0">
+          <div>
+            <CardTitle className="flex items-center">
+              <BarChart3 className="h-5 w-5 mr-2" />
+              Revenue
+            </CardTitle>
+            {series && (
+              <p className="text-sm text-muted-foreground mt-1">
+                {series.totals.orders.toLocaleString()} completed orders, {formatCurrency(series.totals.revenue)}
+              </p>
+            )}
+          </div>
+          <div className="flex gap-2">
+            <Button
+              variant={granularity === 'day' ? 'default' : 'outline'}
+              size="sm"
+              onClick={() => changeGranularity('day')}
+            >
+              Last 30 days
+            </Button>
+            <Button
+              variant={granularity === 'hour' ? 'default' : 'outline'}
+              size="sm"
+              onClick={() => changeGranularity('hour')}
+            >
+              Last 48 hours
+            </Button>
+          </div>
+        </CardHeader>
+        <CardContent>
+          {seriesError ? (
+            <div className="text-center py-8 text-muted-foreground">{seriesError}</div>
+          ) : !series ? (
+            <div className="flex items-center justify-center py-8">
+              <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-primary"></div>
+            </div>
+          ) : (
+            <ChartContainer
+              config={{ revenue: { label: 'Revenue', color: 'hsl(var(--chart-1))' } }}
+              className="h-64 w-full aspect-auto"
+            >
+              <BarChart data={series.buckets}>
+                <CartesianGrid vertical={false} />
+                <XAxis dataKey="bucket" tickLine={false} axisLine={false} minTickGap={24} tickFormatter={formatBucket} />
+                <ChartTooltip
+                  content={
+                    <ChartTooltipContent
+                      labelFormatter={(_, payload) => {
+                        const bucket = payload?.[0]?.payload
+                        return bucket ? `${formatBucket(bucket.bucket)} · ${bucket.orders} orders` : ''
+                      }}
+                      formatter={(value) => formatCurrency(value)}
+                    />
+                  }
+                />
+                <Bar dataKey="revenue" fill="var(--color-revenue)" radius={2} />
+              </BarChart>
+            </ChartContainer>
+          )}
+        </CardContent>
+      </Card>
+
       {/* Detailed Analytics */}
       <Tabs defaultValue="transactions" className="space-y-4">
         <TabsList>
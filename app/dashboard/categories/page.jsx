@@ -72,9 +72,10 @@ export default function CategoriesPage() {
 
   const uploadImageToSupabase = async (file) => {
     const formData = new FormData()
-    formData.append('file', file)
+    // bucket and folder go first so the server can stream the file straight to storage
     formData.append('bucket', 'category-images')
     formData.append('folder', 'categories')
+    formData.append('file', file)
 
     try {
       const token = localStorage.getItem('admin_token')
@@ -1,6 +1,6 @@
 'use client'
 
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
@@ -35,11 +35,16 @@ import {
 } from 'lucide-react'
 import { toast } from 'sonner'
 
+// Rows per request; more are loaded on demand
+const PAGE_SIZE = 100
+
 export default function EventsPage() {
   const [events, setEvents] = useState([])
   const [categoriesList, setCategoriesList] = useState([])
   const [loading, setLoading] = useState(true)
   const [searchTerm, setSearchTerm] = useState('')
+  const [nextCursor, setNextCursor] = useState(null)
+  const latestRequest = useRef(0)
   const [selectedEvent, setSelectedEvent] = useState(null)
   const [isCreateDialogOpen, setIsCreateDialogOpen] = useState(false)
   const [isEditDialogOpen, setIsEditDialogOpen] = useState(false)
@@ -47,22 +52,35 @@ export default function EventsPage() {
   const [uploading, setUploading] = useState(false)
 
   useEffect(() => {
-    fetchEvents()
     fetchCategories()
   }, [])
 
-  const fetchEvents = async () => {
+  // Search runs on the server; wait for a pause in typing before asking
+  useEffect(() => {
+    const timer = setTimeout(() => fetchEvents(), searchTerm ? 300 : 0)
+    return () => clearTimeout(timer)
+  }, [searchTerm])
+
+  // First page for the current search, or the page after `cursor` appended to the list
+  const fetchEvents = async (cursor = null) => {
+    // Only the newest request may update the list, so a slow earlier search cannot win
+    const request = ++latestRequest.current
     try {
       const token = localStorage.getItem('admin_token')
-      const response = await fetch('/api/events', {
+      const params = new URLSearchParams({ limit: String(PAGE_SIZE) })
+      if (searchTerm.trim()) params.set('search', searchTerm.trim())
+      if (cursor) params.set('cursor', cursor)
+      const response = await fetch(`/api/events?${params}`, {
         headers: {
           Authorization: `Bearer ${token}`
         }
       })
+      if (request !== latestRequest.current) return
 
       if (response.ok) {
-        const data = await response.json()
-        setEvents(data)
+        const { data, next_cursor } = await response.json()
+        setEvents(previous => cursor ? [...previous, ...data] : data)
+        setNextCursor(next_cursor)
       } else {
         toast.error('Failed to fetch events')
       }
@@ -94,9 +112,10 @@ export default function EventsPage() {
 
   const uploadImageToSupabase = async (file) => {
     const formData = new FormData()
-    formData.append('file', file)
+    // bucket and folder go first so the server can stream the file straight to storage
     formData.append('bucket', 'event-banners')
     formData.append('folder', 'events')
+    formData.append('file', file)
 
     try {
       const token = localStorage.getItem('admin_token')
@@ -242,11 +261,6 @@ export default function EventsPage() {
     return { label: 'Ended', variant: 'destructive' }
   }
 
-  const filteredEvents = events.filter(event =>
-    event.title?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    event.description?.toLowerCase().includes(searchTerm.toLowerCase())
-  )
-
   const EventForm = ({ event, onSubmit, onClose, isEdit = false }) => {
     const [formData, setFormData] = useState({
       title: event?.title || '',
@@ -497,7 +511,7 @@ export default function EventsPage() {
           </p>
         </div>
         <div className="flex space-x-2">
-          <Button onClick={fetchEvents} variant="outline" size="sm">
+          <Button onClick={() => fetchEvents()} variant="outline" size="sm">
             <RefreshCw className="h-4 w-4 mr-2" />
             Refresh
           </Button>
@@ -539,7 +553,7 @@ export default function EventsPage() {
       {/* Events Table */}
       <Card>
         <CardHeader>
-          <CardTitle>Events ({filteredEvents.length})</CardTitle>
+          <CardTitle>Events ({events.length})</CardTitle>
         </CardHeader>
         <CardContent>
           {loading ? (
@@ -559,7 +573,7 @@ export default function EventsPage() {
                 </TableRow>
               </TableHeader>
               <TableBody>
-                {filteredEvents.map((event) => {
+                {events.map((event) => {
                   const status = getEventStatus(event)
                   return (
                     <TableRow key={event.id}>
@@ -654,11 +668,19 @@ export default function EventsPage() {
             </Table>
           )}
 
-          {!loading && filteredEvents.length === 0 && (
+          {!loading && events.length === 0 && (
             <div className="text-center py-8 text-muted-foreground">
               No events found matching your search.
             </div>
           )}
+
+          {!loading && nextCursor && (
+            <div className="flex justify-center pt-4">
+              <Button variant="outline" size="sm" onClick={() => fetchEvents(nextCursor)}>
+                Load more
+              </Button>
+            </div>
+          )}
         </CardContent>
       </Card>
 
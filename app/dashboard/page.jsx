@@ -17,6 +17,7 @@ import {
   CheckCircle
 } from 'lucide-react'
 import { toast } from 'sonner'
+import { useLiveCounts } from '@/hooks/use-live-counts'
 
 export default function Dashboard() {
   const [stats, setStats] = useState({
@@ -27,12 +28,25 @@ export default function Dashboard() {
   const [loading, setLoading] = useState(true)
   const [recentActivity, setRecentActivity] = useState([])
   const [setupNeeded, setSetupNeeded] = useState(false)
+  // Counts arrive over a server-sent event stream and update as sellers, categories and
+  // events are written; /api/stats is only fetched on Refresh or when the stream is down
+  const { counts, error: liveError } = useLiveCounts()
 
   useEffect(() => {
-    fetchStats()
     checkSetupStatus()
   }, [])
 
+  useEffect(() => {
+    if (counts) {
+      setStats(counts)
+      setLoading(false)
+    }
+  }, [counts])
+
+  useEffect(() => {
+    if (liveError && !counts) fetchStats()
+  }, [liveError])
+
   const fetchStats = async () => {
     try {
       const token = localStorage.getItem('admin_token')
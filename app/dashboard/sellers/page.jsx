@@ -1,6 +1,6 @@
 'use client'
 
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
@@ -37,30 +37,45 @@ import {
 } from 'lucide-react'
 import { toast } from 'sonner'
 
+// Rows per request; more are loaded on demand
+const PAGE_SIZE = 100
+
 export default function SellersPage() {
   const [sellers, setSellers] = useState([])
   const [loading, setLoading] = useState(true)
   const [searchTerm, setSearchTerm] = useState('')
+  const [nextCursor, setNextCursor] = useState(null)
+  const latestRequest = useRef(0)
   const [selectedSeller, setSelectedSeller] = useState(null)
   const [isEditDialogOpen, setIsEditDialogOpen] = useState(false)
   const [isViewDialogOpen, setIsViewDialogOpen] = useState(false)
 
+  // Search runs on the server; wait for a pause in typing before asking
   useEffect(() => {
-    fetchSellers()
-  }, [])
+    const timer = setTimeout(() => fetchSellers(), searchTerm ? 300 : 0)
+    return () => clearTimeout(timer)
+  }, [searchTerm])
 
-  const fetchSellers = async () => {
+  // First page for the current search, or the page after `cursor` appended to the list
+  const fetchSellers = async (cursor = null) => {
+    // Only the newest request may update the list, so a slow earlier search cannot win
+    const request = ++latestRequest.current
     try {
       const token = localStorage.getItem('admin_token')
-      const response = await fetch('/api/sellers', {
+      const params = new URLSearchParams({ limit: String(PAGE_SIZE) })
+      if (searchTerm.trim()) params.set('search', searchTerm.trim())
+      if (cursor) params.set('cursor', cursor)
+      const response = await fetch(`/api/sellers?${params}`, {
         headers: {
           Authorization: `Bearer ${token}`
         }
       })
+      if (request !== latestRequest.current) return
 
       if (response.ok) {
-        const data = await response.json()
-        setSellers(data)
+        const { data, next_cursor } = await response.json()
+        setSellers(previous => cursor ? [...previous, ...data] : data)
+        setNextCursor(next_cursor)
       } else {
         toast.error('Failed to fetch sellers')
       }
@@ -120,12 +135,6 @@ export default function SellersPage() {
     }
   }
 
-  const filteredSellers = sellers.filter(seller =>
-    seller.name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    seller.email?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    seller.store_name?.toLowerCase().includes(searchTerm.toLowerCase())
-  )
-
   const EditSellerForm = ({ seller, onSubmit, onClose }) => {
     const [formData, setFormData] = useState({
       name: seller?.name || '',
@@ -319,7 +328,7 @@ export default function SellersPage() {
           </p>
         </div>
         <div className="flex space-x-2">
-          <Button onClick={fetchSellers} variant="outline" size="sm">
+          <Button onClick={() => fetchSellers()} variant="outline" size="sm">
             <RefreshCw className="h-4 w-4 mr-2" />
             Refresh
           </Button>
@@ -344,7 +353,7 @@ export default function SellersPage() {
       {/* Sellers Table */}
       <Card>
         <CardHeader>
-          <CardTitle>Sellers ({filteredSellers.length})</CardTitle>
+          <CardTitle>Sellers ({sellers.length})</CardTitle>
         </CardHeader>
         <CardContent>
           {loading ? (
@@ -364,7 +373,7 @@ export default function SellersPage() {
                 </TableRow>
               </TableHeader>
               <TableBody>
-                {filteredSellers.map((seller) => (
+                {sellers.map((seller) => (
                   <TableRow key={seller.id}>
                     <TableCell>
                       <div>
@@ -438,11 +447,19 @@ export default function SellersPage() {
             </Table>
           )}
 
-          {!loading && filteredSellers.length === 0 && (
+          {!loading && sellers.length === 0 && (
             <div className="text-center py-8 text-muted-foreground">
               No sellers found matching your search.
             </div>
           )}
+
+          {!loading && nextCursor && (
+            <div className="flex justify-center pt-4">
+              <Button variant="outline" size="sm" onClick={() => fetchSellers(nextCursor)}>
+                Load more
+              </Button>
+            </div>
+          )}
         </CardContent>
       </Card>
 
@@ -0,0 +1,96 @@
+-- Check that order writes by the anon and authenticated roles keep the rollups of
+-- setup-analytics-rollups.sql current instead of failing in the trigger
+-- Run this SQL in your Supabase SQL Editor after setup-analytics-rollups.sql, with at least one
+-- order in the table. Everything runs in one transaction that is rolled back, so it leaves no
+-- orders, rollups, grants or policies behind; a failed check raises an error saying which.
+
+BEGIN;
+
+-- Let both roles write orders for this transaction, whatever the project's own grants and
+-- policies allow: the check is about the trigger, not about who may place orders
+GRANT SELECT, INSERT, UPDATE, DELETE ON orders TO anon, authenticated;
+CREATE POLICY order_rollups_check ON orders TO anon, authenticated USING (true) WITH CHECK (true);
+
+-- New orders copy an existing one, so columns this check does not know about get valid values.
+-- They are placed in 2000, where no real order is, and the rollups there are compared with
+-- what they were before.
+CREATE TEMP TABLE order_rollups_check_template ON COMMIT DROP AS SELECT * FROM orders LIMIT 1;
+GRANT SELECT ON order_rollups_check_template TO anon, authenticated;
+
+CREATE TEMP TABLE order_rollups_check_before ON COMMIT DROP AS
+SELECT 'hourly' AS rollup, coalesce(sum(orders), 0) AS orders, coalesce(sum(revenue), 0) AS revenue
+FROM order_rollups_hourly WHERE bucket = '2000-01-01 00:00:00+00'
+UNION ALL
+SELECT 'daily', coalesce(sum(orders), 0), coalesce(sum(revenue), 0)
+FROM order_rollups_daily WHERE bucket = '2000-01-01 00:00:00+07';
+
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM order_rollups_check_template) THEN
+    RAISE EXCEPTION 'check-analytics-rollups.sql needs at least one order to copy';
+  END IF;
+END;
+$$;
+
+-- Storefront checkout: a completed order from each role, then a price change and a cancellation
+SET LOCAL ROLE anon;
+INSERT INTO orders
+SELECT (jsonb_populate_record(t, jsonb_build_object(
+  'id', '00000000-0000-4000-8000-00000000c001', 'status', 'diterima',
+  'total_price', 1000, 'created_at', '2000-01-01T00:10:00Z'))).*
+FROM order_rollups_check_template t;
+RESET ROLE;
+
+SET LOCAL ROLE authenticated;
+INSERT INTO orders
+SELECT (jsonb_populate_record(t, jsonb_build_object(
+  'id', '00000000-0000-4000-8000-00000000c002', 'status', 'diterima',
+  'total_price', 2000, 'created_at', '2000-01-01T00:20:00Z'))).*
+FROM order_rollups_check_template t;
+UPDATE orders SET total_price = 1500 WHERE id = '00000000-0000-4000-8000-00000000c001';
+UPDATE orders SET status = 'dibatalkan' WHERE id = '00000000-0000-4000-8000-00000000c002';
+RESET ROLE;
+
+DO $$
+DECLARE
+  bad TEXT;
+BEGIN
+  SELECT string_agg(b.rollup, ', ') INTO bad
+  FROM order_rollups_check_before b
+  LEFT JOIN (
+    SELECT 'hourly' AS rollup, orders, revenue FROM order_rollups_hourly WHERE bucket = '2000-01-01 00:00:00+00'
+    UNION ALL
+    SELECT 'daily', orders, revenue FROM order_rollups_daily WHERE bucket = '2000-01-01 00:00:00+07'
+  ) a USING (rollup)
+  WHERE a.orders IS DISTINCT FROM b.orders + 1 OR a.revenue IS DISTINCT FROM b.revenue + 1500;
+  IF bad IS NOT NULL THEN
+    RAISE EXCEPTION 'Rollups (%) do not count the orders written by anon and authenticated', bad;
+  END IF;
+END;
+$$;
+
+-- Deleting the completed order takes it back out
+SET LOCAL ROLE authenticated;
+DELETE FROM orders WHERE id IN ('00000000-0000-4000-8000-00000000c001', '00000000-0000-4000-8000-00000000c002');
+RESET ROLE;
+
+DO $$
+DECLARE
+  bad TEXT;
+BEGIN
+  SELECT string_agg(b.rollup, ', ') INTO bad
+  FROM order_rollups_check_before b
+  LEFT JOIN (
+    SELECT 'hourly' AS rollup, orders, revenue FROM order_rollups_hourly WHERE bucket = '2000-01-01 00:00:00+00'
+    UNION ALL
+    SELECT 'daily', orders, revenue FROM order_rollups_daily WHERE bucket = '2000-01-01 00:00:00+07'
+  ) a USING (rollup)
+  WHERE coalesce(a.orders, 0) <> b.orders OR coalesce(a.revenue, 0) <> b.revenue;
+  IF bad IS NOT NULL THEN
+    RAISE EXCEPTION 'Rollups (%) still count an order deleted by authenticated', bad;
+  END IF;
+  RAISE NOTICE 'Order writes by anon and authenticated keep the rollups current';
+END;
+$$;
+
+ROLLBACK;
@@ -0,0 +1,70 @@
+"use client";
+import * as React from "react"
+
+// Longest wait between reconnection attempts
+const MAX_RETRY_MS = 30000
+
+// Parse one server-sent event block into { event, data }
+const parseEvent = (block) => {
+  let event = "message"
+  const data = []
+  for (const line of block.split("\n")) {
+    if (line.startsWith("event:")) event = line.slice(6).trim()
+    else if (line.startsWith("data:")) data.push(line.slice(5).replace(/^ /, ""))
+  }
+  return { event, data: data.join("\n") }
+}
+
+// Dashboard counters from /api/stats/stream, kept current by the server instead of polling.
+// EventSource cannot send the bearer token, so the stream is read with fetch. Returns
+// { counts, error }: counts stays null until the first event, error is set while disconnected.
+export function useLiveCounts() {
+  const [counts, setCounts] = React.useState(null)
+  const [error, setError] = React.useState(null)
+
+  React.useEffect(() => {
+    const controller = new AbortController()
+    let retryMs = 1000
+
+    const connect = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          const token = localStorage.getItem("admin_token")
+          const response = await fetch("/api/stats/stream", {
+            headers: { Authorization: `Bearer ${token}` },
+            signal: controller.signal
+          })
+          if (!response.ok) throw new Error(`HTTP ${response.status}`)
+
+          const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+          let buffer = ""
+          while (true) {
+            const { value, done } = await reader.read()
+            if (done) break
+            buffer += value
+            let end
+            while ((end = buffer.indexOf("\n\n")) !== -1) {
+              const { event, data } = parseEvent(buffer.slice(0, end))
+              buffer = buffer.slice(end + 2)
+              if (event === "counts") {
+                setCounts(JSON.parse(data))
+                setError(null)
+                retryMs = 1000
+              }
+            }
+          }
+        } catch (err) {
+          if (controller.signal.aborted) return
+          setError(err)
+        }
+        await new Promise(resolve => setTimeout(resolve, retryMs))
+        retryMs = Math.min(retryMs * 2, MAX_RETRY_MS)
+      }
+    }
+
+    connect()
+    return () => controller.abort()
+  }, [])
+
+  return { counts, error }
+}
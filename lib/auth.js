@@ -1,14 +1,27 @@
 import jwt from 'jsonwebtoken'
 import bcrypt from 'bcryptjs'
+import { passwordPool } from '@/lib/password-pool'
 
 const JWT_SECRET = process.env.JWT_SECRET
 
+// bcrypt cost for new hashes. Each hash records its own cost, so older hashes keep
+// verifying and are upgraded on the next successful login (see needsRehash).
+const BCRYPT_COST = Number(process.env.BCRYPT_COST) || 12
+
 export const hashPassword = async (password) => {
-  return await bcrypt.hash(password, 12)
+  return await passwordPool.run({ op: 'hash', password, cost: BCRYPT_COST })
 }
 
 export const verifyPassword = async (password, hashedPassword) => {
-  return await bcrypt.compare(password, hashedPassword)
+  return await passwordPool.run({ op: 'compare', password, hash: hashedPassword })
+}
+
+export const needsRehash = (hashedPassword) => {
+  try {
+    return bcrypt.getRounds(hashedPassword) !== BCRYPT_COST
+  } catch (error) {
+    return false
+  }
 }
 
 export const generateToken = (payload) => {
@@ -31,13 +44,41 @@ export const getTokenFromRequest = (request) => {
   return null
 }
 
+// Payloads of tokens that already passed jwt.verify, least recently used first. An entry
+// lives until its token's `exp`; AUTH_TOKEN_CACHE_SIZE=0 turns the cache off.
+const TOKEN_CACHE_SIZE = process.env.AUTH_TOKEN_CACHE_SIZE === undefined
+  ? 1000
+  : Number(process.env.AUTH_TOKEN_CACHE_SIZE)
+const verifiedTokens = new Map()
+
+const verifyTokenCached = (token) => {
+  const entry = verifiedTokens.get(token)
+  if (entry) {
+    verifiedTokens.delete(token)
+    if (entry.expiresAt > Date.now()) {
+      verifiedTokens.set(token, entry)
+      return entry.payload
+    }
+  }
+
+  const payload = verifyToken(token)
+  // Tokens without an expiry are verified every time rather than cached indefinitely
+  if (payload && typeof payload.exp === 'number' && TOKEN_CACHE_SIZE > 0) {
+    if (verifiedTokens.size >= TOKEN_CACHE_SIZE) {
+      verifiedTokens.delete(verifiedTokens.keys().next().value)
+    }
+    verifiedTokens.set(token, { payload, expiresAt: payload.exp * 1000 })
+  }
+  return payload
+}
+
 export const requireAuth = async (request) => {
   const token = getTokenFromRequest(request)
   if (!token) {
     return { error: 'No token provided', status: 401 }
   }
   
-  const payload = verifyToken(token)
+  const payload = verifyTokenCached(token)
   if (!payload) {
     return { error: 'Invalid token', status: 401 }
   }
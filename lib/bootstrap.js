@@ -0,0 +1,82 @@
+// Panels served together by GET /api/bootstrap, so a dashboard page loads in one request:
+//   ?panels=analytics,transactions&fields[transactions]=amount,type,sellers.name
+// Without `panels` every panel is returned. `fields[<panel>]` limits a panel to the listed
+// columns; `sellers.<column>` picks columns of the embedded seller, and a panel whose fields
+// name no seller column gets no `sellers` at all. Without it rows keep every column, as in the
+// panel's own endpoint.
+
+// Row panels mirror their list endpoints: same table, order, row limit and seller columns
+export const BOOTSTRAP_PANELS = {
+  analytics: { kind: 'totals' },
+  series: { kind: 'series' },
+  transactions: {
+    kind: 'rows',
+    table: 'seller_balance_transactions',
+    sortColumn: 'created_at',
+    limit: 100,
+    sellerColumns: ['name', 'store_name']
+  },
+  balances: {
+    kind: 'rows',
+    table: 'seller_balances',
+    sortColumn: 'updated_at',
+    limit: null,
+    sellerColumns: ['name', 'store_name', 'email']
+  }
+}
+
+const COLUMN_PATTERN = /^[a-z_][a-z0-9_]*$/
+const SELLER_PREFIX = 'sellers.'
+
+// Read `panels` and `fields[...]`; resolves to { panels: [{ name, spec, columns, sellerColumns }] }
+// or { error }. `columns` is null for every column.
+export const parseBootstrapQuery = (searchParams) => {
+  const param = searchParams.get('panels')
+  const names = param === null
+    ? Object.keys(BOOTSTRAP_PANELS)
+    : [...new Set(param.split(',').map(name => name.trim()).filter(Boolean))]
+  const unknown = names.filter(name => !BOOTSTRAP_PANELS[name])
+  if (!names.length || unknown.length) {
+    return { error: `panels must be a comma-separated list of ${Object.keys(BOOTSTRAP_PANELS).join(', ')}` }
+  }
+
+  for (const key of searchParams.keys()) {
+    const match = key.match(/^fields\[(.*)\]$/)
+    if (match && !names.includes(match[1])) {
+      return { error: `fields[${match[1]}] given for a panel that was not requested` }
+    }
+  }
+
+  const panels = []
+  for (const name of names) {
+    const spec = BOOTSTRAP_PANELS[name]
+    const fieldsParam = searchParams.get(`fields[${name}]`)
+    if (fieldsParam === null) {
+      panels.push({ name, spec, columns: null, sellerColumns: spec.sellerColumns || [] })
+      continue
+    }
+    if (spec.kind === 'series') {
+      return { error: 'The series panel does not take fields' }
+    }
+
+    const fields = [...new Set(fieldsParam.split(',').map(field => field.trim()).filter(Boolean))]
+    const columns = fields.filter(field => !field.startsWith(SELLER_PREFIX))
+    const sellerColumns = fields.filter(field => field.startsWith(SELLER_PREFIX))
+      .map(field => field.slice(SELLER_PREFIX.length))
+    if (!fields.length || ![...columns, ...sellerColumns].every(column => COLUMN_PATTERN.test(column))) {
+      return { error: `fields[${name}] must be a comma-separated list of column names` }
+    }
+    if (spec.kind !== 'rows' && sellerColumns.length) {
+      return { error: `The ${name} panel has no sellers` }
+    }
+    panels.push({ name, spec, columns, sellerColumns })
+  }
+
+  return { panels }
+}
+
+// Keep only `columns` of an object; null keeps everything
+export const pickFields = (value, columns) => {
+  if (!columns) return value
+  return Object.fromEntries(columns.filter(column => column in value).map(column => [column, value[column]]))
+}
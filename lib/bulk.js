@@ -0,0 +1,222 @@
+import { supabase } from '@/lib/supabase'
+import { v4 as uuidv4 } from 'uuid'
+
+// Bulk create/update/delete for sellers, categories and events. Creates go out as one
+// multi-row INSERT; updates and deletes as one call to a function from setup-bulk.sql. Every
+// response lists one result per input item, in input order:
+//   { created | updated | deleted, failed, results: [{ index, id, ok, error? }] }
+
+export const BULK_TABLES = ['sellers', 'categories', 'events']
+export const BULK_MAX_ITEMS = Number(process.env.BULK_MAX_ITEMS) || 10000
+
+// Error codes for a bulk function that does not exist yet
+const BULK_MISSING_CODES = ['PGRST202', '42883']
+const BULK_MISSING_MESSAGE = 'Bulk updates and deletes are not installed, run setup-bulk.sql'
+
+const ID_PATTERN = /^[0-9A-Za-z-]+$/
+const ROLLED_BACK = 'Not written: another item in the batch failed'
+
+const isPlainObject = (value) => value !== null && typeof value === 'object' && !Array.isArray(value)
+const isValidId = (id) => typeof id === 'string' && ID_PATTERN.test(id)
+
+// Check the request shape; resolves to { items } or { error }
+export const parseBulkItems = (body, key) => {
+  const items = key ? body?.[key] : body
+  if (!Array.isArray(items) || items.length === 0) {
+    return { error: key ? `${key} must be a non-empty array` : 'Expected a non-empty array of items' }
+  }
+  if (items.length > BULK_MAX_ITEMS) {
+    return { error: `At most ${BULK_MAX_ITEMS} items per request` }
+  }
+  return { items }
+}
+
+// Postgres constraint violations and bad values are about the rows sent and the caller's
+// fault; anything else (network, auth, a missing table) is ours and fails any rows alike
+const CONFLICT_CODES = ['23505', '23503']
+const INVALID_ROW_CODES = ['23502', '23514', '22P02', '42703', 'PGRST204']
+
+const isRowError = (error) => CONFLICT_CODES.includes(error.code) || INVALID_ROW_CODES.includes(error.code)
+
+const errorStatus = (error) => {
+  if (CONFLICT_CODES.includes(error.code)) return 409
+  if (INVALID_ROW_CODES.includes(error.code)) return 400
+  return 500
+}
+
+// The item a constraint error is about, from `Key (column)=(value) ...` in its details or the
+// column named by a not-null violation. For duplicates within the batch the later row is the
+// one that failed.
+const failingRow = (rows, error) => {
+  const key = /Key \(([^)]+)\)=\((.*)\)/.exec(error.details || '')
+  if (key && !key[1].includes(',')) {
+    return rows.findLastIndex(row => row[key[1]] != null && String(row[key[1]]) === key[2])
+  }
+  const notNull = /null value in column "([^"]+)"/.exec(error.message || '')
+  if (notNull) return rows.findIndex(row => row[notNull[1]] == null)
+  return -1
+}
+
+const summarize = (results, countKey) => {
+  const failed = results.filter(result => !result.ok).length
+  const status = failed === 0 ? 200 : failed === results.length ? 400 : 207
+  return { status, body: { [countKey]: results.length - failed, failed, results } }
+}
+
+// Insert `entries` ([{ index, row }]) in one statement. When a row is rejected and `atomic` is
+// off, the batch is split in halves until the failing rows are isolated, so the rest still go
+// in. Any other error stops there: every half would fail the same way.
+async function insertEntries(table, entries, atomic, results) {
+  const rows = entries.map(entry => entry.row)
+  const { error } = await supabase.from(table).insert(rows, { defaultToNull: false })
+  if (!error) {
+    for (const { index, row } of entries) results[index] = { index, id: row.id, ok: true }
+    return null
+  }
+
+  if (atomic || entries.length === 1 || !isRowError(error)) {
+    const culprit = entries.length === 1 ? 0 : failingRow(rows, error)
+    for (const [position, { index, row }] of entries.entries()) {
+      const own = culprit === -1 || position === culprit
+      results[index] = { index, id: row.id, ok: false, error: own ? error.message : ROLLED_BACK }
+    }
+    return error
+  }
+
+  const middle = Math.ceil(entries.length / 2)
+  const halves = [entries.slice(0, middle), entries.slice(middle)]
+  for (const [position, half] of halves.entries()) {
+    const failed = await insertEntries(table, half, false, results)
+    if (failed && !isRowError(failed)) {
+      for (const { index, row } of halves.slice(position + 1).flat()) {
+        results[index] = { index, id: row.id, ok: false, error: failed.message }
+      }
+      return failed
+    }
+  }
+  return null
+}
+
+// Call bulk function `name` for `entries` ([{ index, id }]), which it writes in one statement:
+// on error none of them is written. `rows` are the values sent per entry, to find the item a
+// constraint error is about.
+async function callBulkFunction(name, args, entries, rows, results) {
+  const { data, error } = await supabase.rpc(name, args)
+  if (error) {
+    const culprit = failingRow(rows, error)
+    for (const [position, { index, id }] of entries.entries()) {
+      const own = culprit === -1 || position === culprit
+      results[index] = { index, id, ok: false, error: own ? error.message : ROLLED_BACK }
+    }
+    return error
+  }
+
+  const written = new Set(data)
+  for (const { index, id } of entries) {
+    results[index] = written.has(id) ? { index, id, ok: true } : { index, id, ok: false, error: 'Not found' }
+  }
+  return null
+}
+
+// An invalid item rolls back the whole request, as a failed statement would
+const rollBack = (entries, results) => {
+  for (const { index, id } of entries) results[index] = { index, id, ok: false, error: ROLLED_BACK }
+}
+
+const finish = (results, countKey, error) => {
+  if (error && BULK_MISSING_CODES.includes(error.code)) {
+    return { status: 501, body: { error: BULK_MISSING_MESSAGE } }
+  }
+  const summary = summarize(results, countKey)
+  if (error) summary.status = errorStatus(error)
+  return summary
+}
+
+// Create every item in one INSERT. By default the request is all-or-nothing: an invalid item
+// or a failed statement writes nothing. With `atomic: false` the valid items are written and
+// only the failing ones are reported.
+export async function bulkCreate(table, items, { atomic = true } = {}) {
+  const now = new Date().toISOString()
+  const results = new Array(items.length)
+  const entries = []
+
+  items.forEach((item, index) => {
+    if (!isPlainObject(item)) {
+      results[index] = { index, id: null, ok: false, error: 'Item must be an object' }
+    } else if ('id' in item && !isValidId(item.id)) {
+      results[index] = { index, id: null, ok: false, error: 'Invalid id' }
+    } else {
+      entries.push({ index, row: { id: uuidv4(), ...item, created_at: now, updated_at: now } })
+    }
+  })
+
+  if (atomic && entries.length < items.length) {
+    for (const { index, row } of entries) results[index] = { index, id: row.id, ok: false, error: ROLLED_BACK }
+    return summarize(results, 'created')
+  }
+
+  const error = entries.length ? await insertEntries(table, entries, atomic, results) : null
+  return finish(results, 'created', error)
+}
+
+// Apply [{ id, ...fields }] in one UPDATE through admin_bulk_update(). All-or-nothing: an
+// invalid item or a failed statement writes nothing. Ids that match no row are reported as not
+// found and do not stop the others.
+export async function bulkUpdate(table, items) {
+  const now = new Date().toISOString()
+  const results = new Array(items.length)
+  const entries = []
+  const seen = new Set()
+
+  items.forEach((item, index) => {
+    const { id, ...fields } = isPlainObject(item) ? item : {}
+    if (!isPlainObject(item) || !isValidId(id)) {
+      results[index] = { index, id: id ?? null, ok: false, error: 'Item must be an object with a valid id' }
+    } else if (seen.has(id)) {
+      results[index] = { index, id, ok: false, error: 'Duplicate id in request' }
+    } else if (Object.keys(fields).length === 0) {
+      results[index] = { index, id, ok: false, error: 'No fields to update' }
+    } else {
+      seen.add(id)
+      entries.push({ index, id, row: { id, ...fields } })
+    }
+  })
+
+  if (entries.length < items.length) {
+    rollBack(entries, results)
+    return summarize(results, 'updated')
+  }
+
+  const rows = entries.map(entry => entry.row)
+  const args = { p_table: table, p_items: rows, p_updated_at: now }
+  const error = await callBulkFunction('admin_bulk_update', args, entries, rows, results)
+  return finish(results, 'updated', error)
+}
+
+// Delete the given ids in one DELETE through admin_bulk_delete(); all-or-nothing like updates
+export async function bulkDelete(table, ids) {
+  const results = new Array(ids.length)
+  const entries = []
+  const seen = new Set()
+
+  ids.forEach((id, index) => {
+    if (!isValidId(id)) {
+      results[index] = { index, id: id ?? null, ok: false, error: 'Invalid id' }
+    } else if (seen.has(id)) {
+      results[index] = { index, id, ok: false, error: 'Duplicate id in request' }
+    } else {
+      seen.add(id)
+      entries.push({ index, id })
+    }
+  })
+
+  if (entries.length < ids.length) {
+    rollBack(entries, results)
+    return summarize(results, 'deleted')
+  }
+
+  const rows = entries.map(({ id }) => ({ id }))
+  const args = { p_table: table, p_ids: entries.map(entry => entry.id) }
+  const error = await callBulkFunction('admin_bulk_delete', args, entries, rows, results)
+  return finish(results, 'deleted', error)
+}
@@ -0,0 +1,99 @@
+// In-process TTL cache with a size bound, hit/miss counters and single-flight loading
+
+export class TtlCache {
+  // `staleMs` keeps expired entries servable for that long while one background load refreshes them
+  constructor({ ttlMs = 30000, maxEntries = 100, staleMs = 0 } = {}) {
+    this.ttlMs = ttlMs
+    this.staleMs = staleMs
+    this.maxEntries = maxEntries
+    this.entries = new Map()
+    this.inFlight = new Map()
+    // Bumped by clear() so loads started before a write are not cached afterwards
+    this.generation = 0
+    this.hits = 0
+    this.staleHits = 0
+    this.misses = 0
+  }
+
+  get(key) {
+    const entry = this.entries.get(key)
+    if (!entry) return undefined
+    if (entry.expiresAt <= Date.now()) {
+      if (entry.expiresAt + this.staleMs <= Date.now()) this.entries.delete(key)
+      return undefined
+    }
+    return entry.value
+  }
+
+  set(key, value) {
+    // Map keeps insertion order, so the first key is the oldest entry
+    this.entries.delete(key)
+    if (this.entries.size >= this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value)
+    }
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs })
+  }
+
+  delete(key) {
+    this.entries.delete(key)
+  }
+
+  clear() {
+    this.entries.clear()
+    this.inFlight.clear()
+    this.generation++
+  }
+
+  // Start `loader` unless a load for `key` is already running, and share its promise
+  load(key, loader) {
+    let pending = this.inFlight.get(key)
+    if (!pending) {
+      const generation = this.generation
+      pending = loader().then((value) => {
+        if (generation === this.generation) this.set(key, value)
+        return value
+      }).finally(() => {
+        if (this.inFlight.get(key) === pending) this.inFlight.delete(key)
+      })
+      this.inFlight.set(key, pending)
+    }
+    return pending
+  }
+
+  // Return the cached value or run `loader` once for all concurrent callers.
+  // Resolves to { value, hit, stale }.
+  async getOrLoad(key, loader) {
+    const cached = this.get(key)
+    if (cached !== undefined) {
+      this.hits++
+      return { value: cached, hit: true, stale: false }
+    }
+
+    // Past its TTL but inside the stale window: answer now, refresh in the background
+    const entry = this.entries.get(key)
+    if (entry) {
+      this.staleHits++
+      this.load(key, loader).catch((error) => {
+        console.error('Background cache refresh failed:', error)
+      })
+      return { value: entry.value, hit: true, stale: true }
+    }
+
+    this.misses++
+    return { value: await this.load(key, loader), hit: false, stale: false }
+  }
+
+  stats() {
+    const lookups = this.hits + this.staleHits + this.misses
+    return {
+      hits: this.hits,
+      staleHits: this.staleHits,
+      misses: this.misses,
+      hitRate: lookups ? (this.hits + this.staleHits) / lookups : 0,
+      size: this.entries.size,
+      maxEntries: this.maxEntries,
+      ttlMs: this.ttlMs,
+      staleMs: this.staleMs
+    }
+  }
+}
@@ -0,0 +1,96 @@
+import { supabase } from '@/lib/supabase'
+import { applyKeyset } from '@/lib/pagination'
+
+// Streaming CSV/NDJSON exports. Tables are read one keyset page at a time and each page is
+// written out before the next is requested, so memory stays flat however large the table is.
+
+export const EXPORTS = {
+  'sellers': { table: 'sellers', sortColumn: 'created_at' },
+  'seller-balance-transactions': { table: 'seller_balance_transactions', sortColumn: 'created_at' },
+  'seller-balances': { table: 'seller_balances', sortColumn: 'updated_at' }
+}
+
+export const EXPORT_FORMATS = {
+  csv: { contentType: 'text/csv; charset=utf-8', extension: 'csv' },
+  ndjson: { contentType: 'application/x-ndjson', extension: 'ndjson' }
+}
+
+// Supabase caps responses at max_rows (1000 by default), so larger pages would come back short
+// and end the export early. A page that comes back full is taken to have more after it.
+const EXPORT_PAGE_SIZE = Math.min(Number(process.env.EXPORT_PAGE_SIZE) || 1000, 1000)
+
+const COLUMN_PATTERN = /^[a-z_][a-z0-9_]*$/
+
+// Read `columns=a,b,c`; resolves to { columns } (null for every column) or { error }
+export const parseExportColumns = (searchParams) => {
+  const param = searchParams.get('columns')
+  if (!param) return { columns: null }
+  const columns = [...new Set(param.split(',').map(column => column.trim()).filter(Boolean))]
+  if (!columns.length || !columns.every(column => COLUMN_PATTERN.test(column))) {
+    return { error: 'columns must be a comma-separated list of column names' }
+  }
+  return { columns }
+}
+
+const csvValue = (value) => {
+  if (value === null || value === undefined) return ''
+  const text = typeof value === 'object' ? JSON.stringify(value) : String(value)
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text
+}
+
+const csvLine = (values) => values.map(csvValue).join(',') + '\r\n'
+
+// No look-ahead row: asking for EXPORT_PAGE_SIZE + 1 rows would go past the cap
+async function fetchPage({ table, sortColumn }, select, after) {
+  const query = applyKeyset(supabase.from(table).select(select), sortColumn, { paginated: false, after })
+  const { data, error } = await query.limit(EXPORT_PAGE_SIZE)
+  if (error) throw new Error(error.message)
+  const last = data.length === EXPORT_PAGE_SIZE ? data[data.length - 1] : null
+  return {
+    rows: data,
+    next: last ? [last[sortColumn], last.id] : null
+  }
+}
+
+// Resolve to a ReadableStream of the whole table, newest first, in `format`. The first page
+// is read before resolving so a failing query can still be answered with an error status;
+// later failures abort the stream, which clients see as a truncated body. CSV columns are
+// `columns`, or those of the first row.
+export async function createExportStream(resource, format, columns) {
+  const source = EXPORTS[resource]
+  const select = columns ? [...new Set([...columns, 'id', source.sortColumn])].join(',') : '*'
+  const encoder = new TextEncoder()
+
+  let page = await fetchPage(source, select, null)
+  const header = columns || (page.rows[0] ? Object.keys(page.rows[0]) : [])
+
+  const encodePage = (rows) => {
+    if (format === 'ndjson') {
+      const pick = columns ? (row) => Object.fromEntries(columns.map(column => [column, row[column]])) : (row) => row
+      return rows.map(row => JSON.stringify(pick(row)) + '\n').join('')
+    }
+    return rows.map(row => csvLine(header.map(column => row[column]))).join('')
+  }
+
+  return new ReadableStream({
+    start(controller) {
+      if (format === 'csv') controller.enqueue(encoder.encode(csvLine(header)))
+    },
+    async pull(controller) {
+      if (!page) {
+        controller.close()
+        return
+      }
+      // Fetch the next page while this one is written out
+      const current = page
+      const next = current.next ? fetchPage(source, select, current.next) : null
+      controller.enqueue(encoder.encode(encodePage(current.rows)))
+      try {
+        page = next ? await next : null
+      } catch (error) {
+        console.error('Export error:', error)
+        controller.error(error)
+      }
+    }
+  }, { highWaterMark: 0 })
+}
@@ -0,0 +1,74 @@
+import { supabase } from '@/lib/supabase'
+
+// Resized WebP/AVIF copies of uploaded images, so list pages can show thumbnails without
+// downloading the originals. Generated once at upload time and stored next to the original.
+export const DERIVATIVE_WIDTHS = { thumb: 320, medium: 960 }
+
+const DERIVATIVE_FORMATS = {
+  webp: { quality: 75 },
+  avif: { quality: 50, effort: 2 }
+}
+
+const RESIZABLE_TYPES = new Set(['image/jpeg', 'image/png', 'image/webp', 'image/avif', 'image/gif', 'image/tiff'])
+
+export const isResizableImage = (contentType) => RESIZABLE_TYPES.has(contentType)
+
+// sharp is a native module: if its binary for this platform failed to install, uploads still
+// work, just without derivatives
+let sharpModule
+const loadSharp = async () => {
+  if (sharpModule === undefined) {
+    try {
+      sharpModule = (await import('sharp')).default
+    } catch (error) {
+      console.error('sharp failed to load, image derivatives are disabled:', error.message)
+      sharpModule = null
+    }
+  }
+  return sharpModule
+}
+
+// Whether uploads get derivatives; when not, images need not be buffered for resizing
+export const derivativesEnabled = async () => Boolean(await loadSharp())
+
+export const derivativePath = (filePath, size, format) => {
+  return `${filePath.replace(/\.[^./]+$/, '')}-${size}.${format}`
+}
+
+// Encode every size and format of `image` (a Buffer), upload them beside `filePath` and
+// resolve to { thumb: { webp: url, avif: url }, medium: { ... } }, or null when derivatives
+// are unavailable.
+export async function createDerivatives(bucket, filePath, image) {
+  const sharp = await loadSharp()
+  if (!sharp) return null
+
+  const jobs = []
+  for (const [size, width] of Object.entries(DERIVATIVE_WIDTHS)) {
+    for (const [format, options] of Object.entries(DERIVATIVE_FORMATS)) {
+      jobs.push((async () => {
+        const encoded = await sharp(image)
+          .rotate()
+          .resize({ width, withoutEnlargement: true })
+          .toFormat(format, options)
+          .toBuffer()
+
+        const path = derivativePath(filePath, size, format)
+        const { error } = await supabase.storage.from(bucket).upload(path, encoded, {
+          contentType: `image/${format}`,
+          cacheControl: '31536000',
+          upsert: true
+        })
+        if (error) throw error
+
+        const { data } = supabase.storage.from(bucket).getPublicUrl(path)
+        return [size, format, data.publicUrl]
+      })())
+    }
+  }
+
+  const derivatives = {}
+  for (const [size, format, url] of await Promise.all(jobs)) {
+    derivatives[size] = { ...derivatives[size], [format]: url }
+  }
+  return derivatives
+}
@@ -0,0 +1,132 @@
+// Dashboard counters pushed to subscribers as server-sent events. The first subscriber loads
+// the totals once; after that the API's own writes adjust them in place (see `adjust`), and a
+// periodic resync picks up writes made elsewhere, such as orders placed in the storefront.
+
+// Full reload interval while anyone is subscribed; also bounds drift between instances
+export const LIVE_COUNTS_RESYNC_MS = Number(process.env.LIVE_COUNTS_RESYNC_MS) || 30000
+
+const HEARTBEAT_MS = 15000
+
+export class LiveCounts {
+  // `load` resolves to the full set of counters, e.g. { sellers: 3, orders: 10, revenue: 5 }
+  constructor({ load, resyncMs = LIVE_COUNTS_RESYNC_MS }) {
+    this.load = load
+    this.resyncMs = resyncMs
+    this.counts = null
+    this.version = 0
+    this.updatedAt = null
+    this.listeners = new Set()
+    this.loading = null
+    // Set when a write lands while a load is running, which may or may not have seen it
+    this.stale = false
+    this.timer = null
+  }
+
+  // Call `listener` after every change until the returned function is called. The first
+  // subscriber starts a load and the resync timer.
+  subscribe(listener) {
+    this.listeners.add(listener)
+    if (this.listeners.size === 1) {
+      // Counters kept from an earlier subscriber may have missed writes made elsewhere
+      this.refresh()
+      this.timer = setInterval(() => this.refresh(), this.resyncMs)
+      this.timer.unref?.()
+    }
+    return () => {
+      this.listeners.delete(listener)
+      if (this.listeners.size === 0) {
+        clearInterval(this.timer)
+        this.timer = null
+      }
+    }
+  }
+
+  // Reload every counter; resolves once the load (and any reload it needed) has finished
+  refresh() {
+    if (!this.loading) {
+      this.loading = (async () => {
+        try {
+          do {
+            this.stale = false
+            this.publish(await this.load())
+          } while (this.stale)
+        } catch (error) {
+          console.error('Live counts load error:', error)
+        } finally {
+          this.loading = null
+        }
+      })()
+    }
+    return this.loading
+  }
+
+  // Apply a write made by this instance, e.g. { sellers: -2 }. Before the first load there is
+  // nothing to adjust: the load will see the write.
+  adjust(deltas) {
+    if (this.loading) this.stale = true
+    if (!this.counts) return
+    const counts = { ...this.counts }
+    for (const [name, delta] of Object.entries(deltas)) {
+      if (delta) counts[name] = (counts[name] || 0) + delta
+    }
+    this.publish(counts)
+  }
+
+  publish(counts) {
+    if (this.counts && Object.keys(counts).every(name => counts[name] === this.counts[name])) return
+    this.counts = counts
+    this.version++
+    this.updatedAt = new Date().toISOString()
+    for (const listener of this.listeners) listener()
+  }
+
+  snapshot() {
+    return this.counts && { ...this.counts, updated_at: this.updatedAt }
+  }
+}
+
+// Server-sent event stream of `hub`'s counters: a `counts` event with the current values as
+// soon as they are known, then one after every change. A subscriber that reads slowly skips
+// straight to the latest values instead of queueing every intermediate one.
+export const liveCountsStream = (hub, { signal }) => {
+  const encoder = new TextEncoder()
+  let sentVersion = 0
+  let wake = null
+  let closed = false
+  let unsubscribe = null
+  let heartbeat = null
+
+  const stop = () => {
+    closed = true
+    unsubscribe?.()
+    clearInterval(heartbeat)
+    wake?.()
+  }
+
+  return new ReadableStream({
+    start(controller) {
+      unsubscribe = hub.subscribe(() => wake?.())
+      heartbeat = setInterval(() => controller.enqueue(encoder.encode(': keep-alive\n\n')), HEARTBEAT_MS)
+      signal?.addEventListener('abort', () => {
+        stop()
+        try {
+          controller.close()
+        } catch {
+          // Already closed by the reader
+        }
+      }, { once: true })
+    },
+    async pull(controller) {
+      while (!closed && hub.version === sentVersion) {
+        await new Promise(resolve => { wake = resolve })
+        wake = null
+      }
+      if (closed) return
+      sentVersion = hub.version
+      controller.enqueue(encoder.encode(`id: ${sentVersion}\nevent: counts\ndata: ${JSON.stringify(hub.snapshot())}\n\n`))
+    },
+    cancel() {
+      stop()
+    }
+  }, { highWaterMark: 0 })
+}
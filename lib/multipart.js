@@ -0,0 +1,153 @@
+// Streaming multipart/form-data parser over a web ReadableStream. Only the current chunk and
+// a boundary-sized tail are held in memory; file parts are handed out as streams that pull
+// from the request body as they are read.
+
+const MAX_HEADER_BYTES = 16 * 1024
+const MAX_FIELD_BYTES = 64 * 1024
+
+export class MultipartError extends Error {
+  constructor(message, status = 400) {
+    super(message)
+    this.status = status
+  }
+}
+
+export const getBoundary = (contentType) => {
+  const match = /boundary=(?:"([^"]+)"|([^;]+))/i.exec(contentType || '')
+  return match ? (match[1] || match[2]).trim() : null
+}
+
+class ChunkReader {
+  constructor(stream) {
+    this.reader = stream.getReader()
+    this.buffer = Buffer.alloc(0)
+    this.done = false
+  }
+
+  // Append the next body chunk to the buffer; false once the body has ended
+  async fill() {
+    if (this.done) return false
+    const { value, done } = await this.reader.read()
+    if (done) {
+      this.done = true
+      return false
+    }
+    const chunk = Buffer.from(value.buffer, value.byteOffset, value.byteLength)
+    this.buffer = this.buffer.length ? Buffer.concat([this.buffer, chunk]) : chunk
+    return true
+  }
+
+  // Consume and return the bytes before `delimiter`, reading at most `limit` bytes ahead
+  async readUntil(delimiter, limit, message) {
+    while (true) {
+      const index = this.buffer.indexOf(delimiter)
+      if (index !== -1) {
+        const head = this.buffer.subarray(0, index)
+        this.buffer = this.buffer.subarray(index + delimiter.length)
+        return head
+      }
+      if (this.buffer.length > limit) throw new MultipartError(message, 413)
+      if (!await this.fill()) throw new MultipartError('Unexpected end of form data')
+    }
+  }
+
+  async take(length) {
+    while (this.buffer.length < length) {
+      if (!await this.fill()) throw new MultipartError('Unexpected end of form data')
+    }
+    const head = this.buffer.subarray(0, length)
+    this.buffer = this.buffer.subarray(length)
+    return head
+  }
+
+  cancel() {
+    this.reader.cancel().catch(() => {})
+  }
+}
+
+const parseHeaders = (raw) => {
+  const headers = {}
+  for (const line of raw.toString('utf8').split('\r\n')) {
+    const colon = line.indexOf(':')
+    if (colon > 0) headers[line.slice(0, colon).trim().toLowerCase()] = line.slice(colon + 1).trim()
+  }
+  const disposition = headers['content-disposition'] || ''
+  const name = /\bname="([^"]*)"/i.exec(disposition)?.[1]
+  const filename = /\bfilename="([^"]*)"/i.exec(disposition)?.[1]
+  return { name, filename, contentType: headers['content-type'] || 'application/octet-stream' }
+}
+
+// Yield the parts of a multipart body in order. Fields are yielded as { name, value }; files
+// as { name, filename, contentType, stream, error } where the stream errors with a 413
+// MultipartError once it passes `maxFileBytes`, and `error` keeps that failure for callers
+// whose consumer (e.g. fetch) reports it differently. A file stream that is not read to the
+// end is drained when the next part is requested.
+export async function* parseMultipart(body, boundary, { maxFileBytes = Infinity } = {}) {
+  const reader = new ChunkReader(body)
+  const delimiter = Buffer.from(`\r\n--${boundary}`)
+
+  try {
+    // The preamble ends at the first boundary, which has no leading CRLF
+    await reader.readUntil(Buffer.from(`--${boundary}`), MAX_HEADER_BYTES, 'Form data preamble too large')
+
+    while (true) {
+      const after = await reader.take(2)
+      if (after.equals(Buffer.from('--'))) return
+      if (!after.equals(Buffer.from('\r\n'))) throw new MultipartError('Malformed form data boundary')
+
+      const rawHeaders = await reader.readUntil(Buffer.from('\r\n\r\n'), MAX_HEADER_BYTES, 'Form data part headers too large')
+      const { name, filename, contentType } = parseHeaders(rawHeaders)
+
+      if (filename === undefined) {
+        const value = await reader.readUntil(delimiter, MAX_FIELD_BYTES, `Form field ${name} too large`)
+        yield { name, value: value.toString('utf8') }
+        continue
+      }
+
+      let finished = false
+      let received = 0
+      const file = { name, filename, contentType, stream: null, error: null }
+      file.stream = new ReadableStream({
+        async pull(controller) {
+          try {
+            while (true) {
+              const index = reader.buffer.indexOf(delimiter)
+              // Everything except a possible partial delimiter at the end is file data
+              const safe = index !== -1 ? index : reader.buffer.length - (delimiter.length - 1)
+              if (safe > 0) {
+                received += safe
+                if (received > maxFileBytes) {
+                  throw new MultipartError(`File exceeds the ${maxFileBytes} byte limit`, 413)
+                }
+                controller.enqueue(reader.buffer.subarray(0, safe))
+                reader.buffer = reader.buffer.subarray(safe)
+              }
+              if (index !== -1) {
+                reader.buffer = reader.buffer.subarray(delimiter.length)
+                finished = true
+                controller.close()
+                return
+              }
+              if (safe > 0) return
+              if (!await reader.fill()) throw new MultipartError('Unexpected end of form data')
+            }
+          } catch (error) {
+            finished = true
+            file.error = error
+            throw error
+          }
+        }
+      }, { highWaterMark: 0 })
+
+      yield file
+
+      if (file.error) throw file.error
+      if (!finished) {
+        const drain = file.stream.getReader()
+        while (!(await drain.read()).done) {}
+      }
+    }
+  } finally {
+    reader.cancel()
+  }
+}
@@ -0,0 +1,102 @@
+// Keyset pagination over (sortColumn, id), newest first unless another order is asked for
+
+export const DEFAULT_PAGE_SIZE = 50
+// One below Supabase's default max_rows (1000): a page fetches `limit + 1` rows to tell whether
+// another page exists, and a capped response would look like the last page
+export const MAX_PAGE_SIZE = 999
+
+const MAX_SORT_VALUE_LENGTH = 512
+const ID_PATTERN = /^[0-9A-Za-z-]+$/
+
+// Cursor values are interpolated into a PostgREST filter; double quotes keep commas and
+// parentheses in text values from being read as filter syntax
+const quote = (value) => `"${String(value).replace(/["\\]/g, '\\$&')}"`
+
+const isSortValue = (value) => {
+  return value === null || typeof value === 'number' ||
+    (typeof value === 'string' && value.length <= MAX_SORT_VALUE_LENGTH)
+}
+
+const encodeCursor = (row, sortColumn) => {
+  return Buffer.from(JSON.stringify([row[sortColumn], row.id])).toString('base64url')
+}
+
+const decodeCursor = (cursor) => {
+  try {
+    const value = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+    if (Array.isArray(value) && value.length === 2 &&
+        isSortValue(value[0]) && ID_PATTERN.test(String(value[1]))) {
+      return value
+    }
+  } catch (error) {
+    // fall through
+  }
+  return null
+}
+
+// Read `limit` and `cursor` from the query string. Requests without either keep the
+// unpaginated array response.
+export const parsePageParams = (searchParams) => {
+  const limitParam = searchParams.get('limit')
+  const cursorParam = searchParams.get('cursor')
+
+  if (limitParam === null && cursorParam === null) {
+    return { paginated: false }
+  }
+
+  const limit = limitParam === null ? DEFAULT_PAGE_SIZE : Number(limitParam)
+  if (!Number.isInteger(limit) || limit < 1 || limit > MAX_PAGE_SIZE) {
+    return { error: `limit must be an integer between 1 and ${MAX_PAGE_SIZE}` }
+  }
+
+  let after = null
+  if (cursorParam) {
+    after = decodeCursor(cursorParam)
+    if (!after) {
+      return { error: 'Invalid cursor' }
+    }
+  }
+
+  return { paginated: true, limit, after }
+}
+
+// Order a Supabase query by `sortColumn` (newest first by default) and, when paginating,
+// restrict it to the rows after the cursor. One extra row is fetched to tell whether
+// another page exists. Rows of a `nullable` column with no value come last in either
+// direction, ordered by id; other columns keep Postgres' placement (NULLs last ascending,
+// first descending) so their plain (column, id) indexes still serve the order, and the
+// cursor filter follows the same placement.
+export const applyKeyset = (query, sortColumn, page, { ascending = false, nullable = false } = {}) => {
+  const op = ascending ? 'gt' : 'lt'
+  const nullsLast = nullable || ascending
+  if (page.after) {
+    const [sortValue, id] = page.after
+    if (sortValue === null) {
+      // Past the NULLs when they come last; otherwise every non-NULL row is still ahead
+      query = nullsLast
+        ? query.is(sortColumn, null).filter('id', op, id)
+        : query.or(`and(${sortColumn}.is.null,id.${op}.${quote(id)}),${sortColumn}.not.is.null`)
+    } else {
+      const after = `${sortColumn}.${op}.${quote(sortValue)},and(${sortColumn}.eq.${quote(sortValue)},id.${op}.${quote(id)})`
+      query = query.or(nullsLast ? `${after},${sortColumn}.is.null` : after)
+    }
+  }
+
+  // id breaks ties, so rows sharing a sort value come in the same order with or without pages
+  query = query
+    .order(sortColumn, nullable ? { ascending, nullsFirst: false } : { ascending })
+    .order('id', { ascending })
+
+  return page.paginated ? query.limit(page.limit + 1) : query
+}
+
+// Trim the look-ahead row and build the `{ data, next_cursor }` page body
+export const toPage = (rows, page, sortColumn) => {
+  const hasMore = rows.length > page.limit
+  const data = hasMore ? rows.slice(0, page.limit) : rows
+
+  return {
+    data,
+    next_cursor: hasMore ? encodeCursor(data[data.length - 1], sortColumn) : null
+  }
+}
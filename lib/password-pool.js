@@ -0,0 +1,114 @@
+import { Worker } from 'node:worker_threads'
+import os from 'node:os'
+
+// bcrypt runs in worker threads so a burst of logins does not stall the event loop.
+// The worker is evaluated from source, which keeps it out of the Next.js bundle; bcryptjs
+// is resolved from the project's node_modules.
+const WORKER_SOURCE = `
+const { parentPort } = require('node:worker_threads')
+const bcrypt = require('bcryptjs')
+
+parentPort.on('message', ({ op, password, hash, cost }) => {
+  try {
+    const result = op === 'hash' ? bcrypt.hashSync(password, cost) : bcrypt.compareSync(password, hash)
+    parentPort.postMessage({ result })
+  } catch (error) {
+    parentPort.postMessage({ error: error.message })
+  }
+})
+`
+
+export class PasswordPoolBusyError extends Error {
+  constructor() {
+    super('Password hashing queue is full')
+  }
+}
+
+export class PasswordPool {
+  constructor({ size = 2, maxQueue = 64 } = {}) {
+    this.size = size
+    this.maxQueue = maxQueue
+    this.workers = []
+    this.idle = []
+    this.queue = []
+  }
+
+  spawn() {
+    const worker = new Worker(WORKER_SOURCE, { eval: true })
+    worker.on('message', ({ result, error }) => {
+      const task = worker.task
+      worker.task = null
+      if (error) task.reject(new Error(error))
+      else task.resolve(result)
+      this.release(worker)
+    })
+    worker.on('error', (error) => {
+      worker.task?.reject(error)
+      worker.task = null
+    })
+    worker.on('exit', () => {
+      // Replace a crashed worker lazily, on the next task that needs one
+      worker.task?.reject(new Error('Password worker exited'))
+      this.workers = this.workers.filter(other => other !== worker)
+      this.idle = this.idle.filter(other => other !== worker)
+      this.drain()
+    })
+    this.workers.push(worker)
+    return worker
+  }
+
+  // Idle workers are unreferenced so they never keep the process alive on their own
+  release(worker) {
+    const next = this.queue.shift()
+    if (next) {
+      this.assign(worker, next)
+    } else {
+      worker.unref()
+      this.idle.push(worker)
+    }
+  }
+
+  assign(worker, task) {
+    worker.ref()
+    worker.task = task
+    worker.postMessage(task.message)
+  }
+
+  drain() {
+    while (this.queue.length && (this.idle.length || this.workers.length < this.size)) {
+      this.assign(this.idle.pop() || this.spawn(), this.queue.shift())
+    }
+  }
+
+  // Run one bcrypt operation. Rejects with PasswordPoolBusyError when every worker is busy
+  // and `maxQueue` operations are already waiting.
+  run(message) {
+    return new Promise((resolve, reject) => {
+      const task = { message, resolve, reject }
+      const worker = this.idle.pop() || (this.workers.length < this.size ? this.spawn() : null)
+      if (worker) {
+        this.assign(worker, task)
+      } else if (this.queue.length < this.maxQueue) {
+        this.queue.push(task)
+      } else {
+        reject(new PasswordPoolBusyError())
+      }
+    })
+  }
+
+  stats() {
+    return {
+      size: this.size,
+      workers: this.workers.length,
+      busy: this.workers.length - this.idle.length,
+      queued: this.queue.length,
+      maxQueue: this.maxQueue
+    }
+  }
+}
+
+// Leave one core for the event loop by default
+export const passwordPool = new PasswordPool({
+  size: Number(process.env.PASSWORD_POOL_SIZE) || Math.max(1, Math.min(4, os.cpus().length - 1)),
+  maxQueue: Number(process.env.PASSWORD_POOL_MAX_QUEUE) || 64
+})
@@ -0,0 +1,151 @@
+import { TtlCache } from '@/lib/cache'
+
+// Railway GraphQL endpoint, overridable for local stand-ins
+export const RAILWAY_API_URL = process.env.RAILWAY_API_URL || 'https://backboard.railway.com/graphql/v2'
+
+// Short-lived cache of upstream responses keyed by query and variables. Identical concurrent
+// calls share one upstream request, and expired entries are served while they refresh.
+export const railwayCache = new TtlCache({
+  ttlMs: Number(process.env.RAILWAY_CACHE_TTL_MS) || 10000,
+  staleMs: Number(process.env.RAILWAY_CACHE_STALE_MS) || 60000,
+  maxEntries: Number(process.env.RAILWAY_CACHE_MAX_ENTRIES) || 50
+})
+
+// Log tail polling interval. Tails share one cache so concurrent subscribers poll upstream once.
+export const RAILWAY_LOG_POLL_MS = Number(process.env.RAILWAY_LOG_POLL_MS) || 1000
+const railwayLogCache = new TtlCache({ ttlMs: RAILWAY_LOG_POLL_MS, maxEntries: 10 })
+
+// Upstream answers that are passed through but must not be cached (HTTP or GraphQL errors)
+class UncachedResponse extends Error {
+  constructor(data) {
+    super('Railway returned an error')
+    this.data = data
+  }
+}
+
+const postQuery = async (query, variables) => {
+  const response = await fetch(RAILWAY_API_URL, {
+    method: 'POST',
+    headers: {
+      'Authorization': `Bearer ${process.env.RAILWAY_API_TOKEN}`,
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ query, variables })
+  })
+  const data = await response.json()
+  if (!response.ok || data.errors) {
+    throw new UncachedResponse(data)
+  }
+  return data
+}
+
+// Run a Railway GraphQL operation. Resolves to { value, hit, stale } like TtlCache.getOrLoad;
+// mutations always go upstream.
+export const railwayQuery = async (query, variables = {}, { cache = railwayCache } = {}) => {
+  try {
+    if (/^\s*mutation\b/.test(query)) {
+      return { value: await postQuery(query, variables), hit: false, stale: false }
+    }
+    const key = JSON.stringify([query, variables])
+    return await cache.getOrLoad(key, () => postQuery(query, variables))
+  } catch (error) {
+    if (error instanceof UncachedResponse) {
+      return { value: error.data, hit: false, stale: false }
+    }
+    throw error
+  }
+}
+
+const LOG_TAIL_QUERY = `
+  query TailLogs($projectId: String!, $environmentId: String!, $serviceId: String!) {
+    logs(projectId: $projectId, environmentId: $environmentId, serviceId: $serviceId, filter: {}, limit: 500) {
+      edges {
+        node {
+          timestamp
+          message
+          severity
+        }
+      }
+    }
+  }
+`
+
+const HEARTBEAT_MS = 15000
+
+const sleep = (ms, signal) => new Promise((resolve) => {
+  const timer = setTimeout(resolve, ms)
+  signal?.addEventListener('abort', () => {
+    clearTimeout(timer)
+    resolve()
+  }, { once: true })
+})
+
+// Server-sent event stream of Railway log lines newer than `since` (ISO timestamp, exclusive).
+// Without `since` the stream opens with the lines upstream currently returns. `severities`
+// is a Set of lower-case levels to keep, or null for all. Each line's timestamp is its event
+// id, so a reconnecting EventSource resumes through Last-Event-ID.
+export const railwayLogStream = ({ since = null, severities = null, signal }) => {
+  const encoder = new TextEncoder()
+  const variables = {
+    projectId: process.env.RAILWAY_PROJECT_ID,
+    environmentId: process.env.RAILWAY_ENVIRONMENT_ID,
+    serviceId: process.env.RAILWAY_SERVICE_ID
+  }
+  let cancelled = false
+
+  return new ReadableStream({
+    async start(controller) {
+      // Lines are compared in milliseconds; `seen` remembers the lines already sent at the
+      // cursor millisecond so a poll that repeats them does not send them twice. null means
+      // every line at the cursor counts as sent, which makes `since` exclusive.
+      let cursor = since ? Date.parse(since) : -Infinity
+      let seen = null
+      let lastWrite = Date.now()
+
+      const send = (text) => {
+        controller.enqueue(encoder.encode(text))
+        lastWrite = Date.now()
+      }
+
+      while (!cancelled && !signal?.aborted) {
+        try {
+          const { value } = await railwayQuery(LOG_TAIL_QUERY, variables, { cache: railwayLogCache })
+          if (value.errors) {
+            send(`event: upstream-error\ndata: ${JSON.stringify(value.errors)}\n\n`)
+          }
+
+          const lines = (value.data?.logs?.edges || []).map(edge => edge.node)
+          let nextCursor = cursor
+          let nextSeen = seen
+          for (const line of lines) {
+            const at = Date.parse(line.timestamp)
+            const key = `${line.timestamp}|${line.message}`
+            if (at < cursor || (at === cursor && (seen === null || seen.has(key)))) continue
+
+            if (at > nextCursor) {
+              nextCursor = at
+              nextSeen = new Set()
+            }
+            if (at === nextCursor) nextSeen.add(key)
+            if (severities && !severities.has(String(line.severity).toLowerCase())) continue
+
+            send(`id: ${line.timestamp}\nevent: log\ndata: ${JSON.stringify(line)}\n\n`)
+          }
+          cursor = nextCursor
+          seen = nextSeen
+
+          if (Date.now() - lastWrite >= HEARTBEAT_MS) send(': keep-alive\n\n')
+        } catch (error) {
+          if (cancelled) break
+          console.error('Railway log tail error:', error)
+          send(`event: upstream-error\ndata: ${JSON.stringify({ message: error.message })}\n\n`)
+        }
+        await sleep(RAILWAY_LOG_POLL_MS, signal)
+      }
+      if (!cancelled) controller.close()
+    },
+    cancel() {
+      cancelled = true
+    }
+  })
+}
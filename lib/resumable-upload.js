@@ -0,0 +1,89 @@
+// Resumable uploads for large media, proxied to Supabase Storage's TUS endpoint. Supabase
+// assembles the object; each chunk is streamed through without being buffered here.
+
+const TUS_VERSION = '1.0.0'
+
+// Supabase only accepts 6 MB chunks (the last one may be shorter)
+export const RESUMABLE_CHUNK_BYTES = 6 * 1024 * 1024
+export const RESUMABLE_MAX_BYTES = Number(process.env.UPLOAD_RESUMABLE_MAX_BYTES) || 512 * 1024 * 1024
+
+// Upload ids are the last segment of the Location Supabase returns; they are put back into a
+// URL on our side, so only URL-safe characters are accepted
+const UPLOAD_ID_PATTERN = /^[A-Za-z0-9_\-=.+]+$/
+
+export class ResumableUploadError extends Error {
+  constructor(message, status) {
+    super(message)
+    this.status = status
+  }
+}
+
+const endpoint = () => `${process.env.SUPABASE_URL}/storage/v1/upload/resumable`
+
+const tusHeaders = (extra) => ({
+  'Authorization': `Bearer ${process.env.SUPABASE_SERVICE_ROLE_KEY}`,
+  'apikey': process.env.SUPABASE_SERVICE_ROLE_KEY,
+  'Tus-Resumable': TUS_VERSION,
+  ...extra
+})
+
+const uploadUrl = (id) => {
+  if (!UPLOAD_ID_PATTERN.test(id)) throw new ResumableUploadError('Invalid upload id', 400)
+  return `${endpoint()}/${id}`
+}
+
+const upstreamError = async (response, fallback) => {
+  const text = await response.text()
+  let message = fallback
+  try {
+    message = JSON.parse(text).message || fallback
+  } catch (error) {
+    if (text) message = text
+  }
+  return new ResumableUploadError(message, response.status === 404 ? 404 : response.status >= 500 ? 502 : response.status)
+}
+
+const base64 = (value) => Buffer.from(value).toString('base64')
+
+// Start an upload of `size` bytes; resolves to its id
+export const createResumableUpload = async ({ bucket, objectPath, contentType, size }) => {
+  const response = await fetch(endpoint(), {
+    method: 'POST',
+    headers: tusHeaders({
+      'Upload-Length': String(size),
+      'Upload-Metadata': [
+        `bucketName ${base64(bucket)}`,
+        `objectName ${base64(objectPath)}`,
+        `contentType ${base64(contentType)}`
+      ].join(',')
+    })
+  })
+  if (response.status !== 201) throw await upstreamError(response, 'Could not start upload')
+  return response.headers.get('location').split('/').pop()
+}
+
+// Resolves to { offset, size } so a client can resume after an interruption
+export const getResumableUpload = async (id) => {
+  const response = await fetch(uploadUrl(id), { method: 'HEAD', headers: tusHeaders() })
+  if (!response.ok) throw await upstreamError(response, 'Upload not found')
+  return {
+    offset: Number(response.headers.get('upload-offset')),
+    size: Number(response.headers.get('upload-length'))
+  }
+}
+
+// Stream one chunk starting at `offset`; resolves to the new offset
+export const appendResumableChunk = async (id, offset, body, length) => {
+  const response = await fetch(uploadUrl(id), {
+    method: 'PATCH',
+    headers: tusHeaders({
+      'Upload-Offset': String(offset),
+      'Content-Type': 'application/offset+octet-stream',
+      'Content-Length': String(length)
+    }),
+    body,
+    duplex: 'half'
+  })
+  if (response.status !== 204) throw await upstreamError(response, 'Chunk upload failed')
+  return Number(response.headers.get('upload-offset'))
+}
@@ -0,0 +1,99 @@
+// Revenue and completed-order series from the rollup tables of setup-analytics-rollups.sql.
+// A trigger on orders keeps one row per bucket current, so a range query reads at most one
+// row per bucket and never touches orders.
+import { supabase } from '@/lib/supabase'
+
+const HOUR_MS = 60 * 60 * 1000
+const DAY_MS = 24 * HOUR_MS
+
+export const SERIES_TIME_ZONE = 'Asia/Jakarta'
+
+// Daily buckets start at midnight in Jakarta, which has no daylight saving time. `span` is the
+// number of buckets returned when the request gives no `from`.
+export const SERIES_GRANULARITIES = {
+  hour: { table: 'order_rollups_hourly', size: HOUR_MS, offset: 0, span: 48 },
+  day: { table: 'order_rollups_daily', size: DAY_MS, offset: 7 * HOUR_MS, span: 30 }
+}
+
+// One row per bucket, and Supabase returns at most 1000 rows per request
+export const SERIES_MAX_BUCKETS = 1000
+
+// Error codes for a rollup table that does not exist yet
+export const ROLLUPS_MISSING_CODES = ['42P01', 'PGRST205']
+export const ROLLUPS_MISSING_MESSAGE = 'Analytics rollups are not installed, run setup-analytics-rollups.sql'
+
+const floorToBucket = (time, { size, offset }) => Math.floor((time + offset) / size) * size - offset
+
+const parseTime = (value) => {
+  const time = Date.parse(value)
+  return Number.isNaN(time) ? null : time
+}
+
+// Read `granularity`, `from` and `to` (exclusive) from the query string. Both ends are widened
+// to whole buckets; without `to` the series runs up to and including the current bucket.
+export const parseSeriesRange = (searchParams, now = Date.now()) => {
+  const granularity = searchParams.get('granularity') || 'day'
+  const spec = SERIES_GRANULARITIES[granularity]
+  if (!spec) {
+    return { error: `granularity must be one of ${Object.keys(SERIES_GRANULARITIES).join(', ')}` }
+  }
+
+  const toParam = searchParams.get('to')
+  const fromParam = searchParams.get('from')
+  const to = toParam === null ? now + 1 : parseTime(toParam)
+  const from = fromParam === null ? null : parseTime(fromParam)
+  if (to === null || (fromParam !== null && from === null)) {
+    return { error: 'from and to must be ISO 8601 timestamps' }
+  }
+
+  const end = floorToBucket(to - 1, spec) + spec.size
+  const start = from === null ? end - spec.span * spec.size : floorToBucket(from, spec)
+  if (start >= end) {
+    return { error: 'from must be before to' }
+  }
+
+  const buckets = (end - start) / spec.size
+  if (buckets > SERIES_MAX_BUCKETS) {
+    return { error: `Range covers ${buckets} ${granularity} buckets, at most ${SERIES_MAX_BUCKETS} are allowed` }
+  }
+
+  return { granularity, spec, start, end }
+}
+
+// The series for a range from parseSeriesRange: every bucket in order, empty ones as zeros
+export async function fetchSeries({ granularity, spec, start, end }) {
+  const { data, error } = await supabase
+    .from(spec.table)
+    .select('bucket, orders, revenue')
+    .gte('bucket', new Date(start).toISOString())
+    .lt('bucket', new Date(end).toISOString())
+    .order('bucket')
+
+  if (error) return { error }
+
+  const rows = new Map(data.map(row => [Date.parse(row.bucket), row]))
+  const buckets = []
+  const totals = { orders: 0, revenue: 0 }
+  for (let time = start; time < end; time += spec.size) {
+    const row = rows.get(time)
+    const bucket = {
+      bucket: new Date(time).toISOString(),
+      orders: Number(row?.orders) || 0,
+      revenue: Number(row?.revenue) || 0
+    }
+    totals.orders += bucket.orders
+    totals.revenue += bucket.revenue
+    buckets.push(bucket)
+  }
+
+  return {
+    data: {
+      granularity,
+      time_zone: SERIES_TIME_ZONE,
+      from: new Date(start).toISOString(),
+      to: new Date(end).toISOString(),
+      buckets,
+      totals
+    }
+  }
+}
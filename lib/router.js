@@ -0,0 +1,68 @@
+// Route table for the catch-all API route. Paths are compiled into a trie keyed by segment, so
+// matching walks one node per segment of the request path whatever the number of routes:
+//   route('GET', 'sellers/:id', handler, { auth: false })
+// A literal segment wins over a `:param` at the same position; when the literal branch has no
+// route for the method, the `:param` branch is tried instead.
+//
+// Per-route policies:
+//   auth - run requireAuth before the handler (default true); the handler gets `user`
+//   body - 'json' parses the request body before the handler and answers 400 when it is not
+//          JSON; 'none' (default) leaves the body unread for handlers that stream it
+
+const BODY_POLICIES = ['json', 'none']
+
+const createNode = () => ({ literals: new Map(), param: null, paramName: null, methods: new Map() })
+
+export const route = (method, pattern, handler, { auth = true, body = 'none' } = {}) => {
+  if (!BODY_POLICIES.includes(body)) throw new Error(`Unknown body policy ${body} for ${pattern}`)
+  return { method, pattern, handler, auth, body }
+}
+
+// Compile `routes` into a matcher: match(method, segments) resolves to { route, params } or null
+export function createRouter(routes) {
+  const root = createNode()
+
+  for (const entry of routes) {
+    let node = root
+    for (const segment of entry.pattern.split('/').filter(Boolean)) {
+      if (segment.startsWith(':')) {
+        const name = segment.slice(1)
+        if (node.param && node.paramName !== name) {
+          throw new Error(`Conflicting parameter names :${node.paramName} and :${name} in ${entry.pattern}`)
+        }
+        node.param = node.param || createNode()
+        node.paramName = name
+        node = node.param
+      } else {
+        if (!node.literals.has(segment)) node.literals.set(segment, createNode())
+        node = node.literals.get(segment)
+      }
+    }
+    if (node.methods.has(entry.method)) throw new Error(`Duplicate route ${entry.method} ${entry.pattern}`)
+    node.methods.set(entry.method, entry)
+  }
+
+  const find = (node, method, segments, depth, values) => {
+    if (depth === segments.length) return node.methods.get(method) || null
+    const literal = node.literals.get(segments[depth])
+    if (literal) {
+      const found = find(literal, method, segments, depth + 1, values)
+      if (found) return found
+    }
+    if (node.param) {
+      values.push([node.paramName, segments[depth]])
+      const found = find(node.param, method, segments, depth + 1, values)
+      if (found) return found
+      values.pop()
+    }
+    return null
+  }
+
+  return {
+    match(method, segments) {
+      const values = []
+      const matched = find(root, method, segments, 0, values)
+      return matched ? { route: matched, params: Object.fromEntries(values) } : null
+    }
+  }
+}
@@ -0,0 +1,108 @@
+// Server-side search, filters and sort for the sellers and events lists:
+//   ?search=<text>&status=<value>&sort=<column> (ascending) or sort=-<column> (descending)
+// Text search is a case-insensitive substring match over a few columns, which the trigram
+// indexes in setup-search-indexes.sql serve without scanning the table.
+
+const MAX_SEARCH_LENGTH = 100
+
+const EVENT_STATUSES = ['upcoming', 'active', 'ended']
+
+export const LIST_QUERIES = {
+  sellers: {
+    searchColumns: ['name', 'store_name', 'email'],
+    sorts: {
+      created_at: {},
+      updated_at: {},
+      name: { nullable: true },
+      store_name: { nullable: true }
+    },
+    filters: {
+      // status=active or status=active,inactive
+      status: (query, value) => query.in('status', value.split(',').map(status => status.trim())),
+      provinsi: (query, value) => query.eq('provinsi', value),
+      delivery: (query, value) => {
+        if (value !== 'true' && value !== 'false') return null
+        return query.eq('is_delivery_available', value === 'true')
+      }
+    }
+  },
+  events: {
+    searchColumns: ['title', 'description'],
+    sorts: {
+      created_at: {},
+      start_time: {},
+      end_time: {},
+      title: { nullable: true }
+    },
+    // status compares these columns with the time of the request, so the rows it keeps change
+    // whenever the clock reaches a value in one of them
+    clockColumns: { status: ['start_time', 'end_time'] },
+    filters: {
+      // Same buckets as the dashboard's status badge
+      status: (query, value, now) => {
+        if (value === 'upcoming') return query.gt('start_time', now)
+        if (value === 'active') return query.lte('start_time', now).gte('end_time', now)
+        if (value === 'ended') return query.lt('end_time', now)
+        return null
+      }
+    }
+  }
+}
+
+const DEFAULT_SORT = { column: 'created_at', ascending: false, nullable: false }
+
+// Read search, filter and sort params for the list described by `spec`; resolves to
+// { search, filters, sort, now } or { error }. Filters compare against `now`, the time of
+// the request.
+export const parseListQuery = (searchParams, spec) => {
+  const search = (searchParams.get('search') || '').trim()
+  if (search.length > MAX_SEARCH_LENGTH) {
+    return { error: `search must be at most ${MAX_SEARCH_LENGTH} characters` }
+  }
+
+  const filters = []
+  for (const name of Object.keys(spec.filters)) {
+    const value = searchParams.get(name)
+    if (value) filters.push([name, value])
+  }
+
+  let sort = DEFAULT_SORT
+  const sortParam = searchParams.get('sort')
+  if (sortParam) {
+    const column = sortParam.replace(/^-/, '')
+    if (!Object.hasOwn(spec.sorts, column)) {
+      return { error: `sort must be one of ${Object.keys(spec.sorts).join(', ')}, optionally prefixed with -` }
+    }
+    sort = { column, ascending: !sortParam.startsWith('-'), nullable: Boolean(spec.sorts[column].nullable) }
+  }
+
+  return { search, filters, sort, now: new Date().toISOString() }
+}
+
+// Columns whose values the applied filters compare with the clock; empty when the rows do not
+// depend on the time of the request
+export const listClockColumns = (listQuery, spec) =>
+  listQuery.filters.flatMap(([name]) => spec.clockColumns?.[name] || [])
+
+// ILIKE pattern matching `text` anywhere. LIKE wildcards in the text are escaped; `*` is
+// PostgREST's wildcard and cannot be escaped, so it is dropped. The pattern is quoted for
+// the filter string, where backslashes and quotes are escaped once more.
+const containsPattern = (text) => {
+  const escaped = text.replace(/\*/g, '').replace(/[\\%_]/g, '\\$&')
+  return `"*${escaped.replace(/["\\]/g, '\\$&')}*"`
+}
+
+// Apply a parsed list query's search and filters; resolves to { query } or { error } when a
+// filter value is not accepted
+export const applyListQuery = (query, listQuery, spec) => {
+  if (listQuery.search.replace(/\*/g, '')) {
+    const pattern = containsPattern(listQuery.search)
+    query = query.or(spec.searchColumns.map(column => `${column}.ilike.${pattern}`).join(','))
+  }
+  for (const [name, value] of listQuery.filters) {
+    const filtered = spec.filters[name](query, value, listQuery.now)
+    if (!filtered) return { error: `Invalid ${name} filter: ${value}` }
+    query = filtered
+  }
+  return { query }
+}
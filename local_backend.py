@@ -0,0 +1,1260 @@
+#!/usr/bin/env python3
+"""
+Local stand-in backend for the Admin Dashboard API tests
+Fakes the Supabase REST/storage surface used by app/api/[[...path]]/route.js and the
+Railway GraphQL API, with configurable injected latency, and can run the Next.js server
+against them so the suite and benchmarks run offline on a single machine.
+"""
+
+import base64
+import bisect
+import json
+import os
+import random
+import re
+import shlex
+import signal
+import socket
+import subprocess
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qsl, unquote
+
+import requests
+
+# Tables served by the fake PostgREST endpoint
+TABLES = [
+    'superadmin',
+    'sellers',
+    'categories',
+    'events',
+    'users',
+    'products',
+    'product_variants',
+    'orders',
+    'seller_balances',
+    'seller_balance_transactions',
+    'seller_deletion_requests',
+    'order_rollups_hourly',
+    'order_rollups_daily',
+]
+
+# Daily rollup buckets start at midnight Asia/Jakarta (UTC+7, no daylight saving time)
+JAKARTA_OFFSET = timedelta(hours=7)
+
+def hour_bucket(created_at):
+    return created_at[:13] + ':00:00.000000+00:00'
+
+def jakarta_day_bucket(created_at):
+    local = datetime.fromisoformat(created_at) + JAKARTA_OFFSET
+    return format_timestamp(local.replace(hour=0, minute=0, second=0, microsecond=0) - JAKARTA_OFFSET)
+
+# Rollup table -> bucket of a normalised created_at, as in setup-analytics-rollups.sql
+ROLLUP_BUCKETS = {
+    'order_rollups_hourly': hour_bucket,
+    'order_rollups_daily': jakarta_day_bucket,
+}
+
+# Tables setup-bulk.sql's functions write
+BULK_TABLES = ['sellers', 'categories', 'events']
+
+# Unique constraints enforced on insert/update: table -> columns
+UNIQUE_COLUMNS = {
+    'superadmin': ['username', 'email'],
+}
+
+STORAGE_BUCKETS = ['uploads', 'category-images', 'event-banners']
+
+SINGLE_OBJECT_MEDIA_TYPE = 'application/vnd.pgrst.object+json'
+
+# Supabase's default max_rows: PostgREST never returns more rows than this from a read,
+# whatever limit the request asks for
+DEFAULT_MAX_ROWS = 1000
+
+def free_port():
+    """Ask the OS for an unused localhost port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def now_timestamp():
+    return format_timestamp(datetime.now(timezone.utc))
+
+def format_timestamp(value):
+    """Postgres timestamptz output format, fixed width so string order matches time order"""
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f+00:00')
+
+TIMESTAMP_PREFIX = re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:')
+
+def normalize_timestamp(value):
+    """Canonical form of an ISO timestamp, or the value unchanged when it is not one"""
+    if not isinstance(value, str) or not TIMESTAMP_PREFIX.match(value):
+        return value
+    if len(value) == 32 and value[10] == 'T' and value.endswith('+00:00'):
+        return value
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return value
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return format_timestamp(parsed)
+
+class PostgrestError(Exception):
+    """Error returned to the client in PostgREST's JSON error format"""
+
+    def __init__(self, status, code, message, details=None):
+        super().__init__(message)
+        self.status = status
+        self.body = {'code': code, 'message': message, 'details': details, 'hint': None}
+
+class LatencyInjector:
+    """Sleeps a fixed delay plus seeded random jitter before each response"""
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def delay(self):
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        total = (self.latency_ms + jitter) / 1000
+        if total > 0:
+            time.sleep(total)
+
+# --- PostgREST filter parsing ---------------------------------------------------------
+
+def split_top_level(text, separator=','):
+    """Split on separators that are outside parentheses and double quotes"""
+    parts = []
+    depth = 0
+    quoted = False
+    escaped = False
+    current = ''
+    for char in text:
+        if escaped:
+            escaped = False
+        elif quoted and char == '\\':
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        if char == separator and depth == 0 and not quoted:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    parts.append(current)
+    return parts
+
+def unquote_value(value):
+    """Strip PostgREST double quotes, in which a backslash escapes the next character"""
+    if len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return re.sub(r'\\(.)', r'\1', value[1:-1])
+    return value
+
+def like_pattern(pattern, ignore_case):
+    """Regex for a LIKE pattern after PostgREST's `*` -> `%`; backslash escapes a wildcard"""
+    parts = []
+    characters = iter(pattern)
+    for char in characters:
+        if char == '\\':
+            parts.append(re.escape(next(characters, '\\')))
+        elif char in '*%':
+            parts.append('.*')
+        elif char == '_':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+    return re.compile(f"^{''.join(parts)}$", re.DOTALL | (re.IGNORECASE if ignore_case else 0))
+
+def parse_condition(column, expression):
+    """Build a predicate from a `column=op.value` filter"""
+    negate = False
+    if expression.startswith('not.'):
+        negate = True
+        expression = expression[4:]
+    operator, _, value = expression.partition('.')
+
+    if operator == 'in':
+        values = [unquote_value(item) for item in split_top_level(value.strip()[1:-1])]
+        # Text compares equal exactly when the normalised forms match, so a set lookup will do
+        texts = {normalize_timestamp(item) for item in values}
+
+        def predicate(row):
+            actual = row.get(column)
+            if isinstance(actual, str):
+                return normalize_timestamp(actual) in texts
+            return any(compare(actual, item) == 0 for item in values)
+    elif operator == 'is':
+        expected = {'null': None, 'true': True, 'false': False}[value]
+        predicate = lambda row: row.get(column) is expected
+    elif operator in ('like', 'ilike'):
+        regex = like_pattern(unquote_value(value), operator == 'ilike')
+        predicate = lambda row: row.get(column) is not None and bool(regex.match(str(row.get(column))))
+    elif operator in ('eq', 'neq', 'lt', 'lte', 'gt', 'gte'):
+        value = unquote_value(value)
+        check = {
+            'eq': lambda result: result == 0,
+            'neq': lambda result: result != 0,
+            'lt': lambda result: result < 0,
+            'lte': lambda result: result <= 0,
+            'gt': lambda result: result > 0,
+            'gte': lambda result: result >= 0,
+        }[operator]
+        predicate = lambda row: row.get(column) is not None and check(compare(row.get(column), value))
+    else:
+        raise PostgrestError(400, 'PGRST100', f'unsupported operator "{operator}"')
+
+    return (lambda row: not predicate(row)) if negate else predicate
+
+def parse_logic_tree(operator, body):
+    """Build a predicate from an `or=(...)` / `and=(...)` logic tree"""
+    predicates = []
+    for item in split_top_level(body.strip()[1:-1]):
+        item = item.strip()
+        match = re.match(r'^(not\.)?(and|or)(\(.*\))$', item)
+        if match:
+            nested = parse_logic_tree(match.group(2), match.group(3))
+            predicates.append((lambda row, nested=nested: not nested(row)) if match.group(1) else nested)
+        else:
+            column, _, expression = item.partition('.')
+            predicates.append(parse_condition(column, expression))
+    combine = any if operator == 'or' else all
+    return lambda row: combine(predicate(row) for predicate in predicates)
+
+# The filter lib/pagination.js applyKeyset() adds after a cursor
+KEYSET_FILTER = re.compile(r'^\((\w+)\.lt\."([^"]*)",and\(\1\.eq\."\2",id\.lt\."([^"]*)"\)\)$')
+
+def compare(actual, expected):
+    """Compare a stored value with a filter string the way Postgres would for its type"""
+    if isinstance(actual, bool):
+        expected_value = str(expected).lower() == 'true'
+        return (actual > expected_value) - (actual < expected_value)
+    if isinstance(actual, (int, float)):
+        try:
+            number = float(expected)
+        except (TypeError, ValueError):
+            return (str(actual) > str(expected)) - (str(actual) < str(expected))
+        return (actual > number) - (actual < number)
+    actual_text = normalize_timestamp(str(actual))
+    expected_text = normalize_timestamp(str(expected))
+    return (actual_text > expected_text) - (actual_text < expected_text)
+
+# --- Fake Supabase ----------------------------------------------------------------------
+
+class FakeSupabase:
+    """In-memory tables plus the PostgREST, RPC and storage routes that route.js calls"""
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, seed=0, max_rows=DEFAULT_MAX_ROWS):
+        self.tables = {name: [] for name in TABLES}
+        # None serves every matching row
+        self.max_rows = max_rows
+        self.storage = {bucket: {} for bucket in STORAGE_BUCKETS}
+        self.resumable = {}
+        self.rpc_functions = {
+            'admin_analytics_summary': self.analytics_summary,
+            'admin_bulk_update': self.bulk_update,
+            'admin_bulk_delete': self.bulk_delete,
+        }
+        self.latency = LatencyInjector(latency_ms, jitter_ms, seed)
+        self.lock = threading.RLock()
+        self.request_counts = {}
+        # Bumped on every write; ordered indexes are rebuilt when their table's version moves
+        self.versions = {name: 0 for name in TABLES}
+        self.indexes = {}
+        # Rollup table -> bucket -> its row in self.tables, for the orders trigger
+        self.rollups = {table: {} for table in ROLLUP_BUCKETS}
+        self.server = None
+        self.url = None
+
+    # Request accounting
+
+    def count_request(self, key):
+        with self.lock:
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+    def reset_counts(self):
+        with self.lock:
+            self.request_counts = {}
+
+    def total_requests(self, prefix=''):
+        with self.lock:
+            return sum(count for key, count in self.request_counts.items() if key.startswith(prefix))
+
+    # Data access
+
+    def insert_rows(self, table, rows):
+        """Insert rows applying column defaults and unique constraints, returns the stored rows.
+        
+        All-or-nothing like a single INSERT statement: a violation stores none of the rows.
+        """
+        with self.lock:
+            # Values already taken per unique column, including those earlier in this batch
+            taken = {column: {row.get(column) for row in self.tables[table]}
+                     for column in UNIQUE_COLUMNS.get(table, []) + ['id']}
+            stored = []
+            # One statement, one now(), as in Postgres
+            timestamp = now_timestamp()
+            for row in rows:
+                row = {key: normalize_timestamp(value) if key.endswith('_at') else value
+                       for key, value in row.items()}
+                if row.get('id') is None:
+                    row['id'] = str(uuid.uuid4())
+                row.setdefault('created_at', timestamp)
+                row.setdefault('updated_at', timestamp)
+                for column, values in taken.items():
+                    if row.get(column) is not None and row[column] in values:
+                        raise self._unique_violation(table, column, row[column])
+                    values.add(row.get(column))
+                stored.append(row)
+            self.tables[table].extend(stored)
+            self.versions[table] += 1
+            if table == 'orders':
+                for row in stored:
+                    self._order_rollups(None, row)
+            return [dict(row) for row in stored]
+
+    def _order_rollups(self, old, new):
+        """The orders trigger from setup-analytics-rollups.sql: a completed order leaves its
+        buckets when it changes or goes away, and enters them when it is or becomes completed"""
+        for row, sign in ((old, -1), (new, 1)):
+            if not row or row.get('status') != 'diterima':
+                continue
+            revenue = sign * float(row.get('total_price') or 0)
+            created_at = normalize_timestamp(row['created_at'])
+            for table, bucket_of in ROLLUP_BUCKETS.items():
+                bucket = bucket_of(created_at)
+                rollup = self.rollups[table].get(bucket)
+                if rollup is None:
+                    rollup = {'bucket': bucket, 'orders': 0, 'revenue': 0.0}
+                    self.rollups[table][bucket] = rollup
+                    self.tables[table].append(rollup)
+                rollup['orders'] += sign
+                rollup['revenue'] += revenue
+                self.versions[table] += 1
+
+    def _ordered_index(self, table, column):
+        """Rows ascending by (column, id) like a btree index, or None unless every row has a
+        text value in `column`; cached until the table changes"""
+        cached = self.indexes.get((table, column))
+        if cached and cached[0] == self.versions[table]:
+            return cached[1]
+        rows = self.tables[table]
+        if all(isinstance(row.get(column), str) for row in rows):
+            index = sorted(rows, key=lambda row: (normalize_timestamp(row[column]), row['id']))
+        else:
+            index = None
+        self.indexes[(table, column)] = (self.versions[table], index)
+        return index
+
+    def _keyset_page(self, table, order, keyset, matches, limit, offset):
+        """Serve an `order=<column>.desc,id.desc` page, optionally after a keyset cursor, from
+        the ordered index instead of filtering and sorting the whole table; None when the
+        index cannot be used"""
+        column = order.split(',')[0].split('.')[0]
+        if order != f"{column}.desc,id.desc" or (keyset and keyset[0] != column):
+            return None
+        index = self._ordered_index(table, column)
+        if index is None:
+            return None
+        end = len(index)
+        if keyset:
+            end = bisect.bisect_left(index, (normalize_timestamp(keyset[1]), keyset[2]),
+                                     key=lambda row: (normalize_timestamp(row[column]), row['id']))
+        rows = []
+        for position in range(end - 1, -1, -1):
+            if matches(index[position]):
+                rows.append(index[position])
+                if len(rows) == offset + limit:
+                    break
+        return rows[offset:]
+
+    @staticmethod
+    def _unique_violation(table, column, value):
+        return PostgrestError(409, '23505', f'duplicate key value violates unique constraint "{table}_{column}_key"',
+                              f'Key ({column})=({value}) already exists.')
+
+    def analytics_summary(self, params):
+        """admin_analytics_summary() from setup-analytics.sql"""
+        with self.lock:
+            return {
+                'sellers': len(self.tables['sellers']),
+                'categories': len(self.tables['categories']),
+                'events': len(self.tables['events']),
+                'users': len(self.tables['users']),
+                'products': len(self.tables['products']),
+                'variants': len(self.tables['product_variants']),
+                'orders': len(self.tables['orders']),
+                'revenue': round(sum(float(order.get('total_price') or 0)
+                                     for order in self.tables['orders'] if order.get('status') == 'diterima'), 2)
+            }
+
+    @staticmethod
+    def _bulk_table(table):
+        if table not in BULK_TABLES:
+            raise PostgrestError(403, '42501', f'Bulk writes are not allowed on {table}')
+
+    def bulk_update(self, params):
+        """admin_bulk_update() from setup-bulk.sql: one UPDATE, so a conflict changes no row"""
+        table = params['p_table']
+        self._bulk_table(table)
+        updated_at = normalize_timestamp(params['p_updated_at'])
+        with self.lock:
+            by_id = {row['id']: row for row in self.tables[table]}
+            changes = {}
+            for item in params['p_items']:
+                if item['id'] in by_id:
+                    changes[item['id']] = {key: normalize_timestamp(value) if key.endswith('_at') else value
+                                           for key, value in item.items() if key != 'id'}
+                    changes[item['id']]['updated_at'] = updated_at
+            # Unique columns are checked against the table as the statement leaves it
+            for column in UNIQUE_COLUMNS.get(table, []):
+                taken = set()
+                for row in self.tables[table]:
+                    value = changes.get(row['id'], {}).get(column, row.get(column))
+                    if value is not None and value in taken:
+                        raise self._unique_violation(table, column, value)
+                    taken.add(value)
+            for row_id, change in changes.items():
+                by_id[row_id].update(change)
+            if changes:
+                self.versions[table] += 1
+            return list(changes)
+
+    def bulk_delete(self, params):
+        """admin_bulk_delete() from setup-bulk.sql"""
+        table = params['p_table']
+        self._bulk_table(table)
+        ids = set(params['p_ids'])
+        with self.lock:
+            deleted = [row['id'] for row in self.tables[table] if row['id'] in ids]
+            if deleted:
+                self.tables[table] = [row for row in self.tables[table] if row['id'] not in ids]
+                self.versions[table] += 1
+            return deleted
+
+    # PostgREST
+
+    def handle_rest(self, method, table, params, headers, body):
+        """Serve /rest/v1/<table>; returns (status, headers, body)"""
+        if table not in self.tables:
+            raise PostgrestError(404, '42P01', f'relation "public.{table}" does not exist')
+
+        prefer = headers.get('Prefer', '')
+        filters = []
+        select = '*'
+        order = None
+        limit = None
+        offset = 0
+        on_conflict = None
+        keyset = None
+        for key, value in params:
+            if key == 'select':
+                select = value
+            elif key == 'order':
+                order = value
+            elif key == 'limit':
+                limit = int(value)
+            elif key == 'offset':
+                offset = int(value)
+            elif key == 'on_conflict':
+                on_conflict = value
+            elif key == 'or' and KEYSET_FILTER.match(value) and keyset is None:
+                keyset = KEYSET_FILTER.match(value).groups() + (parse_logic_tree(key, value),)
+            elif key in ('or', 'and'):
+                filters.append(parse_logic_tree(key, value))
+            elif key == 'columns':
+                continue
+            else:
+                filters.append(parse_condition(key, value))
+
+        matches = lambda row: all(predicate(row) for predicate in filters)
+
+        with self.lock:
+            rows = None
+            if method == 'GET' and order and limit is not None and 'count=exact' not in prefer:
+                rows = self._keyset_page(table, order, keyset, matches, limit, offset)
+            if rows is None and keyset:
+                filters.append(keyset[3])
+
+            if rows is not None:
+                total = len(rows)
+            elif method in ('GET', 'HEAD'):
+                rows = [row for row in self.tables[table] if matches(row)]
+                rows = self._order(rows, order)
+                total = len(rows)
+                rows = rows[offset:offset + limit if limit is not None else None]
+            elif method == 'POST':
+                payload = body if isinstance(body, list) else [body]
+                if on_conflict or 'resolution=merge-duplicates' in prefer:
+                    rows = self._upsert(table, payload, (on_conflict or 'id').split(','))
+                else:
+                    rows = self.insert_rows(table, payload)
+                total = len(rows)
+            elif method == 'PATCH':
+                changes = {key: normalize_timestamp(value) if key.endswith('_at') else value
+                           for key, value in body.items()}
+                targets = [row for row in self.tables[table] if matches(row)]
+                # Only the updated unique columns can start to conflict; checked before any row changes
+                for column in UNIQUE_COLUMNS.get(table, []) + ['id']:
+                    if column in changes and changes[column] is not None and targets:
+                        if len(targets) > 1 or any(other is not targets[0] and other.get(column) == changes[column]
+                                                   for other in self.tables[table]):
+                            raise self._unique_violation(table, column, changes[column])
+                for row in targets:
+                    before = dict(row) if table == 'orders' else None
+                    row.update(changes)
+                    if before:
+                        self._order_rollups(before, row)
+                rows = [dict(row) for row in targets]
+                total = len(rows)
+            elif method == 'DELETE':
+                rows = [row for row in self.tables[table] if matches(row)]
+                self.tables[table] = [row for row in self.tables[table] if not matches(row)]
+                total = len(rows)
+                if table == 'orders':
+                    for row in rows:
+                        self._order_rollups(row, None)
+            else:
+                raise PostgrestError(405, 'PGRST000', f'method {method} not supported')
+            if method not in ('GET', 'HEAD'):
+                self.versions[table] += 1
+            elif self.max_rows is not None:
+                rows = rows[:self.max_rows]
+
+            rows = [self._project(row, select) for row in rows]
+
+        response_headers = {}
+        if 'count=exact' in prefer:
+            end = f"{offset}-{offset + len(rows) - 1}" if rows else '*'
+            response_headers['Content-Range'] = f"{end}/{total}"
+
+        status = 201 if method == 'POST' else 200
+        if method != 'GET' and 'return=representation' not in prefer:
+            return (201 if method == 'POST' else 204), response_headers, None
+
+        if SINGLE_OBJECT_MEDIA_TYPE in headers.get('Accept', ''):
+            if len(rows) != 1:
+                raise PostgrestError(406, 'PGRST116', 'JSON object requested, multiple (or no) rows returned',
+                                     f'The result contains {len(rows)} rows')
+            return status, response_headers, rows[0]
+        return status, response_headers, rows
+
+    def _upsert(self, table, payload, conflict_columns):
+        stored = []
+        for row in payload:
+            existing = next((candidate for candidate in self.tables[table]
+                             if all(candidate.get(column) == row.get(column) for column in conflict_columns)
+                             and all(row.get(column) is not None for column in conflict_columns)), None)
+            if existing:
+                before = dict(existing) if table == 'orders' else None
+                existing.update({key: normalize_timestamp(value) if key.endswith('_at') else value
+                                 for key, value in row.items()})
+                if before:
+                    self._order_rollups(before, existing)
+                stored.append(dict(existing))
+            else:
+                stored.extend(self.insert_rows(table, [row]))
+        return stored
+
+    @staticmethod
+    def _order(rows, order):
+        if not order:
+            return list(rows)
+        rows = list(rows)
+        # Apply sort keys from last to first so the first key wins (stable sort)
+        for term in reversed(order.split(',')):
+            parts = term.split('.')
+            column = parts[0]
+            descending = 'desc' in parts[1:]
+            nulls_first = 'nullsfirst' in parts[1:] or ('nullslast' not in parts[1:] and descending)
+            present = [row for row in rows if row.get(column) is not None]
+            missing = [row for row in rows if row.get(column) is None]
+            present.sort(key=lambda row: sort_key(row.get(column)), reverse=descending)
+            rows = missing + present if nulls_first else present + missing
+        return rows
+
+    @staticmethod
+    def _project(row, select):
+        if not select or select == '*':
+            return dict(row)
+        columns = [column.strip() for column in split_top_level(select) if column.strip()]
+        if '*' in columns:
+            return dict(row)
+        projected = {}
+        for column in columns:
+            # `alias:column` renames a column
+            alias, _, name = column.rpartition(':')
+            name = name.split('::')[0]
+            projected[alias or name] = row.get(name)
+        return projected
+
+    # Storage
+
+    def handle_storage(self, method, path, headers, body):
+        """Serve /storage/v1/...; returns (status, headers, body)"""
+        parts = [unquote(part) for part in path.split('/') if part]
+        if method in ('GET', 'HEAD') and parts[:2] == ['object', 'public'] and len(parts) >= 4:
+            bucket, key = parts[2], '/'.join(parts[3:])
+            stored = self.storage.get(bucket, {}).get(key)
+            if stored is None:
+                return 404, {}, {'statusCode': '404', 'error': 'not_found', 'message': 'Object not found'}
+            return 200, {'Content-Type': stored['content_type']}, stored['data']
+
+        if method in ('POST', 'PUT') and parts[:1] == ['object'] and len(parts) >= 3:
+            bucket, key = parts[1], '/'.join(parts[2:])
+            if bucket not in self.storage:
+                return 400, {}, {'statusCode': '404', 'error': 'Bucket not found', 'message': 'Bucket not found'}
+            with self.lock:
+                if key in self.storage[bucket] and method == 'POST' and headers.get('x-upsert') != 'true':
+                    return 400, {}, {'statusCode': '409', 'error': 'Duplicate', 'message': 'The resource already exists'}
+                self.storage[bucket][key] = {
+                    'data': body or b'',
+                    'content_type': headers.get('Content-Type', 'application/octet-stream')
+                }
+            return 200, {}, {'Key': f"{bucket}/{key}", 'Id': str(uuid.uuid4())}
+
+        if parts[:2] == ['upload', 'resumable']:
+            return self.handle_tus(method, parts[2:], headers, body)
+
+        return 404, {}, {'statusCode': '404', 'error': 'not_found', 'message': 'Route not found'}
+
+    def handle_tus(self, method, parts, headers, body):
+        """TUS 1.0 resumable uploads: create, HEAD for the offset, PATCH to append"""
+        tus = {'Tus-Resumable': '1.0.0'}
+        if method == 'POST' and not parts:
+            metadata = {}
+            for item in (headers.get('Upload-Metadata') or '').split(','):
+                key, _, value = item.strip().partition(' ')
+                metadata[key] = base64.b64decode(value).decode() if value else ''
+            bucket = metadata.get('bucketName')
+            if bucket not in self.storage:
+                return 400, tus, {'statusCode': '404', 'error': 'Bucket not found', 'message': 'Bucket not found'}
+            upload_id = uuid.uuid4().hex
+            with self.lock:
+                self.resumable[upload_id] = {
+                    'bucket': bucket,
+                    'key': metadata.get('objectName'),
+                    'content_type': metadata.get('contentType') or 'application/octet-stream',
+                    'length': int(headers.get('Upload-Length')),
+                    'data': bytearray()
+                }
+            return 201, dict(tus, Location=f"{self.url}/storage/v1/upload/resumable/{upload_id}"), None
+
+        upload = self.resumable.get(parts[0]) if len(parts) == 1 else None
+        if upload is None:
+            return 404, tus, {'statusCode': '404', 'error': 'not_found', 'message': 'Upload not found'}
+
+        if method == 'HEAD':
+            return 200, dict(tus, **{'Upload-Offset': str(len(upload['data'])),
+                                     'Upload-Length': str(upload['length']),
+                                     'Cache-Control': 'no-store'}), None
+
+        if method == 'PATCH':
+            with self.lock:
+                if int(headers.get('Upload-Offset', -1)) != len(upload['data']):
+                    return 409, tus, {'statusCode': '409', 'error': 'conflict', 'message': 'Upload-Offset mismatch'}
+                if len(upload['data']) + len(body or b'') > upload['length']:
+                    return 413, tus, {'statusCode': '413', 'error': 'too_large', 'message': 'Chunk exceeds Upload-Length'}
+                upload['data'].extend(body or b'')
+                if len(upload['data']) == upload['length']:
+                    self.storage[upload['bucket']][upload['key']] = {
+                        'data': bytes(upload['data']),
+                        'content_type': upload['content_type']
+                    }
+                return 204, dict(tus, **{'Upload-Offset': str(len(upload['data']))}), None
+
+        return 405, tus, None
+
+    # HTTP
+
+    def start(self, port=0):
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(self.dispatch))
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def dispatch(self, method, path, params, headers, raw_body):
+        self.latency.delay()
+        try:
+            if path.startswith('/rest/v1/rpc/'):
+                name = path[len('/rest/v1/rpc/'):]
+                self.count_request(f"rpc {name}")
+                function = self.rpc_functions.get(name)
+                if function is None:
+                    raise PostgrestError(404, 'PGRST202', f'Could not find the function public.{name} in the schema cache')
+                return 200, {}, function(json.loads(raw_body or b'{}'))
+
+            if path.startswith('/rest/v1/'):
+                table = path[len('/rest/v1/'):].strip('/')
+                self.count_request(f"rest {method} {table}")
+                body = json.loads(raw_body) if raw_body else None
+                return self.handle_rest(method, table, params, headers, body)
+
+            if path.startswith('/storage/v1/'):
+                self.count_request(f"storage {method}")
+                return self.handle_storage(method, path[len('/storage/v1/'):], headers, raw_body)
+
+            return 404, {}, {'message': 'no Route matched with those values'}
+        except PostgrestError as error:
+            return error.status, {}, error.body
+
+def sort_key(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value, '')
+    return (1, 0, normalize_timestamp(str(value)))
+
+# --- Fake Railway -----------------------------------------------------------------------
+
+class FakeRailway:
+    """Railway GraphQL v2 stand-in: project status, service metrics and a growing log stream"""
+
+    SEVERITIES = ['info', 'info', 'info', 'warn', 'error']
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, seed=0, log_interval=0.05):
+        self.latency = LatencyInjector(latency_ms, jitter_ms, seed)
+        self.log_interval = log_interval
+        self.started_at = datetime.now(timezone.utc)
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.operations = {}
+        self.server = None
+        self.url = None
+
+    def reset_counts(self):
+        with self.lock:
+            self.request_count = 0
+            self.operations = {}
+
+    def log_lines(self, until=None):
+        """Deterministic log lines: one every `log_interval` seconds since start-up"""
+        until = until or datetime.now(timezone.utc)
+        count = int((until - self.started_at).total_seconds() / self.log_interval)
+        lines = []
+        for index in range(count):
+            lines.append({
+                'timestamp': format_timestamp(self.started_at + timedelta(seconds=index * self.log_interval)),
+                'message': f"request {index} handled",
+                'severity': self.SEVERITIES[index % len(self.SEVERITIES)]
+            })
+        return lines
+
+    def resolve(self, query, variables):
+        """Answer the operations the dashboard sends; anything else gets an empty data object"""
+        if re.search(r'\blogs\s*\(', query):
+            limit_match = re.search(r'limit:\s*(\d+)', query)
+            limit = int(limit_match.group(1)) if limit_match else 100
+            lines = self.log_lines()[-limit:]
+            return {'data': {'logs': {'edges': [{'node': line} for line in lines]}}}
+
+        if re.search(r'\bproject\s*\(', query):
+            deployment = {'id': 'deployment-local', 'status': 'SUCCESS',
+                          'createdAt': format_timestamp(self.started_at)}
+            return {'data': {'project': {
+                'id': variables.get('projectId', 'project-local'),
+                'name': 'local-project',
+                'environments': {'nodes': [{
+                    'id': 'environment-local',
+                    'name': 'production',
+                    'deployments': {'edges': [{'node': deployment}]}
+                }]}
+            }}}
+
+        if re.search(r'\bserviceInstance\s*\(', query):
+            return {'data': {'serviceInstance': {
+                'id': 'service-instance-local',
+                'serviceName': 'admin-web',
+                'latestDeployment': {'id': 'deployment-local', 'status': 'SUCCESS',
+                                     'createdAt': format_timestamp(self.started_at)}
+            }}}
+
+        return {'data': {}}
+
+    def start(self, port=0):
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(self.dispatch))
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}/graphql/v2"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def dispatch(self, method, path, params, headers, raw_body):
+        if method != 'POST' or path != '/graphql/v2':
+            self.latency.delay()
+            return 404, {}, {'errors': [{'message': 'Not found'}]}
+
+        payload = json.loads(raw_body or b'{}')
+        query = payload.get('query') or ''
+        name_match = re.search(r'(?:query|mutation)\s+(\w+)', query)
+        operation = name_match.group(1) if name_match else 'anonymous'
+        # Counted on arrival so callers see requests that are still waiting on injected latency
+        with self.lock:
+            self.request_count += 1
+            self.operations[operation] = self.operations.get(operation, 0) + 1
+        self.latency.delay()
+        return 200, {}, self.resolve(query, payload.get('variables') or {})
+
+# --- HTTP plumbing ----------------------------------------------------------------------
+
+def make_handler(dispatch):
+    """BaseHTTPRequestHandler subclass that hands parsed requests to `dispatch`"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _read_body(self):
+            if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+                chunks = []
+                while True:
+                    size = int(self.rfile.readline().split(b';')[0].strip() or b'0', 16)
+                    if size == 0:
+                        # Skip trailers up to the terminating blank line
+                        while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                            pass
+                        return b''.join(chunks)
+                    chunks.append(self.rfile.read(size))
+                    self.rfile.readline()
+            length = int(self.headers.get('Content-Length') or 0)
+            return self.rfile.read(length) if length else b''
+
+        def _handle(self):
+            parsed = urlparse(self.path)
+            params = parse_qsl(parsed.query, keep_blank_values=True)
+            body = self._read_body()
+            status, headers, payload = dispatch(self.command, parsed.path, params, self.headers, body)
+
+            if isinstance(payload, (bytes, bytearray)):
+                data = bytes(payload)
+                headers.setdefault('Content-Type', 'application/octet-stream')
+            elif payload is None:
+                data = b''
+            else:
+                data = json.dumps(payload).encode()
+                headers.setdefault('Content-Type', 'application/json; charset=utf-8')
+
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            if self.command != 'HEAD' and data:
+                self.wfile.write(data)
+
+        do_GET = do_HEAD = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+# --- Seed data --------------------------------------------------------------------------
+
+SEED_SIZES = {
+    'sellers': 50,
+    'categories': 12,
+    'events': 10,
+    'users': 200,
+    'products': 300,
+    'product_variants': 600,
+    'orders': 1000,
+    'seller_balance_transactions': 300,
+    'seller_deletion_requests': 10,
+}
+
+ORDER_STATUSES = ['menunggu', 'diproses', 'dikirim', 'diterima', 'dibatalkan']
+
+def seed_dataset(backend, seed=0, scale=1.0):
+    """Fill the fake tables with a deterministic dataset; returns the expected analytics,
+    counted from the generated rows rather than by the fake's own analytics code"""
+    rng = random.Random(seed)
+    sizes = {table: max(int(count * scale), 1) for table, count in SEED_SIZES.items()}
+    epoch = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def timestamp(index, total):
+        return format_timestamp(epoch + timedelta(seconds=index * 86400 * 300 / max(total, 1)))
+
+    def seeded_uuid():
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    sellers = []
+    for i in range(sizes['sellers']):
+        sellers.append({
+            'id': seeded_uuid(),
+            'name': f"Seller {i}",
+            'email': f"seller{i}@example.com",
+            'phone': f"+62812{i:07d}",
+            'store_name': f"Store {i}",
+            'business_name': f"Business {i}",
+            'store_address': f"Jalan {i}",
+            'provinsi': 'Jakarta',
+            'status': rng.choice(['active', 'active', 'inactive']),
+            'store_image_url': None,
+            'created_at': timestamp(i, sizes['sellers']),
+            'updated_at': timestamp(i, sizes['sellers'])
+        })
+    backend.insert_rows('sellers', sellers)
+
+    backend.insert_rows('categories', [{
+        'id': seeded_uuid(),
+        'name': f"Category {i}",
+        'description': f"Seeded category {i}",
+        'image_url': None,
+        'created_at': timestamp(i, sizes['categories']),
+        'updated_at': timestamp(i, sizes['categories'])
+    } for i in range(sizes['categories'])])
+
+    backend.insert_rows('events', [{
+        'id': seeded_uuid(),
+        'title': f"Event {i}",
+        'description': f"Seeded event {i}",
+        'start_time': timestamp(i, sizes['events']),
+        'end_time': timestamp(i + 1, sizes['events']),
+        'banner_url': None,
+        'created_at': timestamp(i, sizes['events']),
+        'updated_at': timestamp(i, sizes['events'])
+    } for i in range(sizes['events'])])
+
+    backend.insert_rows('users', [{
+        'id': seeded_uuid(),
+        'name': f"User {i}",
+        'email': f"user{i}@example.com",
+        'created_at': timestamp(i, sizes['users'])
+    } for i in range(sizes['users'])])
+
+    products = [{
+        'id': seeded_uuid(),
+        'seller_id': rng.choice(sellers)['id'],
+        'name': f"Product {i}",
+        'created_at': timestamp(i, sizes['products'])
+    } for i in range(sizes['products'])]
+    backend.insert_rows('products', products)
+
+    backend.insert_rows('product_variants', [{
+        'id': seeded_uuid(),
+        'product_id': rng.choice(products)['id'],
+        'name': f"Variant {i}",
+        'price': rng.randint(1, 500) * 1000,
+        'created_at': timestamp(i, sizes['product_variants'])
+    } for i in range(sizes['product_variants'])])
+
+    orders = [{
+        'id': seeded_uuid(),
+        'seller_id': rng.choice(sellers)['id'],
+        'status': rng.choice(ORDER_STATUSES),
+        'total_price': round(rng.randint(10, 2000) * 1000 + rng.choice([0, 0.5]), 2),
+        'created_at': timestamp(i, sizes['orders']),
+        'updated_at': timestamp(i, sizes['orders'])
+    } for i in range(sizes['orders'])]
+    backend.insert_rows('orders', orders)
+
+    backend.insert_rows('seller_balances', [{
+        'id': seeded_uuid(),
+        'seller_id': seller['id'],
+        'balance': rng.randint(0, 10000) * 1000,
+        'created_at': seller['created_at'],
+        'updated_at': timestamp(i, len(sellers))
+    } for i, seller in enumerate(sellers)])
+
+    backend.insert_rows('seller_balance_transactions', [{
+        'id': seeded_uuid(),
+        'seller_id': rng.choice(sellers)['id'],
+        'amount': rng.randint(-500, 2000) * 1000,
+        'type': rng.choice(['credit', 'debit', 'withdrawal']),
+        'description': f"Transaction {i}",
+        'created_at': timestamp(i, sizes['seller_balance_transactions'])
+    } for i in range(sizes['seller_balance_transactions'])])
+
+    backend.insert_rows('seller_deletion_requests', [{
+        'id': seeded_uuid(),
+        'seller_id': sellers[i % len(sellers)]['id'],
+        'reason': f"Seeded deletion request {i}",
+        'status': 'pending',
+        'admin_notes': None,
+        'created_at': timestamp(i, sizes['seller_deletion_requests']),
+        'updated_at': timestamp(i, sizes['seller_deletion_requests'])
+    } for i in range(sizes['seller_deletion_requests'])])
+
+    return {
+        'sellers': len(sellers),
+        'categories': sizes['categories'],
+        'events': sizes['events'],
+        'users': sizes['users'],
+        'products': len(products),
+        'variants': sizes['product_variants'],
+        'orders': len(orders),
+        'revenue': round(sum(order['total_price'] for order in orders if order['status'] == 'diterima'), 2)
+    }
+
+SELLER_NAME_WORDS = ['Sari', 'Jaya', 'Makmur', 'Abadi', 'Sentosa', 'Berkah', 'Mulia', 'Indah', 'Lestari',
+                     'Sejahtera', 'Rezeki', 'Bintang', 'Harapan', 'Cahaya', 'Amanah', 'Nusantara']
+
+def seed_sellers(backend, count, seed=0, batch_size=50000):
+    """Add `count` sellers with varied names, stores and statuses, for search-scale checks"""
+    # A seed of its own so the ids cannot repeat those of seed_dataset()
+    rng = random.Random(f"sellers-{seed}")
+    epoch = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    offset = len(backend.tables['sellers'])
+    for start in range(0, count, batch_size):
+        rows = []
+        for i in range(start, min(start + batch_size, count)):
+            number = offset + i
+            first, last = rng.choice(SELLER_NAME_WORDS), rng.choice(SELLER_NAME_WORDS)
+            created_at = format_timestamp(epoch + timedelta(seconds=i * 600))
+            rows.append({
+                'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                'name': f"{first} {last} {number}",
+                'email': f"seller{number}@{rng.choice(['example.com', 'mail.test', 'toko.id'])}",
+                'store_name': f"Toko {rng.choice(SELLER_NAME_WORDS)} {number}" if rng.random() > 0.05 else None,
+                'provinsi': rng.choice(['Jakarta', 'Jawa Barat', 'Jawa Timur', 'Bali']),
+                'status': rng.choice(['active', 'active', 'inactive', 'suspended']),
+                'is_delivery_available': rng.random() > 0.5,
+                'created_at': created_at,
+                'updated_at': created_at
+            })
+        backend.insert_rows('sellers', rows)
+    return len(backend.tables['sellers'])
+
+def seed_transactions(backend, count, seed=0, batch_size=100000):
+    """Add `count` balance transactions for the existing sellers, for export-scale checks"""
+    rng = random.Random(f"transactions-{seed}")
+    seller_ids = [seller['id'] for seller in backend.tables['sellers']]
+    epoch = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    for start in range(0, count, batch_size):
+        backend.insert_rows('seller_balance_transactions', [{
+            'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            'seller_id': rng.choice(seller_ids),
+            'amount': rng.randint(-500, 2000) * 1000,
+            'type': rng.choice(['credit', 'debit', 'withdrawal']),
+            'description': f"Bulk transaction {i}",
+            'created_at': format_timestamp(epoch + timedelta(seconds=i * 30))
+        } for i in range(start, min(start + batch_size, count))])
+    return len(backend.tables['seller_balance_transactions'])
+
+def seed_orders(backend, count, seed=0, days=730, batch_size=100000):
+    """Add `count` orders spread at random over `days` days, for rollup-scale checks"""
+    rng = random.Random(f"orders-{seed}")
+    seller_ids = [seller['id'] for seller in backend.tables['sellers']] or [None]
+    epoch = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    span = days * 86400 * 1000000
+    for start in range(0, count, batch_size):
+        rows = []
+        for _ in range(start, min(start + batch_size, count)):
+            created_at = format_timestamp(epoch + timedelta(microseconds=rng.randrange(span)))
+            rows.append({
+                'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                'seller_id': rng.choice(seller_ids),
+                'status': rng.choice(ORDER_STATUSES),
+                'total_price': round(rng.randint(10, 2000) * 1000 + rng.choice([0, 0.5]), 2),
+                'created_at': created_at,
+                'updated_at': created_at
+            })
+        backend.insert_rows('orders', rows)
+    return len(backend.tables['orders'])
+
+# --- Local stack ------------------------------------------------------------------------
+
+DEFAULT_SERVER_COMMAND = "npx next dev --hostname 127.0.0.1 --port {port}"
+BOOTSTRAP_COMMAND = "node manual-setup.js"
+
+class LocalStack:
+    """Fake Supabase + fake Railway + a Next.js server wired to them"""
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, seed=0, scale=1.0,
+                 server_command=DEFAULT_SERVER_COMMAND, project_dir=None, startup_timeout=180,
+                 bootstrap_command=BOOTSTRAP_COMMAND, max_rows=DEFAULT_MAX_ROWS):
+        self.supabase = FakeSupabase(latency_ms, jitter_ms, seed, max_rows)
+        self.railway = FakeRailway(latency_ms, jitter_ms, seed)
+        self.seed = seed
+        self.scale = scale
+        self.server_command = server_command
+        self.bootstrap_command = bootstrap_command
+        self.project_dir = project_dir or os.path.dirname(os.path.abspath(__file__))
+        self.startup_timeout = startup_timeout
+        self.process = None
+        self.port = None
+        self.base_url = None
+        self.expected_analytics = None
+        self.env_overrides = {}
+
+    def server_env(self):
+        """Environment for the Next.js server; process variables take precedence over .env"""
+        env = dict(os.environ)
+        env.update({
+            'SUPABASE_URL': self.supabase.url,
+            'NEXT_PUBLIC_SUPABASE_URL': self.supabase.url,
+            'SUPABASE_SERVICE_ROLE_KEY': 'local-service-role-key',
+            'NEXT_PUBLIC_SUPABASE_ANON_KEY': 'local-anon-key',
+            'JWT_SECRET': 'local-jwt-secret',
+            'RAILWAY_API_URL': self.railway.url,
+            'RAILWAY_API_TOKEN': 'local-railway-token',
+            'RAILWAY_PROJECT_ID': 'project-local',
+            'RAILWAY_ENVIRONMENT_ID': 'environment-local',
+            'RAILWAY_SERVICE_ID': 'service-local',
+            # Short Railway cache windows so the coalescing test can start from a cold cache
+            'RAILWAY_CACHE_TTL_MS': '2000',
+            'RAILWAY_CACHE_STALE_MS': '3000',
+            'NEXT_TELEMETRY_DISABLED': '1',
+        })
+        env.update(self.env_overrides)
+        return env
+
+    def start_fakes(self):
+        self.supabase.start()
+        self.railway.start()
+        self.expected_analytics = seed_dataset(self.supabase, seed=self.seed, scale=self.scale)
+
+    def bootstrap(self):
+        """Run the one-time bootstrap that creates the default admin, as a deployment would"""
+        subprocess.run(shlex.split(self.bootstrap_command), cwd=self.project_dir, env=self.server_env(),
+                       stdout=subprocess.DEVNULL, check=True, timeout=self.startup_timeout)
+        if not any(admin.get('username') == 'admin' for admin in self.supabase.tables['superadmin']):
+            raise RuntimeError("Default admin was not created")
+
+    def spawn_server(self):
+        """Spawn the Next.js server without waiting for it"""
+        self.port = free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        command = shlex.split(self.server_command.format(port=self.port))
+        self.process = subprocess.Popen(command, cwd=self.project_dir, env=self.server_env(),
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                        start_new_session=True)
+
+    def start_server(self):
+        """Spawn the Next.js server and wait until it answers"""
+        started = time.perf_counter()
+        self.spawn_server()
+        self.wait_until_ready()
+        return time.perf_counter() - started
+
+    def poll_until_ok(self, method, path, payload=None, interval=0.2):
+        """Repeat `method /api<path>` until it answers 200"""
+        deadline = time.perf_counter() + self.startup_timeout
+        while time.perf_counter() < deadline:
+            if self.process and self.process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {self.process.returncode}")
+            try:
+                response = requests.request(method, f"{self.base_url}/api{path}", json=payload, timeout=30)
+                if response.status_code == 200:
+                    return
+            except requests.RequestException:
+                pass
+            time.sleep(interval)
+        raise RuntimeError(f"{method} {path} did not answer 200 within {self.startup_timeout}s")
+
+    def wait_until_ready(self):
+        """Poll /api/setup, which needs nothing from the backends"""
+        self.poll_until_ok('GET', '/setup')
+
+    def measure_cold_start(self, method, path, payload=None):
+        """Restart the server and time from spawn to the first 200 of `method /api<path>`.
+
+        Returns (seconds, Supabase requests made by then).
+        """
+        self.stop_server()
+        self.supabase.reset_counts()
+        started = time.perf_counter()
+        self.spawn_server()
+        self.poll_until_ok(method, path, payload, interval=0.02)
+        return time.perf_counter() - started, self.supabase.total_requests()
+
+    def server_rss(self):
+        """Resident memory in bytes of the server's whole process group (Linux /proc)"""
+        if not self.process:
+            return 0
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        total = 0
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    # Fields after the parenthesised command name; the 3rd is the process group
+                    fields = f.read().rsplit(')', 1)[1].split()
+                if int(fields[2]) != self.process.pid:
+                    continue
+                with open(f'/proc/{entry}/statm') as f:
+                    total += int(f.read().split()[1]) * page_size
+            except (OSError, IndexError, ValueError):
+                continue
+        return total
+
+    def stop_server(self):
+        if self.process and self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, signal.SIGTERM)
+                self.process.wait(timeout=10)
+            except (ProcessLookupError, subprocess.TimeoutExpired):
+                os.killpg(self.process.pid, signal.SIGKILL)
+        self.process = None
+
+    def restart_server(self, env_overrides=None):
+        """Restart the Next.js server with extra environment variables, e.g. to compare settings"""
+        self.stop_server()
+        self.env_overrides = dict(env_overrides or {})
+        return self.start_server()
+
+    def start(self):
+        self.start_fakes()
+        self.bootstrap()
+        return self.start_server()
+
+    def stop(self):
+        self.stop_server()
+        self.supabase.stop()
+        self.railway.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+def main():
+    """Run the fakes on their own, e.g. for `npm run dev` against them"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Local Supabase/Railway stand-ins")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--max-rows", type=int, default=DEFAULT_MAX_ROWS,
+                        help="most rows one PostgREST read returns, 0 for no cap (default: %(default)s)")
+    args = parser.parse_args()
+
+    stack = LocalStack(args.latency_ms, args.jitter_ms, args.seed, args.scale, max_rows=args.max_rows or None)
+    stack.start_fakes()
+    stack.bootstrap()
+    for key in ['SUPABASE_URL', 'SUPABASE_SERVICE_ROLE_KEY', 'JWT_SECRET', 'RAILWAY_API_URL']:
+        print(f"{key}={stack.server_env()[key]}")
+    print("Press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stack.stop()
+
+if __name__ == "__main__":
+    main()
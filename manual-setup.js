@@ -1,4 +1,6 @@
-// Manual setup script - run this after creating the superadmin table in Supabase dashboard
+// One-time bootstrap: creates the default admin when the superadmin table has no admins yet.
+// Run it once per database after creating the table (`yarn bootstrap`); the API itself no
+// longer touches superadmin or hashes anything when it starts. Running it again is harmless.
 require('dotenv').config()
 const { createClient } = require('@supabase/supabase-js')
 const bcrypt = require('bcryptjs')
@@ -6,6 +8,8 @@ const { v4: uuidv4 } = require('uuid')
 
 const supabaseUrl = process.env.SUPABASE_URL
 const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+// Same cost as lib/auth.js, so the first login does not rehash the password
+const bcryptCost = Number(process.env.BCRYPT_COST) || 12
 
 const supabase = createClient(supabaseUrl, supabaseServiceKey, {
   auth: {
@@ -17,23 +21,28 @@ const supabase = createClient(supabaseUrl, supabaseServiceKey, {
 async function createDefaultAdmin() {
   try {
     console.log('Creating default admin user...')
-    
-    // Check if admin already exists
-    const { data: existing } = await supabase
+
+    // Any existing admin means the database has been bootstrapped already
+    const { data: admins, error: selectError } = await supabase
       .from('superadmin')
-      .select('username')
-      .eq('username', 'admin')
-      .single()
-    
-    if (existing) {
+      .select('id')
+      .limit(1)
+
+    if (selectError) {
+      console.log('Superadmin table might not exist:', selectError.message)
+      console.log('Create it first by running setup-superadmin.sql in the Supabase SQL Editor')
+      return false
+    }
+
+    if (admins.length > 0) {
       console.log('Admin user already exists')
       return true
     }
-    
+
     // Create default admin user
-    const hashedPassword = await bcrypt.hash('admin123', 12)
-    
-    const { data, error } = await supabase
+    const hashedPassword = await bcrypt.hash('admin123', bcryptCost)
+
+    const { error } = await supabase
       .from('superadmin')
       .insert({
         id: uuidv4(),
@@ -42,18 +51,18 @@ async function createDefaultAdmin() {
         password: hashedPassword,
         role: 'superadmin'
       })
-    
+
     if (error) {
       console.log('Error creating admin user:', error.message)
       return false
     }
-    
+
     console.log('Default admin user created successfully!')
     console.log('Username: admin')
     console.log('Password: admin123')
-    
+
     return true
-    
+
   } catch (error) {
     console.error('Setup failed:', error.message)
     return false
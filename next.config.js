@@ -4,8 +4,9 @@ const nextConfig = {
     unoptimized: true,
   },
   experimental: {
-    // Remove if not using Server Components
-    serverComponentsExternalPackages: ['mongodb'],
+    // Remove if not using Server Components. sharp is a native module, loaded from
+    // node_modules at runtime rather than bundled.
+    serverComponentsExternalPackages: ['mongodb', 'sharp'],
   },
   webpack(config, { dev }) {
     if (dev) {
@@ -0,0 +1,108 @@
+-- Hourly and daily revenue series for /api/analytics/series
+-- Run this SQL in your Supabase SQL Editor, then check-analytics-rollups.sql. A trigger on
+-- orders keeps the rollups current as orders are written, so reading a series never scans
+-- orders.
+
+-- One row per bucket: the completed ('diterima') orders placed in it and their total. Hourly
+-- buckets are UTC hours; daily buckets start at midnight Asia/Jakarta.
+CREATE TABLE IF NOT EXISTS order_rollups_hourly (
+  bucket TIMESTAMP WITH TIME ZONE PRIMARY KEY,
+  orders INTEGER NOT NULL DEFAULT 0,
+  revenue NUMERIC NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS order_rollups_daily (
+  bucket TIMESTAMP WITH TIME ZONE PRIMARY KEY,
+  orders INTEGER NOT NULL DEFAULT 0,
+  revenue NUMERIC NOT NULL DEFAULT 0
+);
+
+-- Only the API's service role reads them (it bypasses RLS); the anon key sees nothing. Order
+-- writes by other roles, such as the storefront's, still update them through the trigger,
+-- whose functions run as their owner.
+ALTER TABLE order_rollups_hourly ENABLE ROW LEVEL SECURITY;
+ALTER TABLE order_rollups_daily ENABLE ROW LEVEL SECURITY;
+
+-- Add `p_orders` orders worth `p_revenue` to the buckets containing `p_created_at`
+CREATE OR REPLACE FUNCTION order_rollups_add(p_created_at TIMESTAMPTZ, p_orders INTEGER, p_revenue NUMERIC)
+RETURNS void
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  INSERT INTO order_rollups_hourly AS r (bucket, orders, revenue)
+  VALUES (date_trunc('hour', p_created_at), p_orders, p_revenue)
+  ON CONFLICT (bucket) DO UPDATE
+    SET orders = r.orders + EXCLUDED.orders, revenue = r.revenue + EXCLUDED.revenue;
+
+  INSERT INTO order_rollups_daily AS r (bucket, orders, revenue)
+  VALUES (date_trunc('day', p_created_at AT TIME ZONE 'Asia/Jakarta') AT TIME ZONE 'Asia/Jakarta', p_orders, p_revenue)
+  ON CONFLICT (bucket) DO UPDATE
+    SET orders = r.orders + EXCLUDED.orders, revenue = r.revenue + EXCLUDED.revenue;
+$$;
+
+-- Take the old row out of its buckets if it was completed, then put the new row in if it is.
+-- An update that moves a completed order's price or time does both.
+CREATE OR REPLACE FUNCTION order_rollups_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status = 'diterima' THEN
+    PERFORM order_rollups_add(OLD.created_at, -1, -coalesce(OLD.total_price::numeric, 0));
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status = 'diterima' THEN
+    PERFORM order_rollups_add(NEW.created_at, 1, coalesce(NEW.total_price::numeric, 0));
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+-- Owned by the rollup tables' owner, which RLS does not apply to; nobody calls them directly
+ALTER FUNCTION order_rollups_add(TIMESTAMPTZ, INTEGER, NUMERIC) OWNER TO postgres;
+ALTER FUNCTION order_rollups_trigger() OWNER TO postgres;
+ALTER TABLE order_rollups_hourly OWNER TO postgres;
+ALTER TABLE order_rollups_daily OWNER TO postgres;
+REVOKE EXECUTE ON FUNCTION order_rollups_add(TIMESTAMPTZ, INTEGER, NUMERIC) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION order_rollups_trigger() FROM PUBLIC;
+
+-- Install the trigger and backfill in one transaction. The lock holds off order writes until
+-- both are done, so no order is missed by the backfill or counted twice.
+BEGIN;
+
+LOCK TABLE orders IN SHARE ROW EXCLUSIVE MODE;
+
+DROP TRIGGER IF EXISTS order_rollups_insert_delete ON orders;
+DROP TRIGGER IF EXISTS order_rollups_update ON orders;
+
+CREATE TRIGGER order_rollups_insert_delete
+AFTER INSERT OR DELETE ON orders
+FOR EACH ROW EXECUTE FUNCTION order_rollups_trigger();
+
+-- Most order updates (address, tracking number, ...) leave the rollups alone and skip the trigger
+CREATE TRIGGER order_rollups_update
+AFTER UPDATE OF status, total_price, created_at ON orders
+FOR EACH ROW
+WHEN (OLD.status IS DISTINCT FROM NEW.status
+      OR (NEW.status = 'diterima' AND (OLD.total_price IS DISTINCT FROM NEW.total_price
+                                       OR OLD.created_at IS DISTINCT FROM NEW.created_at)))
+EXECUTE FUNCTION order_rollups_trigger();
+
+TRUNCATE order_rollups_hourly, order_rollups_daily;
+
+INSERT INTO order_rollups_hourly (bucket, orders, revenue)
+SELECT date_trunc('hour', created_at), count(*), coalesce(sum(total_price::numeric), 0)
+FROM orders
+WHERE status = 'diterima'
+GROUP BY 1;
+
+INSERT INTO order_rollups_daily (bucket, orders, revenue)
+SELECT date_trunc('day', created_at AT TIME ZONE 'Asia/Jakarta') AT TIME ZONE 'Asia/Jakarta',
+       count(*), coalesce(sum(total_price::numeric), 0)
+FROM orders
+WHERE status = 'diterima'
+GROUP BY 1;
+
+COMMIT;
@@ -0,0 +1,27 @@
+-- Dashboard analytics computed in one round trip
+-- Run this SQL in your Supabase SQL Editor. /api/analytics falls back to
+-- individual count queries until the function exists.
+
+CREATE OR REPLACE FUNCTION admin_analytics_summary()
+RETURNS json
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT json_build_object(
+    'sellers', (SELECT count(*) FROM sellers),
+    'categories', (SELECT count(*) FROM categories),
+    'events', (SELECT count(*) FROM events),
+    'users', (SELECT count(*) FROM users),
+    'products', (SELECT count(*) FROM products),
+    'variants', (SELECT count(*) FROM product_variants),
+    'orders', (SELECT count(*) FROM orders),
+    'revenue', (SELECT coalesce(sum(total_price::numeric), 0) FROM orders WHERE status = 'diterima')
+  );
+$$;
+
+-- Only the API's service role may call it
+REVOKE EXECUTE ON FUNCTION admin_analytics_summary() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION admin_analytics_summary() TO service_role;
+
+-- Lets the revenue sum read completed orders from the index alone
+CREATE INDEX IF NOT EXISTS orders_status_total_price_idx ON orders (status) INCLUDE (total_price);
@@ -0,0 +1,101 @@
+-- Bulk updates and deletes behind PUT and DELETE /api/{sellers,categories,events}/bulk
+-- Run this SQL in your Supabase SQL Editor. Each call is one statement, so a failing item
+-- leaves every other item of the request unwritten too. Until the functions exist both
+-- endpoints answer 501.
+
+-- Apply `p_items` ([{ "id": ..., "<column>": <value>, ... }]) to `p_table`: each item sets the
+-- columns it names, and updated_at to `p_updated_at`. Returns the ids that matched a row.
+CREATE OR REPLACE FUNCTION admin_bulk_update(p_table TEXT, p_items JSONB, p_updated_at TIMESTAMPTZ)
+RETURNS TEXT[]
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+  v_id_type TEXT;
+  v_columns TEXT[];
+  v_unknown TEXT;
+  v_ids TEXT[];
+BEGIN
+  IF p_table NOT IN ('sellers', 'categories', 'events') THEN
+    RAISE EXCEPTION 'Bulk writes are not allowed on %', p_table USING ERRCODE = '42501';
+  END IF;
+
+  SELECT format_type(atttypid, atttypmod) INTO v_id_type
+  FROM pg_attribute
+  WHERE attrelid = p_table::regclass AND attname = 'id';
+
+  -- Only the columns some item names are set; the rest keep their values and triggers on them
+  -- do not fire
+  SELECT array_agg(DISTINCT key) INTO v_columns
+  FROM jsonb_array_elements(p_items) AS item(value), jsonb_object_keys(item.value || '{"updated_at": null}') AS key
+  WHERE key <> 'id';
+
+  -- jsonb_populate_record would ignore a misspelt column; PostgREST rejects one, so do the same
+  SELECT column_name INTO v_unknown
+  FROM unnest(v_columns) AS column_name
+  WHERE NOT EXISTS (
+    SELECT 1 FROM pg_attribute
+    WHERE attrelid = p_table::regclass AND attname = column_name AND attnum > 0 AND NOT attisdropped
+  )
+  LIMIT 1;
+  IF v_unknown IS NOT NULL THEN
+    RAISE EXCEPTION 'column "%" of relation "%" does not exist', v_unknown, p_table USING ERRCODE = '42703';
+  END IF;
+
+  -- Columns an item leaves out come from the row itself, so they are written back unchanged
+  EXECUTE format(
+    'WITH updated AS (
+       UPDATE %1$I AS t
+       SET (%2$s) = (SELECT %3$s FROM jsonb_populate_record(t, item.value || jsonb_build_object(''updated_at'', $2)) AS r)
+       FROM jsonb_array_elements($1) AS item(value)
+       WHERE t.id = (item.value->>''id'')::%4$s
+       RETURNING t.id::text AS id
+     )
+     SELECT coalesce(array_agg(id), ''{}'') FROM updated',
+    p_table,
+    (SELECT string_agg(format('%I', column_name), ', ') FROM unnest(v_columns) AS column_name),
+    (SELECT string_agg(format('r.%I', column_name), ', ') FROM unnest(v_columns) AS column_name),
+    v_id_type)
+  INTO v_ids
+  USING p_items, p_updated_at;
+
+  RETURN v_ids;
+END;
+$$;
+
+-- Delete the rows of `p_table` with the given ids. Returns the ids that matched a row.
+CREATE OR REPLACE FUNCTION admin_bulk_delete(p_table TEXT, p_ids TEXT[])
+RETURNS TEXT[]
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+  v_id_type TEXT;
+  v_ids TEXT[];
+BEGIN
+  IF p_table NOT IN ('sellers', 'categories', 'events') THEN
+    RAISE EXCEPTION 'Bulk writes are not allowed on %', p_table USING ERRCODE = '42501';
+  END IF;
+
+  SELECT format_type(atttypid, atttypmod) INTO v_id_type
+  FROM pg_attribute
+  WHERE attrelid = p_table::regclass AND attname = 'id';
+
+  EXECUTE format(
+    'WITH deleted AS (
+       DELETE FROM %1$I WHERE id = ANY ($1::%2$s[]) RETURNING id::text AS id
+     )
+     SELECT coalesce(array_agg(id), ''{}'') FROM deleted',
+    p_table, v_id_type)
+  INTO v_ids
+  USING p_ids;
+
+  RETURN v_ids;
+END;
+$$;
+
+-- Only the API's service role may call them
+REVOKE EXECUTE ON FUNCTION admin_bulk_update(TEXT, JSONB, TIMESTAMPTZ) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION admin_bulk_delete(TEXT, TEXT[]) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION admin_bulk_update(TEXT, JSONB, TIMESTAMPTZ) TO service_role;
+GRANT EXECUTE ON FUNCTION admin_bulk_delete(TEXT, TEXT[]) TO service_role;
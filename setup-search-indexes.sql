@@ -0,0 +1,36 @@
+-- Indexes behind the search, filter and sort params of /api/sellers and /api/events
+-- Run this SQL in your Supabase SQL Editor. The endpoints work without them, but every
+-- search then scans the whole table.
+
+-- Trigram indexes let `column ILIKE '%text%'` use an index; each searched column needs one
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS sellers_name_trgm_idx ON sellers USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS sellers_store_name_trgm_idx ON sellers USING gin (store_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS sellers_email_trgm_idx ON sellers USING gin (email gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS events_title_trgm_idx ON events USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS events_description_trgm_idx ON events USING gin (description gin_trgm_ops);
+
+-- Keyset pages: ORDER BY <sort column>, id with the cursor as a row comparison. A btree can
+-- be read in either direction, so one index serves both created_at orders.
+CREATE INDEX IF NOT EXISTS sellers_created_at_id_idx ON sellers (created_at, id);
+CREATE INDEX IF NOT EXISTS sellers_updated_at_id_idx ON sellers (updated_at, id);
+CREATE INDEX IF NOT EXISTS events_created_at_id_idx ON events (created_at, id);
+CREATE INDEX IF NOT EXISTS events_start_time_id_idx ON events (start_time, id);
+CREATE INDEX IF NOT EXISTS events_end_time_id_idx ON events (end_time, id);
+
+-- Text sorts keep rows without a value last in both directions, so each direction needs its
+-- own index (a backwards scan of the ascending one would put NULLs first)
+CREATE INDEX IF NOT EXISTS sellers_name_id_idx ON sellers (name ASC NULLS LAST, id ASC);
+CREATE INDEX IF NOT EXISTS sellers_name_id_desc_idx ON sellers (name DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS sellers_store_name_id_idx ON sellers (store_name ASC NULLS LAST, id ASC);
+CREATE INDEX IF NOT EXISTS sellers_store_name_id_desc_idx ON sellers (store_name DESC NULLS LAST, id DESC);
+CREATE INDEX IF NOT EXISTS events_title_id_idx ON events (title ASC NULLS LAST, id ASC);
+CREATE INDEX IF NOT EXISTS events_title_id_desc_idx ON events (title DESC NULLS LAST, id DESC);
+
+-- Status filter combined with the default newest-first order
+CREATE INDEX IF NOT EXISTS sellers_status_created_at_idx ON sellers (status, created_at, id);
+
+ANALYZE sellers;
+ANALYZE events;